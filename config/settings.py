@@ -4,40 +4,118 @@ Loads environment variables and provides centralized configuration.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
-# Load environment variables from .env file
+# Environment file location
 env_path = Path(__file__).parent / '.env'
-load_dotenv(dotenv_path=env_path)
 
-
-class Settings:
+# Set once the .env file has been parsed so re-imports never re-read it
+_LOADED = False
+
+# Set once Settings.validate_settings() has succeeded
+_validated = False
+
+
+@lru_cache(maxsize=1)
+def _env() -> Dict[str, str]:
+    """
+    Load the .env file once and return a snapshot of the environment.
+
+    Returns:
+        Dict[str, str]: Copy of os.environ taken after loading .env
+    """
+    global _LOADED
+    if not _LOADED:
+        # Only pay for python-dotenv when there is a file to parse; in
+        # production the variables come straight from Docker/systemd
+        if env_path.exists():
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path=env_path)
+        _LOADED = True
+    return os.environ.copy()
+
+
+@lru_cache(maxsize=None)
+def _cfg(key: str, default: Any = None, caster: Callable[[Any], Any] = str) -> Any:
+    """
+    Fetch an environment variable and convert it to the expected type.
+
+    Args:
+        key: Environment variable name
+        default: Value used when the variable is not set
+        caster: Callable converting the raw value (str, int, float, ...)
+
+    Returns:
+        Converted value, or None if neither the variable nor a default is set
+
+    Raises:
+        ValueError: If the value cannot be converted
+    """
+    value = _env().get(key, default)
+    if value is None:
+        return None
+    try:
+        return caster(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{key} must be a valid {caster.__name__}, got {value!r}")
+
+
+def _load_from_env() -> Dict[str, Any]:
+    """
+    Read every environment-driven setting from the cached environment.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for TradingSettings
+    """
+    return {
+        'TRADING_MODE': _cfg('TRADING_MODE', 'TESTNET'),
+        'BINANCE_TESTNET_API_KEY': _cfg('BINANCE_TESTNET_API_KEY'),
+        'BINANCE_TESTNET_API_SECRET': _cfg('BINANCE_TESTNET_API_SECRET'),
+        'BINANCE_API_KEY': _cfg('BINANCE_API_KEY'),
+        'BINANCE_API_SECRET': _cfg('BINANCE_API_SECRET'),
+        'INITIAL_CAPITAL': _cfg('INITIAL_CAPITAL', '100', float),
+        'MAX_LEVERAGE': _cfg('MAX_LEVERAGE', '5', int),
+        'RISK_PER_TRADE': _cfg('RISK_PER_TRADE', '0.02', float),
+        'TRADING_PAIR': _cfg('TRADING_PAIR', 'BTCUSDT'),
+        'TELEGRAM_BOT_TOKEN': _cfg('TELEGRAM_BOT_TOKEN'),
+        'TELEGRAM_CHAT_ID': _cfg('TELEGRAM_CHAT_ID'),
+    }
+
+
+@dataclass(frozen=True, slots=True)
+class TradingSettings:
     """Centralized configuration management for the trading bot"""
 
     # Base directories
     BASE_DIR: Path = Path(__file__).parent.parent
-    LOGS_DIR: Path = BASE_DIR / 'logs'
+    LOGS_DIR: Path = Path(__file__).parent.parent / 'logs'
+    LOGS_DIR_STR: str = str(Path(__file__).parent.parent / 'logs')  # for open()/handlers
+
+    # Parsed futures_exchange_info, reused across restarts (one file per mode)
+    CACHE_DIR: str = os.path.join(os.path.expanduser('~'), '.cache', 'trading_bot')
+    EXCHANGE_INFO_TTL: int = 3600  # seconds before the cached copy is refetched
 
     # Trading mode
-    TRADING_MODE: str = os.getenv('TRADING_MODE', 'TESTNET')
+    TRADING_MODE: str = 'TESTNET'
 
     # Binance API credentials
-    BINANCE_TESTNET_API_KEY: Optional[str] = os.getenv('BINANCE_TESTNET_API_KEY')
-    BINANCE_TESTNET_API_SECRET: Optional[str] = os.getenv('BINANCE_TESTNET_API_SECRET')
-    BINANCE_API_KEY: Optional[str] = os.getenv('BINANCE_API_KEY')
-    BINANCE_API_SECRET: Optional[str] = os.getenv('BINANCE_API_SECRET')
+    BINANCE_TESTNET_API_KEY: Optional[str] = None
+    BINANCE_TESTNET_API_SECRET: Optional[str] = None
+    BINANCE_API_KEY: Optional[str] = None
+    BINANCE_API_SECRET: Optional[str] = None
 
     # Binance URLs
     BINANCE_TESTNET_URL: str = 'https://testnet.binancefuture.com'
     BINANCE_PRODUCTION_URL: str = 'https://fapi.binance.com'
 
     # Trading parameters
-    INITIAL_CAPITAL: float = float(os.getenv('INITIAL_CAPITAL', 100))
-    MAX_LEVERAGE: int = int(os.getenv('MAX_LEVERAGE', 5))  # Increased to 5x
-    RISK_PER_TRADE: float = float(os.getenv('RISK_PER_TRADE', 0.02))  # 2% risk per trade
-    TRADING_PAIR: str = os.getenv('TRADING_PAIR', 'BTCUSDT')
+    INITIAL_CAPITAL: float = 100.0
+    MAX_LEVERAGE: int = 5  # Increased to 5x
+    RISK_PER_TRADE: float = 0.02  # 2% risk per trade
+    TRADING_PAIR: str = 'BTCUSDT'
 
     # Risk management - AGGRESSIVE MODE
     MAX_DAILY_LOSS_PERCENT: float = 0.08  # 8% maximum daily loss
@@ -49,24 +127,39 @@ class Settings:
     EMA_SLOW_PERIOD: int = 13
     TIMEFRAME: str = '5m'  # 5-minute candles for frequent entries
     VOLUME_PERIOD: int = 10  # Shorter volume average period
+    # Store indicator columns as float32 (computed in float64 either way).
+    # Halves their memory; off by default because float32 keeps only ~7
+    # significant digits, which blurs EMA gaps at BTC-sized prices
+    INDICATOR_FLOAT32: bool = False
 
     # Bot behavior - AGGRESSIVE MODE
     UPDATE_INTERVAL: int = 30  # 30 seconds for faster reaction
+    MAX_UPDATE_INTERVAL: int = 240  # Upper bound when the market is quiet
     MAX_OPEN_POSITIONS: int = 3  # Allow 3 simultaneous positions
     MAX_POSITION_PERCENT: float = 0.05  # 5% of capital per position
+    BALANCE_CACHE_TTL: float = 1.0  # seconds a fetched balance is reused within a tick
+    POSITION_CACHE_TTL: float = 1.0  # seconds REST positions are reused without the stream
+
+    # WebSocket price/position cache (REST is used whenever it is unavailable)
+    WS_STREAMS_ENABLED: bool = True
+    WS_PRICE_MAX_AGE: float = 2.0  # mark prices stream every 1s; older ones fall back to REST
 
     # API rate limiting
     MAX_REQUESTS_PER_MINUTE: int = 1200
+    HTTP_TIMEOUT: float = 5.0  # seconds per REST call (connect and read)
     RETRY_ATTEMPTS: int = 3
     RETRY_DELAY: int = 1  # seconds
-    BACKOFF_MULTIPLIER: float = 2.0  # Exponential backoff
+    BACKOFF_MULTIPLIER: float = 3.0  # Decorrelated jitter: next wait <= previous * 3
+    RETRY_MAX_DELAY: float = 30.0  # Cap for a single retry wait (seconds)
+    # Binance errors that never succeed on retry (rejected order,
+    # margin type unchanged, malformed parameter precision)
+    UNRECOVERABLE_ERROR_CODES: tuple = (-2010, -4046, -1111)
 
     # Telegram notifications (optional)
-    TELEGRAM_BOT_TOKEN: Optional[str] = os.getenv('TELEGRAM_BOT_TOKEN')
-    TELEGRAM_CHAT_ID: Optional[str] = os.getenv('TELEGRAM_CHAT_ID')
+    TELEGRAM_BOT_TOKEN: Optional[str] = None
+    TELEGRAM_CHAT_ID: Optional[str] = None
 
-    @classmethod
-    def get_api_credentials(cls) -> tuple[str, str]:
+    def get_api_credentials(self) -> tuple[str, str]:
         """
         Get API credentials based on trading mode.
 
@@ -76,35 +169,33 @@ class Settings:
         Raises:
             ValueError: If credentials are not set for the current mode
         """
-        if cls.TRADING_MODE == 'TESTNET':
-            if not cls.BINANCE_TESTNET_API_KEY or not cls.BINANCE_TESTNET_API_SECRET:
+        if self.TRADING_MODE == 'TESTNET':
+            if not self.BINANCE_TESTNET_API_KEY or not self.BINANCE_TESTNET_API_SECRET:
                 raise ValueError(
                     "Testnet API credentials not found. "
                     "Please set BINANCE_TESTNET_API_KEY and BINANCE_TESTNET_API_SECRET in .env"
                 )
-            return cls.BINANCE_TESTNET_API_KEY, cls.BINANCE_TESTNET_API_SECRET
+            return self.BINANCE_TESTNET_API_KEY, self.BINANCE_TESTNET_API_SECRET
         else:
-            if not cls.BINANCE_API_KEY or not cls.BINANCE_API_SECRET:
+            if not self.BINANCE_API_KEY or not self.BINANCE_API_SECRET:
                 raise ValueError(
                     "Production API credentials not found. "
                     "Please set BINANCE_API_KEY and BINANCE_API_SECRET in .env"
                 )
-            return cls.BINANCE_API_KEY, cls.BINANCE_API_SECRET
+            return self.BINANCE_API_KEY, self.BINANCE_API_SECRET
 
-    @classmethod
-    def get_base_url(cls) -> str:
+    def get_base_url(self) -> str:
         """
         Get Binance API base URL based on trading mode.
 
         Returns:
             str: Base URL for API calls
         """
-        if cls.TRADING_MODE == 'TESTNET':
-            return cls.BINANCE_TESTNET_URL
-        return cls.BINANCE_PRODUCTION_URL
+        if self.TRADING_MODE == 'TESTNET':
+            return self.BINANCE_TESTNET_URL
+        return self.BINANCE_PRODUCTION_URL
 
-    @classmethod
-    def validate_settings(cls) -> bool:
+    def validate_settings(self) -> bool:
         """
         Validate that all required settings are properly configured.
 
@@ -114,27 +205,32 @@ class Settings:
         Raises:
             ValueError: If any required setting is invalid
         """
+        global _validated
+        if _validated:
+            return True
+
         # Validate capital
-        if cls.INITIAL_CAPITAL <= 0:
+        if self.INITIAL_CAPITAL <= 0:
             raise ValueError("INITIAL_CAPITAL must be greater than 0")
 
         # Validate leverage
-        if cls.MAX_LEVERAGE < 1 or cls.MAX_LEVERAGE > 125:
+        if self.MAX_LEVERAGE < 1 or self.MAX_LEVERAGE > 125:
             raise ValueError("MAX_LEVERAGE must be between 1 and 125")
 
         # Validate risk
-        if cls.RISK_PER_TRADE <= 0 or cls.RISK_PER_TRADE > 0.1:
+        if self.RISK_PER_TRADE <= 0 or self.RISK_PER_TRADE > 0.1:
             raise ValueError("RISK_PER_TRADE must be between 0 and 0.1 (10%)")
 
         # Validate trading pair
-        if not cls.TRADING_PAIR:
+        if not self.TRADING_PAIR:
             raise ValueError("TRADING_PAIR must be set")
 
         # Create logs directory if it doesn't exist
-        cls.LOGS_DIR.mkdir(exist_ok=True)
+        os.makedirs(self.LOGS_DIR_STR, exist_ok=True)
 
+        _validated = True
         return True
 
 
-# Validate settings on import
-Settings.validate_settings()
+# Single settings instance, built once from the environment
+Settings = TradingSettings(**_load_from_env())
@@ -1,37 +1,44 @@
 """
 Main entry point for the crypto trading bot.
-Initializes and runs the trading system with multiple strategy support.
+Initializes and runs the trading system with multiple strategy support
+and an optional web dashboard.
+
+Usage:
+    python main.py [strategy] [--strategy KEY] [--dashboard]
 """
 
-import sys
+import argparse
+import importlib
 import os
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+import signal
+import sys
+import threading
+from typing import Optional, TYPE_CHECKING
 
 from config.settings import Settings
-from src.core.trader import Trader
 from src.utils.logger import get_logger
 
-# Import all strategies
-from src.strategies.ema_crossover import EMACrossoverStrategy
-from src.strategies.adaptive_multi_strategy import AdaptiveStrategy
-from src.strategies.alpha_volume_farming_strategy import AlphaVolumeFarmingStrategy
-from src.strategies.funding_arbitrage_strategy import FundingArbitrageStrategy
+if TYPE_CHECKING:
+    from src.core.trader import Trader
+
+# Shared by validate_environment() and main()
+logger = get_logger(__name__, Settings.LOGS_DIR_STR)
 
-# Strategy registry
+# Strategy registry (module path, class name) - imported only when selected
 STRATEGIES = {
-    'ema': EMACrossoverStrategy,
-    'adaptive': AdaptiveStrategy,
-    'volume': AlphaVolumeFarmingStrategy,
-    'funding': FundingArbitrageStrategy,
+    'ema': ('src.strategies.ema_crossover', 'EMACrossoverStrategy'),
+    'adaptive': ('src.strategies.adaptive_multi_strategy', 'AdaptiveStrategy'),
+    'volume': ('src.strategies.alpha_volume_farming_strategy', 'AlphaVolumeFarmingStrategy'),
+    'funding': ('src.strategies.funding_arbitrage_strategy', 'FundingArbitrageStrategy'),
 }
 
 # Default strategy
 DEFAULT_STRATEGY = 'adaptive'
 
+# Global references for graceful shutdown (dashboard mode)
+trader_instance: Optional['Trader'] = None
+shutdown_event = threading.Event()
+
 
 def get_strategy_name(strategy_key: str) -> str:
     """Get human-readable strategy name"""
@@ -44,39 +51,54 @@ def get_strategy_name(strategy_key: str) -> str:
     return names.get(strategy_key, strategy_key)
 
 
-def print_banner(strategy_key: str):
+def load_strategy_class(strategy_key: str):
+    """Import and return the strategy class registered under strategy_key"""
+    module_path, class_name = STRATEGIES[strategy_key]
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
+def print_banner(strategy_key: str, dashboard: bool = False):
     """Print startup banner"""
     strategy_name = get_strategy_name(strategy_key)
 
-    print("\n" + "=" * 70)
-    print("  CRYPTO TRADING BOT - Binance Futures")
-    print("=" * 70)
-    print(f"  Mode:          {Settings.TRADING_MODE}")
-    print(f"  Trading Pair:  {Settings.TRADING_PAIR}")
-    print(f"  Timeframe:     {Settings.TIMEFRAME}")
-    print(f"  Strategy:      {strategy_name}")
-    print(f"  Max Leverage:  {Settings.MAX_LEVERAGE}x")
-    print(f"  Risk/Trade:    {Settings.RISK_PER_TRADE * 100}%")
-    print(f"  Stop Loss:     {Settings.STOP_LOSS_PERCENT * 100}%")
-    print(f"  Take Profit:   {Settings.TAKE_PROFIT_PERCENT * 100}%")
-    print("=" * 70)
+    lines = [
+        "",
+        "=" * 70,
+        "  CRYPTO TRADING BOT - Binance Futures",
+        "=" * 70,
+        f"  Mode:          {Settings.TRADING_MODE}",
+        f"  Trading Pair:  {Settings.TRADING_PAIR}",
+        f"  Timeframe:     {Settings.TIMEFRAME}",
+        f"  Strategy:      {strategy_name}",
+        f"  Max Leverage:  {Settings.MAX_LEVERAGE}x",
+        f"  Risk/Trade:    {Settings.RISK_PER_TRADE * 100}%",
+        f"  Stop Loss:     {Settings.STOP_LOSS_PERCENT * 100}%",
+        f"  Take Profit:   {Settings.TAKE_PROFIT_PERCENT * 100}%",
+    ]
+    if dashboard:
+        lines.append(f"  Dashboard:     http://0.0.0.0:{os.getenv('DASHBOARD_PORT', 8000)}")
+    lines.append("=" * 70)
 
     if Settings.TRADING_MODE == 'TESTNET':
-        print("\n  *** TESTNET MODE - Using test funds ***\n")
+        lines += ["", "  *** TESTNET MODE - Using test funds ***", ""]
     else:
-        print("\n  !!! PRODUCTION MODE - REAL MONEY AT RISK !!!\n")
+        lines += ["", "  !!! PRODUCTION MODE - REAL MONEY AT RISK !!!", ""]
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         response = input("  Are you sure you want to continue? (yes/no): ")
         if response.lower() != 'yes':
             print("  Aborted by user.")
             sys.exit(0)
+        lines = []
 
-    print("=" * 70 + "\n")
+    lines.append("=" * 70 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def validate_environment():
     """Validate that environment is properly configured"""
-    logger = get_logger(__name__, Settings.LOGS_DIR)
-
     try:
         # Validate settings
         Settings.validate_settings()
@@ -87,7 +109,9 @@ def validate_environment():
         if not api_key or not api_secret:
             raise ValueError("API credentials not found in environment")
 
-        if 'your_' in api_key.lower() or 'your_' in api_secret.lower():
+        # Placeholder values from .env.example start with "your_"; compare
+        # only the prefix instead of lowercasing the whole key
+        if api_key[:5].lower() == 'your_' or api_secret[:5].lower() == 'your_':
             raise ValueError(
                 "Please update your .env file with actual API credentials. "
                 "Copy config/.env.example to config/.env and fill in your keys."
@@ -98,25 +122,54 @@ def validate_environment():
 
     except Exception as e:
         logger.error(f"Environment validation failed: {e}")
-        print(f"\n Error: {e}")
-        print("\nPlease ensure:")
-        print("1. You have copied config/.env.example to config/.env")
-        print("2. You have filled in your Binance API credentials")
-        print("3. All required settings are properly configured\n")
+        print(
+            f"\n Error: {e}\n"
+            "\nPlease ensure:\n"
+            "1. You have copied config/.env.example to config/.env\n"
+            "2. You have filled in your Binance API credentials\n"
+            "3. All required settings are properly configured\n",
+            flush=True
+        )
         return False
 
 
-def get_strategy_from_args() -> str:
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    The strategy may be given positionally (``python main.py ema``) or with
+    ``--strategy``; otherwise BOT_STRATEGY or the default is used.
+    """
+    parser = argparse.ArgumentParser(description="Crypto trading bot for Binance Futures")
+    parser.add_argument(
+        'strategy_positional',
+        nargs='?',
+        metavar='strategy',
+        type=str.lower,
+        choices=list(STRATEGIES),
+        help="Strategy to run (same as --strategy)"
+    )
+    parser.add_argument(
+        '--strategy',
+        type=str.lower,
+        choices=list(STRATEGIES),
+        help=f"Strategy to run (default: BOT_STRATEGY or '{DEFAULT_STRATEGY}')"
+    )
+    parser.add_argument(
+        '--dashboard',
+        action='store_true',
+        help="Also serve the web dashboard (DASHBOARD_HOST/DASHBOARD_PORT)"
+    )
+    args = parser.parse_args(argv)
+    args.strategy = get_strategy_from_args(args.strategy or args.strategy_positional)
+    return args
+
+
+def get_strategy_from_args(strategy_key: Optional[str] = None) -> str:
     """Get strategy from command line args or environment"""
-    # Check command line args
-    if len(sys.argv) > 1:
-        strategy_key = sys.argv[1].lower()
-        if strategy_key in STRATEGIES:
-            return strategy_key
-        else:
-            print(f"\n Unknown strategy: {strategy_key}")
-            print(f"Available strategies: {', '.join(STRATEGIES.keys())}")
-            sys.exit(1)
+    # Command line takes precedence (already validated by argparse)
+    if strategy_key:
+        return strategy_key
 
     # Check environment variable
     env_strategy = os.getenv('BOT_STRATEGY', DEFAULT_STRATEGY).lower()
@@ -126,48 +179,167 @@ def get_strategy_from_args() -> str:
     return DEFAULT_STRATEGY
 
 
-def main():
-    """Main entry point"""
-    # Get strategy
-    strategy_key = get_strategy_from_args()
+def run_dashboard(stop_event: Optional[threading.Event] = None):
+    """
+    Run the FastAPI dashboard server.
+
+    Args:
+        stop_event: When set, the server is asked to exit gracefully
+    """
+    # Imported here so a failed validation never pays for FastAPI/uvicorn
+    import uvicorn
+    from src.web.server import app
+
+    host = os.getenv("DASHBOARD_HOST", "0.0.0.0")
+    port = int(os.getenv("DASHBOARD_PORT", 8000))
+
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level="info",
+        access_log=True
+    )
+    server = uvicorn.Server(config)
+
+    if stop_event is not None:
+        def _watch_shutdown():
+            stop_event.wait()
+            server.should_exit = True
+
+        threading.Thread(target=_watch_shutdown, daemon=True).start()
+
+    # Run until shutdown event is set
+    server.run()
+
+
+def start_dashboard():
+    """Start the dashboard server thread and wait until it is ready."""
+    dashboard_thread = threading.Thread(
+        target=run_dashboard,
+        args=(shutdown_event,),
+        daemon=True
+    )
+    dashboard_thread.start()
+
+    # Wait for the dashboard to report startup instead of sleeping blindly
+    from src.web.server import dashboard_ready
+    if dashboard_ready.wait(timeout=10):
+        print("\n✅ Dashboard server started")
+    else:
+        print("\n⚠️ Dashboard server did not report ready, continuing anyway")
+    return dashboard_thread
 
-    # Print banner
-    print_banner(strategy_key)
 
-    # Setup logger
-    logger = get_logger(__name__, Settings.LOGS_DIR)
+def run_trading_bot(strategy_key: str, dashboard: bool = False):
+    """
+    Create the strategy and trader and run the trading loop.
 
-    try:
-        # Validate environment
-        if not validate_environment():
-            sys.exit(1)
+    Args:
+        strategy_key: Key of the strategy in STRATEGIES
+        dashboard: Whether to mirror the bot lifecycle into the dashboard state
+    """
+    global trader_instance
 
+    from src.core.trader import Trader
+
+    bot_state = None
+    if dashboard:
+        from src.web.bot_state import bot_state
+
+    try:
         logger.info("Starting Crypto Trading Bot")
         logger.info(f"Trading mode: {Settings.TRADING_MODE}")
         logger.info(f"Symbol: {Settings.TRADING_PAIR}")
         logger.info(f"Strategy: {get_strategy_name(strategy_key)}")
 
+        if bot_state:
+            bot_state.update(
+                trading_mode=Settings.TRADING_MODE,
+                trading_pair=Settings.TRADING_PAIR,
+                timeframe=Settings.TIMEFRAME,
+                leverage=Settings.MAX_LEVERAGE,
+                initial_capital=Settings.INITIAL_CAPITAL
+            )
+
         # Initialize strategy
-        StrategyClass = STRATEGIES[strategy_key]
+        StrategyClass = load_strategy_class(strategy_key)
         strategy = StrategyClass()
 
         # Initialize trader
-        trader = Trader(strategy)
+        trader_instance = Trader(strategy)
+
+        if bot_state:
+            bot_state.start_bot()
+            bot_state.add_log("INFO", "Trading bot started")
 
         # Start trading loop
-        trader.run_trading_loop()
+        trader_instance.run_trading_loop()
 
     except KeyboardInterrupt:
         logger.info("Shutdown requested by user")
         print("\n\nBot stopped by user. Goodbye!")
-        sys.exit(0)
 
     except Exception as e:
         logger.critical(f"Critical error in main: {e}", exc_info=True)
-        print(f"\n\n Critical Error: {e}")
-        print("Check logs/errors.log for details\n")
+        if bot_state:
+            bot_state.set_error(str(e))
+            bot_state.add_log("ERROR", f"Bot error: {e}")
+        print(
+            f"\n\n Critical Error: {e}\n"
+            "Check logs/errors.log for details\n",
+            flush=True
+        )
         sys.exit(1)
 
+    finally:
+        if bot_state:
+            bot_state.stop_bot()
+            bot_state.add_log("INFO", "Trading bot stopped")
+
+
+def signal_handler(signum, frame):
+    """
+    Handle shutdown signals.
+
+    Stops the dashboard through shutdown_event and interrupts the trading
+    loop with KeyboardInterrupt so the trader runs its own cleanup, rather
+    than calling sys.exit() and skipping it.
+    """
+    print("\n\nShutdown signal received. Stopping services...")
+    shutdown_event.set()
+    raise KeyboardInterrupt
+
+
+def main(argv: Optional[list] = None):
+    """Main entry point"""
+    args = parse_args(argv)
+
+    # Print banner
+    print_banner(args.strategy, dashboard=args.dashboard)
+
+    # Validate environment
+    if not validate_environment():
+        sys.exit(1)
+
+    dashboard_thread = None
+    if args.dashboard:
+        # Install handlers before any thread exists so none races them
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+
+        # Start dashboard in a separate thread
+        dashboard_thread = start_dashboard()
+        print("✅ Starting trading bot...\n")
+
+    # Run trading bot in main thread
+    try:
+        run_trading_bot(args.strategy, dashboard=args.dashboard)
+    finally:
+        if dashboard_thread is not None:
+            shutdown_event.set()
+            dashboard_thread.join(timeout=5)
+
 
 if __name__ == "__main__":
     main()
@@ -3,14 +3,144 @@ Binance Futures exchange connector.
 Handles all API communication with Binance Futures exchange.
 """
 
+from binance import ThreadedWebsocketManager
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
-from typing import Dict, List, Optional, Any
+from binance.streams import BinanceSocketManager, ReconnectingWebsocket
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+import asyncio
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN
+from functools import lru_cache
+from types import MethodType
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import numpy as np
+import hashlib
+import hmac
+import json
+import os
+import tempfile
 import time
+import uuid
 
 from config.settings import Settings
 from src.utils.logger import get_logger
-from src.utils.helpers import retry_on_exception
+from src.utils.helpers import async_retry_on_exception, retry_on_exception
+
+# Optional faster JSON decoding for API responses and stream frames
+try:
+    import orjson
+    ORJSON_ENABLED = True
+except ImportError:
+    orjson = None
+    ORJSON_ENABLED = False
+
+# Keep-alive pool shared by every connector; requests' default of 10
+# connections per host causes "Connection pool is full" churn and fresh
+# TLS handshakes when several calls are in flight
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=128, pool_block=False)
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Make response.json() decode with orjson (errors are still ValueError)"""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+def _orjson_handle_message(self, evt):
+    """
+    ReconnectingWebsocket._handle_message decoding frames with orjson.
+
+    The all-symbols mark price stream delivers a large array every second;
+    stdlib json was the bulk of the stream thread's CPU time. Binary
+    (gzip) frames and anything orjson rejects go through the stock parser.
+    """
+    if self._is_binary:
+        return ReconnectingWebsocket._handle_message(self, evt)
+    try:
+        return orjson.loads(evt)
+    except ValueError:
+        return ReconnectingWebsocket._handle_message(self, evt)
+
+
+class _OrjsonSocketManager(BinanceSocketManager):
+    """
+    BinanceSocketManager whose sockets decode frames with orjson.
+
+    The decoder is bound to each socket this manager creates, so other
+    python-binance users in the process keep the stock parser.
+    """
+
+    def _get_socket(self, *args, **kwargs) -> ReconnectingWebsocket:
+        socket = super()._get_socket(*args, **kwargs)
+        socket._handle_message = MethodType(_orjson_handle_message, socket)
+        return socket
+
+    def _get_account_socket(self, *args, **kwargs) -> ReconnectingWebsocket:
+        socket = super()._get_account_socket(*args, **kwargs)
+        socket._handle_message = MethodType(_orjson_handle_message, socket)
+        return socket
+
+
+class _OrjsonWebsocketManager(ThreadedWebsocketManager):
+    """ThreadedWebsocketManager running its streams through _OrjsonSocketManager"""
+
+    async def _before_socket_listener_start(self):
+        assert self._client
+        self._bsm = _OrjsonSocketManager(client=self._client)
+
+
+class _SigningClient(Client):
+    """
+    python-binance Client that keys HMAC-SHA256 once.
+
+    The stock client calls hmac.new(secret, ...) for every signed request;
+    copying a pre-keyed prototype skips re-deriving the padded key each time.
+
+    It also parses each response from a local variable. The stock _request
+    stores it on self.response and reads it back from there, so calls made
+    concurrently from worker threads (the a_* variants) could parse each
+    other's payloads.
+    """
+
+    _hmac_proto = None
+
+    def _request(self, method, uri: str, signed: bool, force_params: bool = False, **kwargs):
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+        response = getattr(self.session, method)(uri, **kwargs)
+        self.response = response  # Kept for callers inspecting the last response
+        return self._handle_response(response)
+
+    def _hmac_signature(self, query_string: str) -> str:
+        assert self.API_SECRET, "API Secret required for private endpoints"
+        proto = self._hmac_proto
+        if proto is None:
+            proto = self._hmac_proto = hmac.new(self.API_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
+        m = proto.copy()
+        m.update(query_string.encode('utf-8'))
+        return m.hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _fmt_qty(step: Optional[Decimal], quant: Decimal, quantity: float) -> float:
+    """Round quantity down to a multiple of step, then to the quant exponent"""
+    value = Decimal(str(quantity))
+    if step:
+        value = (value / step).to_integral_value(rounding=ROUND_DOWN) * step
+    return float(value.quantize(quant, rounding=ROUND_DOWN))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_price(quant: Decimal, price: float) -> float:
+    """Round price to the quant exponent"""
+    return float(Decimal(str(price)).quantize(quant, rounding=ROUND_HALF_EVEN))
+
+
+# Column layout of the array returned by get_historical_klines()
+KLINE_COLUMNS = ('open_time', 'open', 'high', 'low', 'close', 'volume')
 
 
 class BinanceConnector:
@@ -21,7 +151,7 @@ class BinanceConnector:
 
     def __init__(self):
         """Initialize Binance connector with API credentials"""
-        self.logger = get_logger(__name__, Settings.LOGS_DIR)
+        self.logger = get_logger(__name__, Settings.LOGS_DIR_STR)
 
         # Get API credentials
         api_key, api_secret = Settings.get_api_credentials()
@@ -29,60 +159,201 @@ class BinanceConnector:
         # Symbol precision cache
         self.symbol_info_cache = {}
 
-        # Initialize Binance client
+        # Futures balances keyed by asset, reused for Settings.BALANCE_CACHE_TTL,
+        # or until the next ACCOUNT_UPDATE while the user-data stream is healthy
+        self._balances_by_asset: Dict[str, Dict[str, Any]] = {}
+        self._balances_fetched_at = 0.0
+        self._balances_live = False
+
+        # Stream-fed caches: symbol -> (mark price, monotonic receive time)
+        # and (symbol, positionSide) -> position dict in REST format
+        self._prices: Dict[str, tuple] = {}
+        self._positions: Dict[tuple, Dict[str, Any]] = {}
+        self._positions_live = False
+        self._positions_fetched_at = 0.0  # last REST reseed, for POSITION_CACHE_TTL
+        self._user_stream_ok = False
+        self._twm: Optional[ThreadedWebsocketManager] = None
+        # Guards _positions and _balances_by_asset: the user-data callback
+        # writes them on the stream thread while worker threads read them
+        self._cache_lock = threading.Lock()
+
+        # Orders placed in the background, and the callbacks waiting for
+        # their fills keyed by client order ID
+        self._order_executor: Optional[ThreadPoolExecutor] = None
+        self._fill_callbacks: Dict[str, Callable] = {}
+        self._fill_lock = threading.Lock()
+
+        # Last known leverage / margin type per symbol, to skip no-op calls
+        self._leverage_state: Dict[str, int] = {}
+        self._margin_state: Dict[str, str] = {}
+
+        # Initialize Binance client. python-binance already times requests
+        # out after a fixed 10s; requests_params makes that configurable
+        # (Settings.HTTP_TIMEOUT) so a stalled socket fails sooner
+        requests_params = {'timeout': Settings.HTTP_TIMEOUT}
         try:
             # Configure testnet mode
             if Settings.TRADING_MODE == 'TESTNET':
-                self.client = Client(api_key, api_secret, testnet=True)
+                self.client = _SigningClient(
+                    api_key, api_secret, requests_params=requests_params, testnet=True
+                )
                 self.logger.info("Connected to Binance TESTNET")
             else:
-                self.client = Client(api_key, api_secret)
+                self.client = _SigningClient(api_key, api_secret, requests_params=requests_params)
                 self.logger.warning("Connected to Binance PRODUCTION - Real money at risk!")
 
+            # Reuse warm sockets across calls and connector instances
+            self.client.session.mount('https://', _HTTP_ADAPTER)
+            if ORJSON_ENABLED:
+                self.client.session.hooks['response'].append(_orjson_response_hook)
+
             # Test connection
             self._test_connection()
 
-            # Load symbol precision info
+            # Load symbol precision info; order formatting raises KeyError
+            # for symbols without it, so reject an unknown pair up front
             self._load_symbol_info()
+            self._check_symbol(Settings.TRADING_PAIR)
+
+            if Settings.WS_STREAMS_ENABLED:
+                self._start_ws(api_key, api_secret)
 
         except Exception as e:
-            self.logger.error(f"Failed to initialize Binance client: {e}", exc_info=True)
+            self.logger.error("Failed to initialize Binance client: %s", e, exc_info=True)
             raise
 
     def _load_symbol_info(self):
-        """Load symbol precision information from exchange"""
+        """Load symbol precision information, preferring the on-disk cache"""
+        # Formatting results depend on the symbol filters being replaced
+        _fmt_qty.cache_clear()
+        _fmt_price.cache_clear()
         try:
-            exchange_info = self.client.futures_exchange_info()
-            for symbol_data in exchange_info['symbols']:
-                symbol = symbol_data['symbol']
-                self.symbol_info_cache[symbol] = {
-                    'quantity_precision': symbol_data['quantityPrecision'],
-                    'price_precision': symbol_data['pricePrecision'],
-                    'min_qty': None,
-                    'step_size': None
-                }
-                # Get filters
-                for f in symbol_data['filters']:
-                    if f['filterType'] == 'LOT_SIZE':
-                        self.symbol_info_cache[symbol]['min_qty'] = float(f['minQty'])
-                        self.symbol_info_cache[symbol]['step_size'] = float(f['stepSize'])
-                    elif f['filterType'] == 'MIN_NOTIONAL':
-                        self.symbol_info_cache[symbol]['min_notional'] = float(f.get('notional', 5))
-
-            self.logger.info(f"Loaded precision info for {len(self.symbol_info_cache)} symbols")
+            self.symbol_info_cache = self._load_cached_symbol_info()
+            for info in self.symbol_info_cache.values():
+                self._add_quantizers(info)
+            self.logger.info("Loaded precision info for %s symbols", len(self.symbol_info_cache))
         except Exception as e:
-            self.logger.warning(f"Failed to load symbol info: {e}")
-            # Set defaults for BTCUSDT
-            self.symbol_info_cache['BTCUSDT'] = {
+            self.logger.warning("Failed to load symbol info: %s", e)
+            # Set defaults for the traded pair
+            self.symbol_info_cache[Settings.TRADING_PAIR] = self._add_quantizers({
                 'quantity_precision': 3,
                 'price_precision': 2,
                 'min_qty': 0.001,
                 'step_size': 0.001
+            })
+
+    @staticmethod
+    def _add_quantizers(info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute the Decimal step and exponents used by the formatters.
+
+        Args:
+            info: Symbol entry from symbol_info_cache (updated in place)
+
+        Returns:
+            The same entry, for convenience
+        """
+        step_size = info.get('step_size')
+        info['qty_step'] = Decimal(str(step_size)) if step_size else None
+        info['qty_quant'] = Decimal(1).scaleb(-info['quantity_precision'])
+        info['price_quant'] = Decimal(1).scaleb(-info['price_precision'])
+        return info
+
+    def _exchange_info_cache_path(self) -> str:
+        """Path of the exchange info cache file for the current trading mode"""
+        return os.path.join(Settings.CACHE_DIR, f"exchange_info_{Settings.TRADING_MODE.lower()}.json")
+
+    def _load_cached_symbol_info(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return symbol precision info from disk if fresh, else from the API.
+
+        The cache is considered fresh for Settings.EXCHANGE_INFO_TTL seconds.
+        A fetched copy is written atomically so a crash never leaves a
+        truncated file behind.
+
+        Returns:
+            Dict mapping symbol to its precision and filter values
+        """
+        path = self._exchange_info_cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) < Settings.EXCHANGE_INFO_TTL:
+                with open(path, 'r') as f:
+                    cached = json.load(f)
+                self.logger.debug("Using cached exchange info from %s", path)
+                return cached
+        except (OSError, ValueError):
+            pass  # Missing, unreadable or corrupt cache: refetch
+
+        symbol_info = self._parse_exchange_info(self.client.futures_exchange_info())
+
+        try:
+            os.makedirs(Settings.CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=Settings.CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(symbol_info, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug("Could not write exchange info cache: %s", e)
+
+        return symbol_info
+
+    @staticmethod
+    def _parse_exchange_info(exchange_info: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Keep only the precision and filter fields used for order formatting.
+
+        Args:
+            exchange_info: Raw futures_exchange_info response
+
+        Returns:
+            Dict mapping symbol to its precision and filter values
+        """
+        symbol_info = {}
+        for symbol_data in exchange_info['symbols']:
+            entry = {
+                'quantity_precision': symbol_data['quantityPrecision'],
+                'price_precision': symbol_data['pricePrecision'],
+                'min_qty': None,
+                'step_size': None
             }
+            # Get filters
+            for f in symbol_data['filters']:
+                if f['filterType'] == 'LOT_SIZE':
+                    entry['min_qty'] = float(f['minQty'])
+                    entry['step_size'] = float(f['stepSize'])
+                elif f['filterType'] == 'MIN_NOTIONAL':
+                    entry['min_notional'] = float(f.get('notional', 5))
+            symbol_info[symbol_data['symbol']] = entry
+        return symbol_info
+
+    def _symbol_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        Return the cached precision entry for a symbol.
+
+        Raises:
+            KeyError: If the symbol was not found in exchange info
+        """
+        try:
+            return self.symbol_info_cache[symbol]
+        except KeyError:
+            raise KeyError(f"No precision info loaded for symbol {symbol}") from None
+
+    def _check_symbol(self, symbol: str):
+        """
+        Make sure orders for a symbol can be formatted.
+
+        Raises:
+            ValueError: If the symbol is not listed in exchange info
+        """
+        if symbol not in self.symbol_info_cache:
+            raise ValueError(f"Symbol {symbol} not found in Binance Futures exchange info")
 
     def format_quantity(self, symbol: str, quantity: float) -> float:
         """
-        Format quantity according to symbol precision.
+        Format quantity according to symbol step size and precision.
+
+        Quantities are rounded down so an order never exceeds the size the
+        caller could afford.
 
         Args:
             symbol: Trading pair symbol
@@ -91,18 +362,13 @@ class BinanceConnector:
         Returns:
             Formatted quantity with correct precision
         """
-        info = self.symbol_info_cache.get(symbol, {})
-        precision = info.get('quantity_precision', 3)
-        step_size = info.get('step_size', 0.001)
-
-        # Round to step size
-        if step_size:
-            quantity = round(quantity / step_size) * step_size
+        info = self._symbol_info(symbol)
+        formatted = _fmt_qty(info['qty_step'], info['qty_quant'], quantity)
 
-        # Round to precision
-        formatted = round(quantity, precision)
-
-        self.logger.debug(f"Formatted quantity: {quantity} -> {formatted} (precision: {precision})")
+        self.logger.debug(
+            "Formatted quantity: %s -> %s (precision: %s)",
+            quantity, formatted, info['quantity_precision']
+        )
 
         return formatted
 
@@ -117,11 +383,129 @@ class BinanceConnector:
         Returns:
             Formatted price with correct precision
         """
-        info = self.symbol_info_cache.get(symbol, {})
-        precision = info.get('price_precision', 2)
+        return _fmt_price(self._symbol_info(symbol)['price_quant'], price)
 
-        formatted = round(price, precision)
-        return formatted
+    def _start_ws(self, api_key: str, api_secret: str):
+        """
+        Start the mark-price and user-data streams feeding the local caches.
+
+        Failure is not fatal: get_ticker_price and get_open_positions keep
+        using REST whenever the caches are cold or stale.
+        """
+        try:
+            manager = _OrjsonWebsocketManager if ORJSON_ENABLED else ThreadedWebsocketManager
+            self._twm = manager(
+                api_key, api_secret, testnet=Settings.TRADING_MODE == 'TESTNET'
+            )
+            self._twm.daemon = True  # Never keep the process alive on exit
+            self._twm.start()
+            self._twm.start_futures_multiplex_socket(
+                callback=self._on_mark_price, streams=['!markPrice@arr@1s']
+            )
+            # _user_stream_ok is set by the first event, not by subscribing
+            self._twm.start_futures_user_socket(callback=self._on_user_data)
+            self.logger.info("WebSocket price/position streams started")
+        except Exception as e:
+            self.logger.warning("WebSocket streams unavailable, using REST only: %s", e)
+            self.close()
+
+    def start_kline_stream(self, symbol: str, interval: str, callback) -> bool:
+        """
+        Subscribe a callback to the symbol's futures kline pushes.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval (e.g., '5m')
+            callback: Called with each raw kline message
+
+        Returns:
+            True if the stream was started, False if streams are unavailable
+        """
+        if self._twm is None:
+            return False
+        try:
+            self._twm.start_kline_futures_socket(callback=callback, symbol=symbol, interval=interval)
+            return True
+        except Exception as e:
+            self.logger.warning("Kline stream unavailable for %s: %s", symbol, e)
+            return False
+
+    def _on_mark_price(self, msg: Dict[str, Any]):
+        """Store every symbol's mark price from a !markPrice@arr message"""
+        data = msg.get('data') if isinstance(msg, dict) else None
+        if not isinstance(data, list):
+            return
+        now = time.monotonic()
+        prices = self._prices
+        for item in data:
+            prices[item['s']] = (float(item['p']), now)
+
+    def _on_user_data(self, msg: Dict[str, Any]):
+        """
+        Apply ACCOUNT_UPDATE position changes to the position cache and
+        settle background orders on ORDER_TRADE_UPDATE fills.
+        """
+        event = msg.get('e') if isinstance(msg, dict) else None
+        if event == 'error':
+            # Positions and balance changes may be missed until REST reseeds
+            self._user_stream_ok = False
+            self._positions_live = False
+            self._balances_live = False
+            return
+        self._user_stream_ok = True
+        if event == 'ORDER_TRADE_UPDATE':
+            order = msg.get('o', {})
+            if order.get('X') == 'FILLED':
+                self._settle_order(order.get('c'), {
+                    'avg_price': float(order['ap']),
+                    'executed_qty': float(order['z'])
+                })
+            return
+        if event != 'ACCOUNT_UPDATE':
+            return
+
+        # Balances changed; refetch them on the next get_balance()
+        if msg.get('a', {}).get('B'):
+            self._balances_live = False
+            self._balances_fetched_at = 0.0
+
+        # Entries are replaced rather than updated in place, so snapshots
+        # taken by get_open_positions never change underneath a reader
+        with self._cache_lock:
+            for p in msg.get('a', {}).get('P', []):
+                key = (p['s'], p.get('ps', 'BOTH'))
+                position = dict(self._positions.get(key) or {'symbol': p['s'], 'positionSide': key[1]})
+                position['positionAmt'] = p['pa']
+                position['entryPrice'] = p['ep']
+                position['unRealizedProfit'] = p['up']
+                position['marginType'] = p.get('mt', position.get('marginType'))
+                self._positions[key] = position
+
+    def _seed_symbol_state(self, positions: List[Dict[str, Any]]):
+        """Record leverage and margin type reported by futures_position_information"""
+        for pos in positions:
+            symbol = pos['symbol']
+            if 'leverage' in pos:
+                self._leverage_state[symbol] = int(pos['leverage'])
+            margin_type = pos.get('marginType')
+            if margin_type:
+                self._margin_state[symbol] = 'ISOLATED' if margin_type.lower() == 'isolated' else 'CROSSED'
+
+    def close(self):
+        """Wait for background orders to finish, then stop the WebSocket streams"""
+        executor, self._order_executor = self._order_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        twm, self._twm = self._twm, None
+        self._positions_live = False
+        self._balances_live = False
+        self._user_stream_ok = False
+        if twm is not None:
+            try:
+                twm.stop()
+            except Exception as e:
+                self.logger.debug("Error stopping WebSocket manager: %s", e)
 
     def _test_connection(self):
         """Test connection to Binance API"""
@@ -129,65 +513,70 @@ class BinanceConnector:
             self.client.futures_ping()
             self.logger.info("Binance API connection successful")
         except Exception as e:
-            self.logger.error(f"Binance API connection failed: {e}", exc_info=True)
+            self.logger.error("Binance API connection failed: %s", e, exc_info=True)
             raise
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
     def get_balance(self) -> Dict[str, float]:
         """
         Get account balance for futures trading.
 
+        While the user-data stream is healthy the last fetch is reused until
+        an ACCOUNT_UPDATE reports a balance change; otherwise it is reused
+        for Settings.BALANCE_CACHE_TTL seconds.
+
         Returns:
             Dict with total balance and available balance
 
         Raises:
             BinanceAPIException: If API call fails
         """
-        try:
+        now = time.monotonic()
+        if not self._balances_live and now - self._balances_fetched_at >= Settings.BALANCE_CACHE_TTL:
             account_info = self.client.futures_account_balance()
+            with self._cache_lock:
+                self._balances_by_asset = {item['asset']: item for item in account_info}
+            self._balances_fetched_at = now
+            self._balances_live = self._user_stream_ok
 
-            # Find USDT balance
-            usdt_balance = next(
-                (item for item in account_info if item['asset'] == 'USDT'),
-                None
-            )
-
-            if usdt_balance:
-                balance = float(usdt_balance['balance'])
-                available = float(usdt_balance['availableBalance'])
+        with self._cache_lock:
+            usdt_balance = self._balances_by_asset.get('USDT')
 
-                self.logger.debug(f"Balance: {balance} USDT, Available: {available} USDT")
+        if usdt_balance:
+            balance = float(usdt_balance['balance'])
+            available = float(usdt_balance['availableBalance'])
 
-                return {
-                    'total': balance,
-                    'available': available
-                }
-            else:
-                self.logger.warning("USDT balance not found")
-                return {'total': 0.0, 'available': 0.0}
+            self.logger.debug("Balance: %s USDT, Available: %s USDT", balance, available)
 
-        except BinanceAPIException as e:
-            self.logger.error(f"Failed to get balance: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error getting balance: {e}", exc_info=True)
-            raise
+            return {
+                'total': balance,
+                'available': available
+            }
+        else:
+            self.logger.warning("USDT balance not found")
+            return {'total': 0.0, 'available': 0.0}
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
     def get_ticker_price(self, symbol: str) -> float:
         """
         Get current ticker price for a symbol.
 
+        Served from the mark-price stream when fresh, otherwise from REST.
+
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
 
@@ -197,33 +586,32 @@ class BinanceConnector:
         Raises:
             BinanceAPIException: If API call fails
         """
-        try:
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
-            price = float(ticker['price'])
+        cached = self._prices.get(symbol)
+        if cached is not None and time.monotonic() - cached[1] <= Settings.WS_PRICE_MAX_AGE:
+            return cached[0]
 
-            self.logger.debug(f"{symbol} price: {price}")
+        ticker = self.client.futures_symbol_ticker(symbol=symbol)
+        price = float(ticker['price'])
 
-            return price
+        self.logger.debug("%s price: %s", symbol, price)
 
-        except BinanceAPIException as e:
-            self.logger.error(f"Failed to get ticker price for {symbol}: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error getting ticker price: {e}", exc_info=True)
-            raise
+        return price
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
     def get_historical_klines(
         self,
         symbol: str,
         interval: str,
-        limit: int = 500
-    ) -> List[List]:
+        limit: int = 500,
+        start_time: Optional[int] = None
+    ) -> np.ndarray:
         """
         Get historical candlestick data.
 
@@ -231,40 +619,73 @@ class BinanceConnector:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
             interval: Kline interval (e.g., '1h', '4h', '1d')
             limit: Number of candles to retrieve (max 1500)
+            start_time: Only return candles opened at or after this time (ms)
 
         Returns:
-            List of klines (OHLCV data)
+            float64 array of shape (n, 6) laid out as KLINE_COLUMNS; the
+            millisecond timestamps are exact in float64
 
         Raises:
             BinanceAPIException: If API call fails
         """
-        try:
-            klines = self.client.futures_klines(
-                symbol=symbol,
-                interval=interval,
-                limit=limit
-            )
+        params = {'symbol': symbol, 'interval': interval, 'limit': limit}
+        if start_time is not None:
+            params['startTime'] = start_time
+        klines = self.client.futures_klines(**params)
 
-            self.logger.debug(f"Retrieved {len(klines)} klines for {symbol} ({interval})")
+        # Parse the string fields once here instead of in every consumer;
+        # the six OHLCV fields only, nothing downstream reads the rest
+        arr = np.fromiter(
+            itertools.chain.from_iterable(k[:6] for k in klines),
+            dtype=np.float64,
+            count=len(klines) * 6
+        ).reshape(-1, 6)
 
-            return klines
+        self.logger.debug("Retrieved %s klines for %s (%s)", len(arr), symbol, interval)
 
-        except BinanceAPIException as e:
-            self.logger.error(
-                f"Failed to get klines for {symbol} ({interval}): {e}",
-                exc_info=True
-            )
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error getting klines: {e}", exc_info=True)
-            raise
+        return arr
+
+    @staticmethod
+    def _new_client_order_id() -> str:
+        """Unique client order ID (Binance allows up to 36 characters)"""
+        return f"bot-{uuid.uuid4().hex[:20]}"
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        # Timeouts and dropped connections too: the client order ID makes
+        # retrying them safe, which no other retried call can guarantee
+        exceptions=(BinanceRequestException, BinanceAPIException, Timeout, RequestsConnectionError),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
+    def _create_order(self, client_order_id: str, **params) -> Dict[str, Any]:
+        """
+        Place an order tagged with client_order_id, safely retryable.
+
+        The ID is fixed for every retry of one placement, so if an earlier
+        attempt reached Binance (e.g. the response timed out) the retry is
+        rejected as a duplicate and the original order is returned instead
+        of opening a second one.
+        """
+        try:
+            order = self.client.futures_create_order(newClientOrderId=client_order_id, **params)
+        except BinanceAPIException as e:
+            if e.code != -4116:  # ClientOrderId is duplicated
+                raise
+            self.logger.info("Order %s already placed, fetching it", client_order_id)
+            order = self.client.futures_get_order(
+                symbol=params['symbol'],
+                origClientOrderId=client_order_id
+            )
+
+        self._balances_fetched_at = 0.0  # Margin changed, refetch next time
+        self._balances_live = False
+        self._positions_live = False  # Don't race the ACCOUNT_UPDATE event
+        self._positions_fetched_at = 0.0
+        return order
+
     def place_market_order(
         self,
         symbol: str,
@@ -285,36 +706,100 @@ class BinanceConnector:
         Raises:
             BinanceAPIException: If order fails
         """
-        try:
-            # Format quantity with correct precision
-            formatted_qty = self.format_quantity(symbol, quantity)
+        # Format quantity with correct precision
+        formatted_qty = self.format_quantity(symbol, quantity)
+
+        self.logger.info("Placing %s market order: %s %s", side, formatted_qty, symbol)
+
+        order = self._create_order(
+            self._new_client_order_id(),
+            symbol=symbol,
+            side=side,
+            type='MARKET',
+            quantity=formatted_qty
+        )
+
+        self.logger.info("Order placed successfully: %s", order['orderId'])
+
+        return order
+
+    def submit_market_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        on_done: Callable[[str, Optional[Dict[str, Any]], Optional[Exception]], None]
+    ) -> str:
+        """
+        Place a market order in the background without waiting for it.
+
+        on_done(client_order_id, fill, error) is called exactly once, from
+        a background thread: with fill = {'avg_price', 'executed_qty'} from
+        whichever reports first, the user-data stream's ORDER_TRADE_UPDATE
+        or the REST response, or with the exception if placement failed.
 
-            self.logger.info(f"Placing {side} market order: {formatted_qty} {symbol}")
+        Args:
+            symbol: Trading pair symbol
+            side: 'BUY' or 'SELL'
+            quantity: Order quantity
+            on_done: Completion callback
 
-            order = self.client.futures_create_order(
+        Returns:
+            Client order ID the callback will be called with
+        """
+        formatted_qty = self.format_quantity(symbol, quantity)
+        client_order_id = self._new_client_order_id()
+
+        with self._fill_lock:
+            self._fill_callbacks[client_order_id] = on_done
+        if self._order_executor is None:
+            # One worker keeps background orders in submission order
+            self._order_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='orders')
+
+        self.logger.info("Submitting %s market order: %s %s", side, formatted_qty, symbol)
+        self._order_executor.submit(
+            self._place_submitted_order, client_order_id, symbol, side, formatted_qty
+        )
+        return client_order_id
+
+    def _place_submitted_order(self, client_order_id: str, symbol: str, side: str, quantity: float):
+        """Executor task behind submit_market_order()"""
+        try:
+            order = self._create_order(
+                client_order_id,
                 symbol=symbol,
                 side=side,
                 type='MARKET',
-                quantity=formatted_qty
+                quantity=quantity,
+                newOrderRespType='RESULT'
             )
+        except Exception as e:
+            self.logger.error("Order %s failed: %s", client_order_id, e)
+            self._settle_order(client_order_id, error=e)
+            return
 
-            self.logger.info(f"Order placed successfully: {order['orderId']}")
+        self.logger.info("Order placed successfully: %s", order['orderId'])
 
-            return order
+        # Without the user-data stream nothing else will report the fill;
+        # settle with whatever the response has (avg_price 0 if unknown)
+        if order.get('status') == 'FILLED' or not self._user_stream_ok:
+            self._settle_order(client_order_id, {
+                'avg_price': float(order.get('avgPrice') or 0.0),
+                'executed_qty': float(order.get('executedQty') or 0.0)
+            })
 
-        except BinanceAPIException as e:
-            self.logger.error(f"Failed to place order: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error placing order: {e}", exc_info=True)
-            raise
+    def _settle_order(
+        self,
+        client_order_id: Optional[str],
+        fill: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None
+    ):
+        """Hand a background order's outcome to its callback, once"""
+        with self._fill_lock:
+            callback = self._fill_callbacks.pop(client_order_id, None)
+        if callback is not None:
+            callback(client_order_id, fill, error)
 
-    @retry_on_exception(
-        max_attempts=Settings.RETRY_ATTEMPTS,
-        delay=Settings.RETRY_DELAY,
-        backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
-    )
     def place_limit_order(
         self,
         symbol: str,
@@ -337,40 +822,35 @@ class BinanceConnector:
         Raises:
             BinanceAPIException: If order fails
         """
-        try:
-            # Format quantity and price with correct precision
-            formatted_qty = self.format_quantity(symbol, quantity)
-            formatted_price = self.format_price(symbol, price)
-
-            self.logger.info(
-                f"Placing {side} limit order: {formatted_qty} {symbol} @ {formatted_price}"
-            )
+        # Format quantity and price with correct precision
+        formatted_qty = self.format_quantity(symbol, quantity)
+        formatted_price = self.format_price(symbol, price)
 
-            order = self.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type='LIMIT',
-                timeInForce='GTC',
-                quantity=formatted_qty,
-                price=formatted_price
-            )
+        self.logger.info(
+            "Placing %s limit order: %s %s @ %s", side, formatted_qty, symbol, formatted_price
+        )
 
-            self.logger.info(f"Limit order placed successfully: {order['orderId']}")
+        order = self._create_order(
+            self._new_client_order_id(),
+            symbol=symbol,
+            side=side,
+            type='LIMIT',
+            timeInForce='GTC',
+            quantity=formatted_qty,
+            price=formatted_price
+        )
 
-            return order
+        self.logger.info("Limit order placed successfully: %s", order['orderId'])
 
-        except BinanceAPIException as e:
-            self.logger.error(f"Failed to place limit order: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error placing limit order: {e}", exc_info=True)
-            raise
+        return order
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
     def set_leverage(self, symbol: str, leverage: int):
         """
@@ -389,31 +869,33 @@ class BinanceConnector:
                     f"Leverage must be between 1 and {Settings.MAX_LEVERAGE}"
                 )
 
+            if self._leverage_state.get(symbol) == leverage:
+                return None
+
             response = self.client.futures_change_leverage(
                 symbol=symbol,
                 leverage=leverage
             )
+            self._leverage_state[symbol] = leverage
 
-            self.logger.info(f"Leverage set to {leverage}x for {symbol}")
+            self.logger.info("Leverage set to %sx for %s", leverage, symbol)
 
             return response
 
         except BinanceAPIException as e:
             # Can't change leverage with open position - not an error
             if e.code == -4161:
-                self.logger.debug(f"Cannot change leverage with open position for {symbol}")
+                self.logger.debug("Cannot change leverage with open position for %s", symbol)
             else:
-                self.logger.error(f"Failed to set leverage: {e}", exc_info=True)
                 raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error setting leverage: {e}", exc_info=True)
-            raise
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
     def set_margin_type(self, symbol: str, margin_type: str = 'ISOLATED'):
         """
@@ -427,75 +909,159 @@ class BinanceConnector:
             BinanceAPIException: If setting margin type fails
         """
         try:
+            if self._margin_state.get(symbol) == margin_type:
+                return None
+
             response = self.client.futures_change_margin_type(
                 symbol=symbol,
                 marginType=margin_type
             )
+            self._margin_state[symbol] = margin_type
 
-            self.logger.info(f"Margin type set to {margin_type} for {symbol}")
+            self.logger.info("Margin type set to %s for %s", margin_type, symbol)
 
             return response
 
         except BinanceAPIException as e:
             # Margin type already set - not an error
             if e.code == -4046:
-                self.logger.debug(f"Margin type already set to {margin_type} for {symbol}")
+                self._margin_state[symbol] = margin_type
+                self.logger.debug("Margin type already set to %s for %s", margin_type, symbol)
             else:
-                self.logger.error(f"Failed to set margin type: {e}", exc_info=True)
                 raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error setting margin type: {e}", exc_info=True)
-            raise
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
-    def get_open_positions(self) -> List[Dict[str, Any]]:
+    def get_open_positions(self, symbol: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
         """
-        Get all open positions.
+        Get all open positions keyed by symbol.
+
+        Served from the user-data stream cache while it is healthy,
+        otherwise from REST (which also reseeds the cache). REST results
+        are reused for Settings.POSITION_CACHE_TTL seconds.
+
+        Args:
+            symbol: Only return this symbol's position. While the stream is
+                down the REST call is then filtered server-side too, instead
+                of pulling every symbol on the account each cycle
 
         Returns:
-            List of open positions
+            Dict mapping symbol to its open position, with positionAmt
+            already parsed to float
 
         Raises:
             BinanceAPIException: If API call fails
         """
-        try:
-            positions = self.client.futures_position_information()
+        if not self._positions_live:
+            now = time.monotonic()
+            if symbol is not None and not self._user_stream_ok:
+                positions = self.client.futures_position_information(symbol=symbol)
+                with self._cache_lock:
+                    for pos in positions:
+                        self._positions[(pos['symbol'], pos.get('positionSide', 'BOTH'))] = pos
+                self._seed_symbol_state(positions)
+            elif now - self._positions_fetched_at >= Settings.POSITION_CACHE_TTL:
+                positions = self.client.futures_position_information()
+
+                # Reseed the stream cache; it stays authoritative while the
+                # user-data stream is healthy
+                with self._cache_lock:
+                    self._positions = {
+                        (pos['symbol'], pos.get('positionSide', 'BOTH')): pos for pos in positions
+                    }
+                self._positions_fetched_at = now
+                self._positions_live = self._user_stream_ok
+                self._seed_symbol_state(positions)
+
+        with self._cache_lock:
+            positions = list(self._positions.values())
+        if symbol is not None:
+            positions = [pos for pos in positions if pos['symbol'] == symbol]
+        open_positions = self._index_open_positions(positions)
+
+        self.logger.debug("Found %s open positions", len(open_positions))
+
+        return open_positions
+
+    @staticmethod
+    def _index_open_positions(positions: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Map symbol to a copy of its position, skipping flat ones.
 
-            # Filter only positions with non-zero amount
-            open_positions = [
-                pos for pos in positions
-                if float(pos['positionAmt']) != 0
-            ]
+        The bot trades in one-way mode, so each symbol has a single
+        position (positionSide BOTH).
+        """
+        open_positions = {}
+        for pos in positions:
+            amount = float(pos['positionAmt'])
+            if amount != 0:
+                open_positions[pos['symbol']] = dict(pos, positionAmt=amount)
+        return open_positions
 
-            self.logger.debug(f"Found {len(open_positions)} open positions")
+    @retry_on_exception(
+        max_attempts=Settings.RETRY_ATTEMPTS,
+        delay=Settings.RETRY_DELAY,
+        backoff=Settings.BACKOFF_MULTIPLIER,
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
+    )
+    def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        client_order_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Cancel an open order.
 
-            return open_positions
+        Args:
+            symbol: Trading pair symbol
+            order_id: Order ID to cancel
+            client_order_id: Client order ID to cancel, used if order_id is not given
 
-        except BinanceAPIException as e:
-            self.logger.error(f"Failed to get open positions: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error getting open positions: {e}", exc_info=True)
-            raise
+        Returns:
+            Cancellation response
+
+        Raises:
+            BinanceAPIException: If cancellation fails
+        """
+        if order_id is not None:
+            params = {'orderId': order_id}
+        elif client_order_id is not None:
+            params = {'origClientOrderId': client_order_id}
+        else:
+            raise ValueError("order_id or client_order_id is required")
+
+        order_ref = order_id if order_id is not None else client_order_id
+        self.logger.info("Cancelling order %s for %s", order_ref, symbol)
+
+        response = self.client.futures_cancel_order(symbol=symbol, **params)
+
+        self.logger.info("Order %s cancelled successfully", order_ref)
+
+        return response
 
     @retry_on_exception(
         max_attempts=Settings.RETRY_ATTEMPTS,
         delay=Settings.RETRY_DELAY,
         backoff=Settings.BACKOFF_MULTIPLIER,
-        exceptions=(BinanceRequestException, BinanceAPIException)
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
     )
-    def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
+    def cancel_all(self, symbol: str) -> Dict[str, Any]:
         """
-        Cancel an open order.
+        Cancel every open order for a symbol in a single request.
 
         Args:
             symbol: Trading pair symbol
-            order_id: Order ID to cancel
 
         Returns:
             Cancellation response
@@ -503,21 +1069,109 @@ class BinanceConnector:
         Raises:
             BinanceAPIException: If cancellation fails
         """
-        try:
-            self.logger.info(f"Cancelling order {order_id} for {symbol}")
+        self.logger.info("Cancelling all open orders for %s", symbol)
+        return self.client.futures_cancel_all_open_orders(symbol=symbol)
 
-            response = self.client.futures_cancel_order(
-                symbol=symbol,
-                orderId=order_id
-            )
+    def cancel_many(self, symbol: str, order_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Cancel several orders through the batchOrders endpoint.
 
-            self.logger.info(f"Order {order_id} cancelled successfully")
+        Binance accepts at most 10 IDs per batch, so larger lists are sent
+        in chunks of 10.
 
-            return response
+        Args:
+            symbol: Trading pair symbol
+            order_ids: Order IDs to cancel
 
-        except BinanceAPIException as e:
-            self.logger.error(f"Failed to cancel order: {e}", exc_info=True)
-            raise
-        except Exception as e:
-            self.logger.error(f"Unexpected error cancelling order: {e}", exc_info=True)
-            raise
+        Returns:
+            Per-order cancellation results, in the order given
+
+        Raises:
+            BinanceAPIException: If a batch request fails
+        """
+        order_ids = list(order_ids)
+        results = []
+        for i in range(0, len(order_ids), 10):
+            results.extend(self._cancel_batch(symbol, order_ids[i:i + 10]))
+        return results
+
+    @retry_on_exception(
+        max_attempts=Settings.RETRY_ATTEMPTS,
+        delay=Settings.RETRY_DELAY,
+        backoff=Settings.BACKOFF_MULTIPLIER,
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
+    )
+    def _cancel_batch(self, symbol: str, order_ids: List[int]) -> List[Dict[str, Any]]:
+        """Cancel up to 10 orders with one DELETE /fapi/v1/batchOrders"""
+        self.logger.info("Cancelling %s orders for %s", len(order_ids), symbol)
+        return self.client.futures_cancel_orders(
+            symbol=symbol,
+            orderIdList=json.dumps(order_ids)
+        )
+
+    # ------------------------------------------------------------------
+    # Async variants
+    #
+    # Each runs one attempt of the blocking call in a worker thread (the
+    # undecorated __wrapped__ function) and retries with asyncio.sleep, so
+    # backoff never blocks the event loop. They share the pooled session.
+    # ------------------------------------------------------------------
+
+    @async_retry_on_exception(
+        max_attempts=Settings.RETRY_ATTEMPTS,
+        delay=Settings.RETRY_DELAY,
+        backoff=Settings.BACKOFF_MULTIPLIER,
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
+    )
+    async def a_get_balance(self) -> Dict[str, float]:
+        """Async variant of get_balance()"""
+        return await asyncio.to_thread(BinanceConnector.get_balance.__wrapped__, self)
+
+    @async_retry_on_exception(
+        max_attempts=Settings.RETRY_ATTEMPTS,
+        delay=Settings.RETRY_DELAY,
+        backoff=Settings.BACKOFF_MULTIPLIER,
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
+    )
+    async def a_get_ticker_price(self, symbol: str) -> float:
+        """Async variant of get_ticker_price()"""
+        return await asyncio.to_thread(BinanceConnector.get_ticker_price.__wrapped__, self, symbol)
+
+    @async_retry_on_exception(
+        max_attempts=Settings.RETRY_ATTEMPTS,
+        delay=Settings.RETRY_DELAY,
+        backoff=Settings.BACKOFF_MULTIPLIER,
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
+    )
+    async def a_get_historical_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500,
+        start_time: Optional[int] = None
+    ) -> np.ndarray:
+        """Async variant of get_historical_klines()"""
+        return await asyncio.to_thread(
+            BinanceConnector.get_historical_klines.__wrapped__,
+            self, symbol, interval, limit, start_time
+        )
+
+    @async_retry_on_exception(
+        max_attempts=Settings.RETRY_ATTEMPTS,
+        delay=Settings.RETRY_DELAY,
+        backoff=Settings.BACKOFF_MULTIPLIER,
+        exceptions=(BinanceRequestException, BinanceAPIException),
+        max_delay=Settings.RETRY_MAX_DELAY,
+        unrecoverable_codes=Settings.UNRECOVERABLE_ERROR_CODES
+    )
+    async def a_get_open_positions(self, symbol: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Async variant of get_open_positions()"""
+        return await asyncio.to_thread(BinanceConnector.get_open_positions.__wrapped__, self, symbol)
@@ -0,0 +1,72 @@
+"""
+Compiled P/L kernels.
+
+Operate on the trader's position arrays (entry prices, quantities,
+directions and exit levels, one slot per open position). With numba
+installed (see src.utils.jit) the explicit signatures make them compile,
+or load from the on-disk cache, when this module is imported rather than
+on the first trading cycle. Neither holds the GIL while it runs.
+"""
+
+import numpy as np
+
+from src.utils.jit import njit
+
+
+@njit('float64[:](float64[:], float64[:], float64[:], float64)', cache=True, fastmath=True, nogil=True)
+def batch_pnl(entries: np.ndarray, qtys: np.ndarray, directions: np.ndarray, price: float):
+    """
+    Unrealized P/L of every position at price, in one pass.
+
+    Args:
+        entries: Entry prices
+        qtys: Position sizes
+        directions: 1.0 for LONG, -1.0 for SHORT
+        price: Current market price
+
+    Returns:
+        P/L array, one value per position
+    """
+    n = entries.shape[0]
+    pnl = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        pnl[i] = directions[i] * (price - entries[i]) * qtys[i]
+    return pnl
+
+
+@njit(
+    'boolean[:](float64[:], float64[:], float64[:], float64[:], float64)',
+    cache=True, fastmath=True, nogil=True
+)
+def price_level_hits(
+    entries: np.ndarray,
+    directions: np.ndarray,
+    stops: np.ndarray,
+    targets: np.ndarray,
+    price: float
+):
+    """
+    Which positions have price at or beyond their stop loss or take profit.
+
+    Like the strategies' should_exit(), a position is only checked when its
+    entry price, stop loss and take profit are all set (non-zero); the
+    others never trigger here.
+
+    Args:
+        entries: Entry prices
+        directions: 1.0 for LONG, -1.0 for SHORT
+        stops: Stop loss prices
+        targets: Take profit prices
+        price: Current market price
+
+    Returns:
+        Boolean array, True where a level was hit
+    """
+    n = directions.shape[0]
+    hits = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        if entries[i] == 0.0 or stops[i] == 0.0 or targets[i] == 0.0:
+            continue
+        d = directions[i]
+        hits[i] = d * (price - stops[i]) <= 0.0 or d * (price - targets[i]) >= 0.0
+    return hits
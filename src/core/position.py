@@ -0,0 +1,147 @@
+"""
+Position records tracked by the trader.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class Position:
+    """An open position held by the bot"""
+
+    side: str  # 'LONG' or 'SHORT'
+    direction: float  # 1.0 for LONG, -1.0 for SHORT
+    entry_price: float
+    quantity: float
+    stop_loss: float = 0.0
+    take_profit: float = 0.0
+    order_id: Optional[int] = None
+    close_side: str = field(init=False)  # Order side that closes it: 'SELL' or 'BUY'
+
+    def __post_init__(self):
+        self.close_side = 'SELL' if self.direction > 0 else 'BUY'
+
+    # Strategies read positions like dicts (position.get('side')); keep
+    # that working without giving up slot attributes in the trader
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field named key, or default if there is none"""
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+class PositionBook:
+    """
+    Open positions stored column-wise.
+
+    Entry prices, quantities, directions, stop losses and take profits live
+    in contiguous float64 arrays (slot i belongs to the i-th position) that
+    the P/L kernels read directly; the Position records are kept alongside
+    for strategies and notifications. Iterating, indexing and len() behave
+    like a list of Position records.
+    """
+
+    def __init__(self, capacity: int = 1):
+        """
+        Args:
+            capacity: Initial number of slots (grows on demand)
+        """
+        capacity = max(capacity, 1)
+        self.entry_price = np.empty(capacity, dtype=np.float64)
+        self.quantity = np.empty(capacity, dtype=np.float64)
+        self.direction = np.empty(capacity, dtype=np.float64)
+        self.stop_loss = np.empty(capacity, dtype=np.float64)
+        self.take_profit = np.empty(capacity, dtype=np.float64)
+        self.n = 0
+        self.version = 0  # Bumped on every change, for memoizing derived values
+        self._records: List[Position] = []
+        # (side, entry price in 1e-8 units) -> position, for O(1) lookups
+        self._index: Dict[tuple, Position] = {}
+
+    @staticmethod
+    def key(side: str, entry_price: float) -> tuple:
+        """Lookup key for a position; prices compared to 1e-8, not float equality"""
+        return side, round(entry_price * 1e8)
+
+    def add(self, position: Position):
+        """Append a position to the next free slot"""
+        n = self.n
+        if n == self.entry_price.shape[0]:
+            self.entry_price = np.resize(self.entry_price, 2 * n)
+            self.quantity = np.resize(self.quantity, 2 * n)
+            self.direction = np.resize(self.direction, 2 * n)
+            self.stop_loss = np.resize(self.stop_loss, 2 * n)
+            self.take_profit = np.resize(self.take_profit, 2 * n)
+        self.entry_price[n] = position.entry_price
+        self.quantity[n] = position.quantity
+        self.direction[n] = position.direction
+        self.stop_loss[n] = position.stop_loss
+        self.take_profit[n] = position.take_profit
+        self._records.append(position)
+        self._index[self.key(position.side, position.entry_price)] = position
+        self.n = n + 1
+        self.version += 1
+
+    def remove(self, position: Position) -> bool:
+        """
+        Drop a position, moving the last one into its slot.
+
+        Returns:
+            False if the position was not in the book
+        """
+        key = self.key(position.side, position.entry_price)
+        if key not in self._index:
+            return False
+        for i, tracked in enumerate(self._records):
+            if tracked is position:
+                break
+        else:
+            return False
+
+        last = self.n - 1
+        self.entry_price[i] = self.entry_price[last]
+        self.quantity[i] = self.quantity[last]
+        self.direction[i] = self.direction[last]
+        self.stop_loss[i] = self.stop_loss[last]
+        self.take_profit[i] = self.take_profit[last]
+        self._records[i] = self._records[last]
+        self._records.pop()
+        self.n = last
+        self.version += 1
+
+        if self._index.get(key) is position:
+            del self._index[key]
+            # Another position at the same side/price keeps the key
+            for tracked in self._records:
+                if self.key(tracked.side, tracked.entry_price) == key:
+                    self._index[key] = tracked
+                    break
+        return True
+
+    def clear(self):
+        """Drop every position"""
+        self._records = []
+        self._index = {}
+        self.n = 0
+        self.version += 1
+
+    def find(self, side: str, entry_price: float) -> Optional[Position]:
+        """Position with this side and entry price, if tracked"""
+        return self._index.get(self.key(side, entry_price))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(self._records)
+
+    def __getitem__(self, i: int) -> Position:
+        return self._records[i]
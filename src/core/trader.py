@@ -3,11 +3,20 @@ Main trading logic coordinator.
 Orchestrates strategy, risk management, and order execution.
 """
 
+import asyncio
+import math
+import queue
+import threading
 import time
+from datetime import date, datetime
 from typing import Optional, Dict, Any
 
+import numpy as np
+
 from config.settings import Settings
 from src.core.exchange import BinanceConnector
+from src.core.position import Position, PositionBook
+from src.core import pnl_kernels
 from src.data.market_data import MarketData
 from src.strategies.base_strategy import BaseStrategy
 from src.risk.position_manager import PositionManager
@@ -37,10 +46,25 @@ class Trader:
         Args:
             strategy: Trading strategy instance
         """
-        self.logger = get_logger(__name__, Settings.LOGS_DIR)
+        self.logger = get_logger(__name__, Settings.LOGS_DIR_STR)
         self.strategy = strategy
         self.symbol = Settings.TRADING_PAIR
 
+        # Settings read every cycle, bound once
+        self._update_interval = Settings.UPDATE_INTERVAL
+        self._max_update_interval = Settings.MAX_UPDATE_INTERVAL
+        self._timeframe = Settings.TIMEFRAME
+        self._max_leverage = Settings.MAX_LEVERAGE
+        self._max_daily_loss_pct = Settings.MAX_DAILY_LOSS_PERCENT
+        self._max_positions = getattr(Settings, 'MAX_OPEN_POSITIONS', 1)
+
+        # Strategy capabilities, checked once instead of on every status call
+        self._strategy_name = getattr(strategy, 'name', "Unknown")
+        self._has_regime = hasattr(strategy, 'current_regime')
+        self._regime_is_enum = self._has_regime and hasattr(strategy.current_regime, 'value')
+        self._has_regime_confidence = hasattr(strategy, 'regime_confidence')
+        self._exits_at_price_levels = getattr(strategy, 'exits_at_price_levels', False)
+
         # Initialize components
         self.logger.info("Initializing trading bot components...")
         self.exchange = BinanceConnector()
@@ -50,23 +74,63 @@ class Trader:
         # Set initial configuration
         self._setup_exchange()
 
-        # Track positions (support multiple)
-        self.positions: list[Dict[str, Any]] = []
-        self.current_position: Optional[Dict[str, Any]] = None  # Primary position for compatibility
+        # Track positions (support multiple), stored column-wise for the P/L kernels
+        self.positions = PositionBook(self._max_positions)
+
+        # Unrealized P/L memo: ((price, positions version), total)
+        self._cached_pnl: tuple = (None, 0.0)
 
         # Trading state
         self.trading_paused = False
         self.iteration = 0
         self.current_price = 0.0
         self.balance_info = {"total": 0, "available": 0}
+        self._daily_limit_notified_date: Optional[date] = None  # Re-arms each day
+
+        # Polling interval, stretched while no signal is near
+        self._interval_factor = 1.0
+        self._next_sleep = float(self._update_interval)
+        self._cycle_started = time.monotonic()
+
+        # Event loop reused by every cycle's concurrent fetch, so its
+        # default executor threads (asyncio.to_thread) stay warm instead of
+        # being created and torn down by asyncio.run() each cycle
+        self._loop = asyncio.new_event_loop()
+
+        # Last values pushed to the dashboard, to send only what changed
+        self._last_dashboard_snapshot: Dict[str, Any] = {}
+
+        # Dashboard log lines buffered during an iteration, pushed in one batch
+        self._dashboard_logs: list = []
+
+        # Telegram notifications are sent from a background thread so their
+        # HTTPS round trips never delay orders
+        self._notify_q: queue.Queue = queue.Queue()
+        self._notify_thread = threading.Thread(
+            target=self._notify_worker, name='notifier', daemon=True
+        )
+        self._notify_thread.start()
+
+        # Exits submitted in the background: client order ID ->
+        # (position, order side, signal price), and their reported outcomes
+        # waiting to be settled on the trading thread
+        self._pending_exits: Dict[str, tuple] = {}
+        self._exit_results: queue.Queue = queue.Queue()
+
+        # Wake the loop as soon as a candle closes or an exit order reports
+        # back instead of sleeping blindly
+        self._wake_up = threading.Event()
+        self._kline_stream = self.exchange.start_kline_stream(
+            self.symbol, self._timeframe, self._on_kline
+        )
 
         # Setup Telegram command handler
         self._setup_telegram_commands()
 
-        self.logger.info(f"Trader initialized with {strategy.name} strategy")
-        self.logger.info(f"Trading pair: {self.symbol}")
-        self.logger.info(f"Timeframe: {Settings.TIMEFRAME}")
-        self.logger.info(f"Max leverage: {Settings.MAX_LEVERAGE}x")
+        self.logger.info("Trader initialized with %s strategy", strategy.name)
+        self.logger.info("Trading pair: %s", self.symbol)
+        self.logger.info("Timeframe: %s", Settings.TIMEFRAME)
+        self.logger.info("Max leverage: %sx", Settings.MAX_LEVERAGE)
 
     def _setup_exchange(self):
         """Setup exchange configuration (leverage, margin type)"""
@@ -80,9 +144,14 @@ class Trader:
             self.logger.info("Exchange configuration completed")
 
         except Exception as e:
-            self.logger.error(f"Failed to setup exchange: {e}", exc_info=True)
+            self.logger.error("Failed to setup exchange: %s", e, exc_info=True)
             raise
 
+    @property
+    def current_position(self) -> Optional[Position]:
+        """Primary (oldest) open position, for single-position code paths"""
+        return self.positions[0] if self.positions else None
+
     def _setup_telegram_commands(self):
         """Setup Telegram command handler with callbacks"""
         command_handler.set_callbacks(
@@ -98,15 +167,14 @@ class Trader:
 
     def _get_status_for_telegram(self) -> Dict[str, Any]:
         """Get status info for Telegram command"""
-        # Get strategy info if available
-        strategy_name = self.strategy.name if hasattr(self.strategy, 'name') else "Unknown"
         market_regime = "N/A"
         regime_confidence = 0
 
-        # Check if adaptive strategy with regime info
-        if hasattr(self.strategy, 'current_regime'):
-            market_regime = self.strategy.current_regime.value if hasattr(self.strategy.current_regime, 'value') else str(self.strategy.current_regime)
-        if hasattr(self.strategy, 'regime_confidence'):
+        # Adaptive strategy with regime info
+        if self._has_regime:
+            regime = self.strategy.current_regime
+            market_regime = regime.value if self._regime_is_enum else str(regime)
+        if self._has_regime_confidence:
             regime_confidence = self.strategy.regime_confidence
 
         return {
@@ -114,9 +182,9 @@ class Trader:
             "iteration": self.iteration,
             "current_price": self.current_price,
             "has_position": self.current_position is not None,
-            "position_side": self.current_position.get("side") if self.current_position else None,
+            "position_side": self.current_position.side if self.current_position else None,
             "unrealized_pnl": self._calculate_unrealized_pnl(self.current_price) if self.current_position else 0,
-            "strategy_name": strategy_name,
+            "strategy_name": self._strategy_name,
             "market_regime": market_regime,
             "regime_confidence": regime_confidence
         }
@@ -139,11 +207,11 @@ class Trader:
         if self.current_position:
             return {
                 "has_position": True,
-                "side": self.current_position.get("side"),
-                "entry_price": self.current_position.get("entry_price", 0),
-                "quantity": self.current_position.get("quantity", 0),
-                "stop_loss": self.current_position.get("stop_loss", 0),
-                "take_profit": self.current_position.get("take_profit", 0),
+                "side": self.current_position.side,
+                "entry_price": self.current_position.entry_price,
+                "quantity": self.current_position.quantity,
+                "stop_loss": self.current_position.stop_loss,
+                "take_profit": self.current_position.take_profit,
                 "unrealized_pnl": self._calculate_unrealized_pnl(self.current_price)
             }
         return {"has_position": False}
@@ -159,14 +227,61 @@ class Trader:
         self.logger.info("Trading resumed via Telegram command")
 
     def _update_dashboard_state(self, **kwargs):
-        """Update dashboard state if enabled."""
-        if DASHBOARD_ENABLED and bot_state:
-            bot_state.update(**kwargs)
+        """Update dashboard state if enabled, sending only changed values."""
+        if not (DASHBOARD_ENABLED and bot_state):
+            return
+
+        last = self._last_dashboard_snapshot
+        delta = {
+            key: value for key, value in kwargs.items()
+            if key not in last or not self._same_dashboard_value(last[key], value)
+        }
+        if not delta:
+            return
+
+        bot_state.update(**delta)
+        last.update(delta)
+
+    @staticmethod
+    def _same_dashboard_value(old: Any, new: Any) -> bool:
+        """Equality for dashboard values, tolerant of float jitter."""
+        if isinstance(old, float) and isinstance(new, float):
+            # Sub-micro moves in price or P/L are not visible on the dashboard
+            return abs(new - old) <= 1e-6
+        return old == new
 
     def _add_dashboard_log(self, level: str, message: str):
-        """Add log to dashboard if enabled."""
+        """Queue a dashboard log line; sent by _flush_dashboard_logs()."""
         if DASHBOARD_ENABLED and bot_state:
-            bot_state.add_log(level, message)
+            self._dashboard_logs.append((datetime.now().isoformat(), level, message))
+
+    def _flush_dashboard_logs(self):
+        """Push the buffered dashboard log lines in one batch."""
+        if self._dashboard_logs:
+            logs, self._dashboard_logs = self._dashboard_logs, []
+            bot_state.add_logs(logs)
+
+    def _notify(self, method: str, *args, **kwargs):
+        """
+        Queue a notifier call for the background notification thread.
+
+        Args:
+            method: Name of the TelegramNotifier method (e.g. 'notify_trade_entry')
+            *args, **kwargs: Arguments for that method
+        """
+        self._notify_q.put((method, args, kwargs))
+
+    def _notify_worker(self):
+        """Send queued notifications in order until a None sentinel arrives"""
+        while True:
+            item = self._notify_q.get()
+            if item is None:
+                return
+            method, args, kwargs = item
+            try:
+                getattr(notifier, method)(*args, **kwargs)
+            except Exception as e:
+                self.logger.error("Failed to send %s notification: %s", method, e)
 
     def run_trading_loop(self):
         """
@@ -178,126 +293,175 @@ class Trader:
         self.logger.info("=" * 60)
 
         # Send Telegram notification
-        notifier.notify_bot_start()
+        self._notify('notify_bot_start')
 
         try:
             while True:
+                self._cycle_started = time.monotonic()
                 self.iteration += 1
-                self.logger.info(f"\n--- Iteration {self.iteration} ---")
+                self.logger.info("\n--- Iteration %s ---", self.iteration)
                 self._add_dashboard_log("INFO", f"Starting iteration {self.iteration}")
 
-                # Update iteration in dashboard
-                self._update_dashboard_state(iteration=self.iteration)
-
                 # Check if trading is paused
                 if self.trading_paused:
                     self.logger.info("Trading paused. Waiting...")
+                    self._update_dashboard_state(iteration=self.iteration)
                 else:
+                    # The cycle pushes the iteration with the rest of its state
                     # Execute one trading cycle
                     self._execute_trading_cycle()
 
+                self._flush_dashboard_logs()
+
                 # Wait before next iteration
-                self.logger.info(
-                    f"Waiting {Settings.UPDATE_INTERVAL} seconds until next update..."
-                )
-                time.sleep(Settings.UPDATE_INTERVAL)
+                self._wait_for_next_cycle()
 
         except KeyboardInterrupt:
             self.logger.info("\nShutdown signal received. Closing gracefully...")
             self._shutdown("User requested")
         except Exception as e:
-            self.logger.error(f"Critical error in trading loop: {e}", exc_info=True)
-            notifier.notify_error("Critical Error", str(e))
+            self.logger.error("Critical error in trading loop: %s", e, exc_info=True)
+            self._notify('notify_error', "Critical Error", str(e))
             self._shutdown(f"Critical error: {str(e)}")
             raise
 
+    def _on_kline(self, msg: Dict[str, Any]):
+        """Kline stream callback: wake the trading loop when a candle closes"""
+        kline = msg.get('k') if isinstance(msg, dict) else None
+        if kline and kline.get('x'):
+            self._wake_up.set()
+
+    def _wait_for_next_cycle(self):
+        """
+        Wait until the next candle closes, an exit order reports back or
+        the adaptive interval elapses.
+
+        The interval is measured from the start of the cycle, so the period
+        does not drift by the cycle's own duration. A cycle that overran its
+        interval starts the next one immediately, without catch-up cycles.
+        """
+        interval = max(0.0, self._cycle_started + self._next_sleep - time.monotonic())
+        if self._kline_stream:
+            self.logger.info(
+                "Waiting up to %.0f seconds for the next candle close...", interval
+            )
+        else:
+            self.logger.info("Waiting %.0f seconds until next update...", interval)
+        if self._wake_up.wait(interval):
+            self._wake_up.clear()
+
+    def _update_poll_interval(self, ema_fast: float, ema_slow: float, rsi: float, price: float):
+        """
+        Pick the next polling interval from how close a signal looks.
+
+        Near an EMA crossover (gap under 0.1% of price), with RSI outside the
+        40-60 band, or with a position open, poll every UPDATE_INTERVAL.
+        Otherwise stretch the interval by 1.5x per quiet cycle, up to 8x and
+        never beyond MAX_UPDATE_INTERVAL.
+        """
+        near_signal = (
+            bool(self.positions)
+            or not (price > 0 and abs(ema_fast - ema_slow) / price >= 0.001)
+            or not (40 <= rsi <= 60)
+        )
+        if near_signal:
+            self._interval_factor = 1.0
+        else:
+            self._interval_factor = min(8.0, self._interval_factor * 1.5)
+        self._next_sleep = min(
+            float(self._max_update_interval),
+            self._update_interval * self._interval_factor
+        )
+
+    async def _fetch_cycle_inputs(self):
+        """
+        Fetch the independent reads a cycle needs concurrently.
+
+        Returns:
+            (balance_info, klines DataFrame, current price, open positions)
+        """
+        return await asyncio.gather(
+            self.exchange.a_get_balance(),
+            self.market_data.a_get_klines_incremental(self.symbol, self._timeframe, limit=100),
+            self.exchange.a_get_ticker_price(self.symbol),
+            self.exchange.a_get_open_positions(self.symbol)
+        )
+
     def _execute_trading_cycle(self):
         """Execute one complete trading cycle"""
+        # Dashboard values collected over the cycle and pushed once at the end
+        state: Dict[str, Any] = {'iteration': self.iteration}
         try:
-            # 1. Get current balance
-            balance_info = self.exchange.get_balance()
+            # Record exits whose close orders filled since the last cycle
+            self._settle_exits()
+
+            # 1. Fetch balance, market data, price and positions in one round trip
+            balance_info, df, current_price, open_positions = self._loop.run_until_complete(
+                self._fetch_cycle_inputs()
+            )
             current_balance = balance_info['available']
             self.balance_info = balance_info  # Store for Telegram commands
 
             self.logger.log_balance(balance_info['total'], balance_info['available'])
 
-            # Update dashboard with balance
-            self._update_dashboard_state(
-                balance_total=balance_info['total'],
-                balance_available=balance_info['available']
-            )
+            state['balance_total'] = balance_info['total']
+            state['balance_available'] = balance_info['available']
 
             # 2. Check if we can trade today (daily loss limit)
             if not self.position_manager.check_daily_loss_limit():
                 self.logger.warning("Daily loss limit reached. No trading today.")
 
-                # Notify via Telegram (only once)
-                if not hasattr(self, '_daily_limit_notified'):
+                # Notify via Telegram (once per day)
+                today = date.today()
+                if self._daily_limit_notified_date != today:
                     stats = self.position_manager.get_daily_stats()
-                    notifier.notify_daily_loss_limit(
+                    self._notify(
+                        'notify_daily_loss_limit',
                         abs(stats['daily_pnl']),
-                        Settings.MAX_DAILY_LOSS_PERCENT
+                        self._max_daily_loss_pct
                     )
-                    self._daily_limit_notified = True
+                    self._daily_limit_notified_date = today
 
                 return
 
-            # 3. Get market data
-            df = self.market_data.get_klines_dataframe(
-                self.symbol,
-                Settings.TIMEFRAME,
-                limit=100
-            )
-
-            # 4. Add technical indicators
-            df = self.market_data.add_all_indicators(df)
-
-            # 5. Get current price
-            current_price = self.exchange.get_ticker_price(self.symbol)
+            # 3. Current price
             self.current_price = current_price  # Store for Telegram commands
-            self.logger.info(f"Current {self.symbol} price: ${current_price:.2f}")
-
-            # Update dashboard with price and indicators
-            self._update_dashboard_state(
-                current_price=current_price,
-                ema_fast=float(df['ema_fast'].iloc[-1]) if 'ema_fast' in df.columns else 0,
-                ema_slow=float(df['ema_slow'].iloc[-1]) if 'ema_slow' in df.columns else 0,
-                rsi=float(df['rsi'].iloc[-1]) if 'rsi' in df.columns else 0
-            )
+            self.logger.info("Current %s price: $%.2f", self.symbol, current_price)
+            state['current_price'] = current_price
 
-            # 6. Check for open positions
-            open_positions = self.exchange.get_open_positions()
-            has_open_position = any(
-                pos['symbol'] == self.symbol and float(pos['positionAmt']) != 0
-                for pos in open_positions
-            )
+            # 4. Check for open positions
+            exchange_position = open_positions.get(self.symbol)
+            has_open_position = exchange_position is not None
 
             # Update position tracking
             if has_open_position:
                 # Sync any new positions from exchange
                 if not self.positions:
-                    self._sync_position_from_exchange(open_positions)
+                    self._sync_position_from_exchange(exchange_position)
             else:
                 # No positions on exchange, clear our tracking
-                if self.positions or self.current_position:
-                    self.positions = []
-                    self.current_position = None
+                if self.positions:
+                    self.positions.clear()
                     self.strategy.set_position(None)
 
-            # Update dashboard with position info
+            # Unrealized P/L at this cycle's price, computed once
+            unrealized_pnl = (
+                self._calculate_unrealized_pnl(current_price) if self.current_position else 0.0
+            )
+
+            # Position info for the dashboard
             if self.current_position:
-                unrealized_pnl = self._calculate_unrealized_pnl(current_price)
-                self._update_dashboard_state(
+                state.update(
                     has_position=True,
-                    position_side=self.current_position['side'],
-                    position_entry_price=self.current_position['entry_price'],
-                    position_quantity=self.current_position['quantity'],
+                    position_side=self.current_position.side,
+                    position_entry_price=self.current_position.entry_price,
+                    position_quantity=self.current_position.quantity,
                     position_unrealized_pnl=unrealized_pnl,
-                    position_stop_loss=self.current_position.get('stop_loss', 0),
-                    position_take_profit=self.current_position.get('take_profit', 0)
+                    position_stop_loss=self.current_position.stop_loss,
+                    position_take_profit=self.current_position.take_profit
                 )
             else:
-                self._update_dashboard_state(
+                state.update(
                     has_position=False,
                     position_side=None,
                     position_entry_price=0,
@@ -307,31 +471,63 @@ class Trader:
                     position_take_profit=0
                 )
 
-            # 7. Evaluate strategy - Check exits for all positions AND look for new entries
-            # Always check exit conditions for open positions
-            if self.positions:
-                self._check_all_exit_conditions(df, current_price)
-
-            # Always check for new entry opportunities if we have room for more positions
+            # Indicators are only needed to manage open positions or to look
+            # for an entry; skip them when neither can happen this cycle
             num_positions = len(self.positions)
-            max_positions = getattr(Settings, 'MAX_OPEN_POSITIONS', 1)
-            if num_positions < max_positions:
-                self.logger.info(f"[POSITIONS] {num_positions}/{max_positions} - Looking for entry signals...")
-                self._check_entry_conditions(df, current_price, current_balance)
+            max_positions = self._max_positions
+            can_enter = (
+                num_positions < max_positions
+                and self.position_manager.can_open_position(num_positions)
+            )
+
+            if self.positions or can_enter:
+                # 5. Add technical indicators
+                df = self.market_data.add_all_indicators(df)
+
+                # Indicators for the dashboard, from the indicator step's arrays
+                latest = self.market_data.latest_indicators()
+                state.update(
+                    ema_fast=latest.get('ema_fast', 0.0),
+                    ema_slow=latest.get('ema_slow', 0.0),
+                    rsi=latest.get('rsi', 0.0)
+                )
+
+                # 6. Evaluate strategy - Check exits for all positions AND look for new entries
+                # Always check exit conditions for open positions
+                if self.positions:
+                    self._check_all_exit_conditions(df, current_price)
+
+                # Look for new entry opportunities if we have room for more positions
+                if can_enter:
+                    self.logger.info(
+                        "[POSITIONS] %s/%s - Looking for entry signals...", num_positions, max_positions
+                    )
+                    self._check_entry_conditions(df, current_price, current_balance)
+                else:
+                    self.logger.debug(
+                        "Not looking for new entries (%s/%s positions)", num_positions, max_positions
+                    )
+
+                # Poll faster when a signal is near, slower when the market is quiet
+                self._update_poll_interval(
+                    state['ema_fast'], state['ema_slow'], state['rsi'], current_price
+                )
             else:
-                self.logger.debug(f"Max positions ({max_positions}) reached, not looking for new entries")
+                self.logger.debug(
+                    "No open positions and no room for entries (%s/%s), skipping indicators",
+                    num_positions, max_positions
+                )
 
-            # 8. Log daily stats
+            # 7. Log daily stats
             stats = self.position_manager.get_daily_stats()
             if stats['total_trades'] > 0:
                 self.logger.info(
-                    f"Daily Stats: Trades: {stats['total_trades']}, "
-                    f"Win Rate: {stats['win_rate']:.1f}%, "
-                    f"P/L: ${stats['daily_pnl']:.2f}"
+                    "Daily Stats: Trades: %s, Win Rate: %.1f%%, P/L: $%.2f",
+                    stats['total_trades'], stats['win_rate'], stats['daily_pnl']
                 )
 
-            # Update dashboard with daily stats
-            self._update_dashboard_state(
+            # Daily stats for the dashboard
+            state.update(
                 daily_trades=stats['total_trades'],
                 daily_wins=stats['winning_trades'],
                 daily_losses=stats['losing_trades'],
@@ -340,9 +536,13 @@ class Trader:
             )
 
         except Exception as e:
-            self.logger.error(f"Error in trading cycle: {e}", exc_info=True)
+            self.logger.error("Error in trading cycle: %s", e, exc_info=True)
             self._add_dashboard_log("ERROR", f"Trading cycle error: {e}")
 
+        finally:
+            # Single dashboard update per cycle, including early returns
+            self._update_dashboard_state(**state)
+
     def _check_entry_conditions(
         self,
         df,
@@ -352,19 +552,13 @@ class Trader:
         """
         Check if entry conditions are met and execute entry.
 
+        The caller has already checked position_manager.can_open_position().
+
         Args:
             df: Market data DataFrame
             current_price: Current market price
             available_balance: Available balance for trading
         """
-        # Count current open positions
-        current_positions = len(self.positions)
-
-        # Check if we can open a new position
-        if not self.position_manager.can_open_position(current_positions):
-            self.logger.debug(f"Cannot open new position (current: {current_positions})")
-            return
-
         # Get entry signal from strategy
         signal = self.strategy.should_enter(df, current_price)
 
@@ -372,7 +566,7 @@ class Trader:
             self.logger.debug("No entry signal")
             return
 
-        self.logger.info(f"Entry signal detected: {signal}")
+        self.logger.info("Entry signal detected: %s", signal)
 
         # Calculate position parameters
         stop_loss_price = self.strategy.get_stop_loss(current_price, signal)
@@ -383,7 +577,7 @@ class Trader:
             capital=available_balance,
             entry_price=current_price,
             stop_loss_price=stop_loss_price,
-            leverage=Settings.MAX_LEVERAGE
+            leverage=self._max_leverage
         )
 
         if position_size == 0:
@@ -398,9 +592,8 @@ class Trader:
         )
 
         self.logger.info(
-            f"Position parameters: Size: {position_size}, "
-            f"SL: ${stop_loss_price:.2f}, TP: ${take_profit_price:.2f}, "
-            f"R/R: 1:{rr_ratio:.2f}"
+            "Position parameters: Size: %s, SL: $%.2f, TP: $%.2f, R/R: 1:%.2f",
+            position_size, stop_loss_price, take_profit_price, rr_ratio
         )
 
         # Execute entry order
@@ -445,29 +638,27 @@ class Trader:
             )
 
             # Store position information
-            new_position = {
-                'side': side,
-                'entry_price': entry_price,
-                'quantity': quantity,
-                'stop_loss': stop_loss,
-                'take_profit': take_profit,
-                'order_id': order['orderId']
-            }
+            new_position = Position(
+                side=side,
+                direction=1.0 if side == 'LONG' else -1.0,
+                entry_price=entry_price,
+                quantity=quantity,
+                stop_loss=stop_loss,
+                take_profit=take_profit,
+                order_id=order['orderId']
+            )
 
             # Add to positions list
-            self.positions.append(new_position)
-
-            # Update current_position for compatibility (primary position)
-            if not self.current_position:
-                self.current_position = new_position
+            self.positions.add(new_position)
 
             # Update strategy
             self.strategy.set_position(new_position)
 
-            self.logger.info(f"Position opened successfully: {side} {quantity} {self.symbol}")
+            self.logger.info("Position opened successfully: %s %s %s", side, quantity, self.symbol)
 
             # Send Telegram notification
-            notifier.notify_trade_entry(
+            self._notify(
+                'notify_trade_entry',
                 side=side,
                 price=entry_price,
                 quantity=quantity,
@@ -479,7 +670,7 @@ class Trader:
             self._add_dashboard_log("INFO", f"Opened {side} position: {quantity} @ ${entry_price:.2f}")
 
         except Exception as e:
-            self.logger.error(f"Failed to execute entry: {e}", exc_info=True)
+            self.logger.error("Failed to execute entry: %s", e, exc_info=True)
             self._add_dashboard_log("ERROR", f"Failed to execute entry: {e}")
 
     def _check_all_exit_conditions(self, df, current_price: float):
@@ -490,167 +681,90 @@ class Trader:
             df: Market data DataFrame
             current_price: Current market price
         """
-        # Make a copy to avoid modifying list while iterating
-        positions_to_check = self.positions.copy()
+        # P/L of every position in one pass
+        book = self.positions
+        n = book.n
+        pnls = pnl_kernels.batch_pnl(
+            book.entry_price[:n], book.quantity[:n], book.direction[:n], current_price
+        )
 
-        for i, position in enumerate(positions_to_check):
-            # Calculate P/L for this position
-            pnl = self._calculate_position_pnl(position, current_price)
-            pnl_percent = (pnl / (position['entry_price'] * position['quantity'])) * 100
+        # Stop loss / take profit hits in the same pass, when the strategy
+        # leaves those to us. Same gates as its should_exit(): positions
+        # missing a level are left to should_exit(), which refuses them
+        if (
+            self._exits_at_price_levels
+            and self.strategy.has_position()
+            and self.strategy.validate_signal(df)
+        ):
+            level_hits = pnl_kernels.price_level_hits(
+                book.entry_price[:n], book.direction[:n],
+                book.stop_loss[:n], book.take_profit[:n], current_price
+            )
+        else:
+            level_hits = None
+
+        # Exits are only submitted here and settled by _settle_exits() at
+        # the start of the next cycle, so the book can be walked in place
+        for i, position in enumerate(book):
+            pnl = float(pnls[i])
 
             # Log position status
             self.logger.log_position(
                 symbol=self.symbol,
-                side=position['side'],
-                quantity=position['quantity'],
-                entry_price=position['entry_price'],
+                side=position.side,
+                quantity=position.quantity,
+                entry_price=position.entry_price,
                 current_price=current_price,
                 unrealized_pnl=pnl
             )
 
+            if level_hits is not None and level_hits[i]:
+                self.logger.info("Stop loss/take profit hit for position #%s", i + 1)
+                self._execute_exit_for_position(position, current_price)
+                continue
+
             # Check if strategy signals exit for this position
             should_exit = self.strategy.should_exit(df, current_price, position)
 
             if should_exit:
-                self.logger.info(f"Exit signal detected for position #{i+1}")
+                self.logger.info("Exit signal detected for position #%s", i + 1)
                 self._execute_exit_for_position(position, current_price)
 
-    def _check_exit_conditions(self, df, current_price: float):
-        """
-        Check if exit conditions are met and execute exit (legacy single position).
-
-        Args:
-            df: Market data DataFrame
-            current_price: Current market price
-        """
-        if not self.current_position:
-            return
-
-        # Log current position status
-        self.logger.log_position(
-            symbol=self.symbol,
-            side=self.current_position['side'],
-            quantity=self.current_position['quantity'],
-            entry_price=self.current_position['entry_price'],
-            current_price=current_price,
-            unrealized_pnl=self._calculate_unrealized_pnl(current_price)
-        )
-
-        # Check if strategy signals exit
-        should_exit = self.strategy.should_exit(df, current_price, self.current_position)
-
-        if should_exit:
-            self.logger.info("Exit signal detected")
-            self._execute_exit(current_price)
-
-    def _execute_exit(self, exit_price: float):
-        """
-        Execute exit order.
-
-        Args:
-            exit_price: Exit price
-        """
-        try:
-            if not self.current_position:
-                return
-
-            # Determine order side (opposite of position)
-            order_side = 'SELL' if self.current_position['side'] == 'LONG' else 'BUY'
-
-            # Place market order to close position
-            order = self.exchange.place_market_order(
-                symbol=self.symbol,
-                side=order_side,
-                quantity=self.current_position['quantity']
-            )
-
-            # Calculate profit/loss
-            pnl = self._calculate_unrealized_pnl(exit_price)
-            entry_price = self.current_position['entry_price']
-            pnl_percent = (pnl / (entry_price * self.current_position['quantity'])) * 100
-
-            # Log trade
-            self.logger.log_trade(
-                side=order_side,
-                symbol=self.symbol,
-                price=exit_price,
-                quantity=self.current_position['quantity'],
-                profit=pnl,
-                trade_type='CLOSE'
-            )
-
-            # Record trade in position manager
-            self.position_manager.record_trade(pnl)
-
-            self.logger.info(
-                f"Position closed successfully. P/L: "
-                f"{'+ $' if pnl > 0 else '- $'}{abs(pnl):.2f}"
-            )
-
-            # Send Telegram notification
-            notifier.notify_trade_exit(
-                side=self.current_position['side'],
-                entry_price=entry_price,
-                exit_price=exit_price,
-                quantity=self.current_position['quantity'],
-                pnl=pnl,
-                pnl_percent=pnl_percent,
-                reason="Strategy Signal"
-            )
-
-            # Update dashboard with trade
-            self._add_dashboard_log(
-                "INFO",
-                f"Closed {self.current_position['side']} position @ ${exit_price:.2f} | P/L: ${pnl:.2f}"
-            )
-
-            # Add trade to history
-            if DASHBOARD_ENABLED and bot_state:
-                bot_state.add_trade({
-                    "side": self.current_position['side'],
-                    "entry_price": entry_price,
-                    "exit_price": exit_price,
-                    "quantity": self.current_position['quantity'],
-                    "pnl": pnl,
-                    "pnl_percent": pnl_percent
-                })
-
-            # Clear position
-            self.current_position = None
-            self.strategy.set_position(None)
-
-        except Exception as e:
-            self.logger.error(f"Failed to execute exit: {e}", exc_info=True)
-            self._add_dashboard_log("ERROR", f"Failed to execute exit: {e}")
-
     def _calculate_unrealized_pnl(self, current_price: float) -> float:
         """
         Calculate total unrealized profit/loss for all positions.
 
+        The result is memoized per (price, positions) so the dashboard and
+        the Telegram callbacks share one computation per tick.
+
         Args:
             current_price: Current market price
 
         Returns:
             Total Unrealized P/L
         """
-        total_pnl = 0.0
-
-        # Calculate for all positions
-        for position in self.positions:
-            total_pnl += self._calculate_position_pnl(position, current_price)
-
-        # Also include current_position for compatibility
-        if self.current_position and self.current_position not in self.positions:
-            total_pnl += self._calculate_position_pnl(self.current_position, current_price)
-
+        book = self.positions
+        key = (current_price, book.version)
+        cached_key, cached_total = self._cached_pnl
+        if cached_key == key:
+            return cached_total
+
+        # One dot product over the position arrays
+        n = book.n
+        total_pnl = float(np.dot(
+            book.direction[:n] * book.quantity[:n],
+            current_price - book.entry_price[:n]
+        ))
+
+        self._cached_pnl = (key, total_pnl)
         return total_pnl
 
-    def _calculate_position_pnl(self, position: Dict[str, Any], current_price: float) -> float:
+    def _calculate_position_pnl(self, position: Position, current_price: float) -> float:
         """
         Calculate unrealized profit/loss for a specific position.
 
         Args:
-            position: Position dictionary
+            position: Open position
             current_price: Current market price
 
         Returns:
@@ -659,147 +773,170 @@ class Trader:
         if not position:
             return 0.0
 
-        entry_price = position['entry_price']
-        quantity = position['quantity']
-        side = position['side']
-
-        if side == 'LONG':
-            pnl = (current_price - entry_price) * quantity
-        else:  # SHORT
-            pnl = (entry_price - current_price) * quantity
-
-        return pnl
+        # direction is +1 for LONG, -1 for SHORT (set when the position opens)
+        return position.direction * (current_price - position.entry_price) * position.quantity
 
-    def _execute_exit_for_position(self, position: Dict[str, Any], exit_price: float):
+    def _execute_exit_for_position(self, position: Position, exit_price: float):
         """
-        Execute exit order for a specific position.
+        Submit the close order for a position without waiting for it.
+
+        The trade is recorded by _settle_exits() once the fill is reported,
+        priced at the fill's average price.
 
         Args:
             position: Position to close
-            exit_price: Exit price
+            exit_price: Price at the exit signal (used if the fill has none)
         """
+        if any(pending[0] is position for pending in self._pending_exits.values()):
+            self.logger.info("Close order already in flight for this position")
+            return
+
         try:
-            # Determine order side (opposite of position)
-            order_side = 'SELL' if position['side'] == 'LONG' else 'BUY'
+            # Opposite of the position, fixed when it was opened
+            order_side = position.close_side
 
-            # Place market order to close position
-            order = self.exchange.place_market_order(
+            # Place market order to close position in the background
+            client_order_id = self.exchange.submit_market_order(
                 symbol=self.symbol,
                 side=order_side,
-                quantity=position['quantity']
+                quantity=position.quantity,
+                on_done=self._on_exit_done
             )
+            self._pending_exits[client_order_id] = (position, order_side, exit_price)
 
-            # Calculate profit/loss
-            pnl = self._calculate_position_pnl(position, exit_price)
-            entry_price = position['entry_price']
-            pnl_percent = (pnl / (entry_price * position['quantity'])) * 100
+        except Exception as e:
+            self.logger.error("Failed to execute exit: %s", e, exc_info=True)
+            self._add_dashboard_log("ERROR", f"Failed to execute exit: {e}")
 
-            # Log trade
-            self.logger.log_trade(
-                side=order_side,
-                symbol=self.symbol,
-                price=exit_price,
-                quantity=position['quantity'],
-                profit=pnl,
-                trade_type='CLOSE'
-            )
+    def _on_exit_done(self, client_order_id: str, fill: Optional[Dict[str, Any]], error: Optional[Exception]):
+        """Exchange callback (background thread): queue the outcome and wake the loop"""
+        self._exit_results.put((client_order_id, fill, error))
+        self._wake_up.set()
+
+    def _settle_exits(self):
+        """Record every background exit that has reported back"""
+        while True:
+            try:
+                client_order_id, fill, error = self._exit_results.get_nowait()
+            except queue.Empty:
+                return
 
-            # Record trade in position manager
-            self.position_manager.record_trade(pnl)
+            context = self._pending_exits.pop(client_order_id, None)
+            if context is None:
+                continue
+            position, order_side, signal_price = context
 
-            self.logger.info(
-                f"Position closed successfully. P/L: "
-                f"{'+ $' if pnl > 0 else '- $'}{abs(pnl):.2f}"
-            )
+            if error is not None:
+                # Position stays tracked; the next exit signal retries
+                self.logger.error("Failed to execute exit: %s", error)
+                self._add_dashboard_log("ERROR", f"Failed to execute exit: {error}")
+                continue
 
-            # Send Telegram notification
-            notifier.notify_trade_exit(
-                side=position['side'],
-                entry_price=entry_price,
-                exit_price=exit_price,
-                quantity=position['quantity'],
-                pnl=pnl,
-                pnl_percent=pnl_percent,
-                reason="Strategy Signal"
-            )
+            self._record_exit(position, order_side, fill['avg_price'] or signal_price)
 
-            # Update dashboard with trade
-            self._add_dashboard_log(
-                "INFO",
-                f"Closed {position['side']} position @ ${exit_price:.2f} | P/L: ${pnl:.2f}"
-            )
+    def _record_exit(self, position: Position, order_side: str, exit_price: float):
+        """
+        Book a closed position: P/L, logs, notifications and tracking.
 
-            # Add trade to history
-            if DASHBOARD_ENABLED and bot_state:
-                bot_state.add_trade({
-                    "side": position['side'],
-                    "entry_price": entry_price,
-                    "exit_price": exit_price,
-                    "quantity": position['quantity'],
-                    "pnl": pnl,
-                    "pnl_percent": pnl_percent
-                })
-
-            # Remove position from list
-            if position in self.positions:
-                self.positions.remove(position)
-
-            # Update current_position for compatibility
-            if position == self.current_position:
-                self.current_position = self.positions[0] if self.positions else None
+        Args:
+            position: Position that was closed
+            order_side: Side of the close order
+            exit_price: Fill price of the close order
+        """
+        # Calculate profit/loss
+        pnl = self._calculate_position_pnl(position, exit_price)
+        entry_price = position.entry_price
+        pnl_percent = (pnl / (entry_price * position.quantity)) * 100
+
+        # Log trade
+        self.logger.log_trade(
+            side=order_side,
+            symbol=self.symbol,
+            price=exit_price,
+            quantity=position.quantity,
+            profit=pnl,
+            trade_type='CLOSE'
+        )
 
-            # Update strategy
-            self.strategy.set_position(self.current_position)
+        # Record trade in position manager
+        self.position_manager.record_trade(pnl)
 
-        except Exception as e:
-            self.logger.error(f"Failed to execute exit: {e}", exc_info=True)
-            self._add_dashboard_log("ERROR", f"Failed to execute exit: {e}")
+        self.logger.info(
+            "Position closed successfully. P/L: %s%.2f", '+ $' if pnl > 0 else '- $', abs(pnl)
+        )
+
+        # Send Telegram notification
+        self._notify(
+            'notify_trade_exit',
+            side=position.side,
+            entry_price=entry_price,
+            exit_price=exit_price,
+            quantity=position.quantity,
+            pnl=pnl,
+            pnl_percent=pnl_percent,
+            reason="Strategy Signal"
+        )
+
+        # Update dashboard with trade
+        self._add_dashboard_log(
+            "INFO",
+            f"Closed {position.side} position @ ${exit_price:.2f} | P/L: ${pnl:.2f}"
+        )
 
-    def _sync_position_from_exchange(self, positions):
+        # Add trade to history
+        if DASHBOARD_ENABLED and bot_state:
+            bot_state.add_trade({
+                "side": position.side,
+                "entry_price": entry_price,
+                "exit_price": exit_price,
+                "quantity": position.quantity,
+                "pnl": pnl,
+                "pnl_percent": pnl_percent
+            })
+
+        # Remove position from list
+        self.positions.remove(position)
+
+        # Update strategy with the new primary position
+        self.strategy.set_position(self.current_position)
+
+    def _sync_position_from_exchange(self, pos: Dict[str, Any]):
         """
         Sync position tracking with exchange state.
 
         Args:
-            positions: List of positions from exchange
+            pos: The exchange's open position for this symbol
         """
-        for pos in positions:
-            if pos['symbol'] == self.symbol:
-                amount = float(pos['positionAmt'])
-                if amount != 0:
-                    side = 'LONG' if amount > 0 else 'SHORT'
-                    entry_price = float(pos['entryPrice'])
-
-                    # Check if position already tracked
-                    already_tracked = any(
-                        p['entry_price'] == entry_price and p['side'] == side
-                        for p in self.positions
-                    )
-
-                    if not already_tracked:
-                        # Calculate SL/TP using strategy (critical for exit logic)
-                        stop_loss = self.strategy.get_stop_loss(entry_price, side)
-                        take_profit = self.strategy.get_take_profit(entry_price, side)
+        amount = pos['positionAmt']
+        if amount == 0.0:
+            return
+        direction = math.copysign(1.0, amount)
+        side = 'LONG' if direction > 0 else 'SHORT'
+        entry_price = float(pos['entryPrice'])
 
-                        synced_position = {
-                            'side': side,
-                            'entry_price': entry_price,
-                            'quantity': abs(amount),
-                            'stop_loss': stop_loss,
-                            'take_profit': take_profit
-                        }
+        # Check if position already tracked
+        if self.positions.find(side, entry_price) is None:
+            # Calculate SL/TP using strategy (critical for exit logic)
+            stop_loss = self.strategy.get_stop_loss(entry_price, side)
+            take_profit = self.strategy.get_take_profit(entry_price, side)
 
-                        # Add to positions list
-                        self.positions.append(synced_position)
+            synced_position = Position(
+                side=side,
+                direction=direction,
+                entry_price=entry_price,
+                quantity=math.fabs(amount),
+                stop_loss=stop_loss,
+                take_profit=take_profit
+            )
 
-                        # Set as current_position if first one
-                        if not self.current_position:
-                            self.current_position = synced_position
+            # Add to positions list
+            self.positions.add(synced_position)
 
-                        self.strategy.set_position(synced_position)
-                        self.logger.info(
-                            f"Synced existing position from exchange: {side} @ {entry_price:.2f}, "
-                            f"SL: {stop_loss:.2f}, TP: {take_profit:.2f}"
-                        )
+            self.strategy.set_position(synced_position)
+            self.logger.info(
+                "Synced existing position from exchange: %s @ %.2f, SL: %.2f, TP: %.2f",
+                side, entry_price, stop_loss, take_profit
+            )
 
     def _shutdown(self, reason: str = "Unknown"):
         """
@@ -812,13 +949,21 @@ class Trader:
         self.logger.info("SHUTTING DOWN TRADING BOT")
         self.logger.info("=" * 60)
 
+        # Let in-flight close orders finish, stop the streams and book the
+        # exits before reporting stats
+        self.exchange.close()
+        self._settle_exits()
+        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        self._loop.close()
+
         # Log final stats
         stats = self.position_manager.get_daily_stats()
-        self.logger.info(f"Final daily stats: {stats}")
+        self.logger.info("Final daily stats: %s", stats)
 
         # Send daily summary if there were trades
         if stats['total_trades'] > 0:
-            notifier.notify_daily_summary(
+            self._notify(
+                'notify_daily_summary',
                 trades_today=stats['total_trades'],
                 wins=stats['winning_trades'],
                 losses=stats['losing_trades'],
@@ -829,11 +974,17 @@ class Trader:
         # Warning if position is still open
         if self.current_position:
             self.logger.warning(
-                f"WARNING: Position still open! "
-                f"{self.current_position['side']} {self.current_position['quantity']} {self.symbol}"
+                "WARNING: Position still open! %s %s %s",
+                self.current_position.side, self.current_position.quantity, self.symbol
             )
 
         # Send shutdown notification
-        notifier.notify_bot_stop(reason)
+        self._notify('notify_bot_stop', reason)
+
+        # Flush queued notifications before the process exits
+        self._notify_q.put(None)
+        self._notify_thread.join(timeout=15)
+
+        self._flush_dashboard_logs()
 
         self.logger.info("Bot shutdown complete")
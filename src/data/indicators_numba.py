@@ -0,0 +1,240 @@
+"""
+Compiled indicator kernels.
+
+Single-pass loops over float64 arrays, JIT-compiled with numba when it is
+available (see src.utils.jit). Results match the pandas formulas used by
+MarketData: ``ewm(span, adjust=False)`` for EMA, simple rolling means of
+gains/losses for RSI and of true ranges for ATR. Explicit signatures compile
+them at import time, and they release the GIL while running so the
+websocket and notifier threads are not stalled by a recompute.
+"""
+
+import math
+
+import numpy as np
+
+from src.utils.jit import njit
+
+
+@njit('float64[:](float64[:], float64)', cache=True, nogil=True)
+def ema(close: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Exponential moving average seeded with the first value.
+
+    Args:
+        close: Price array
+        alpha: Smoothing factor (2 / (span + 1))
+
+    Returns:
+        EMA array, same length as close
+    """
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    out[0] = close[0]
+    for i in range(1, n):
+        out[i] = alpha * close[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit('float64[:](float64[:], int64)', cache=True, nogil=True)
+def rsi(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI from simple rolling means of gains and losses.
+
+    The first difference counts as zero gain/loss, so the first value is
+    at index period - 1, as with pandas' diff().where(...).rolling().
+
+    Args:
+        close: Price array
+        period: Lookback window
+
+    Returns:
+        RSI array (NaN until the window is full)
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    gains = np.zeros(n, dtype=np.float64)
+    losses = np.zeros(n, dtype=np.float64)
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(n):
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= period:
+            gain_sum -= gains[i - period]
+            loss_sum -= losses[i - period]
+        if i >= period - 1:
+            avg_gain = gain_sum / period
+            avg_loss = loss_sum / period
+            if avg_loss > 0:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                out[i] = 100.0
+    return out
+
+
+@njit('float64[:](float64[:], float64[:], float64[:], int64)', cache=True, nogil=True)
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """
+    ATR as a simple rolling mean of true ranges.
+
+    The first true range is high - low (there is no previous close), as
+    with pandas' NaN-skipping max over the three candidates.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        period: Lookback window
+
+    Returns:
+        ATR array (NaN until the window is full)
+    """
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    tr = np.empty(n, dtype=np.float64)
+    tr_sum = 0.0
+    for i in range(n):
+        value = high[i] - low[i]
+        if i > 0:
+            prev_close = close[i - 1]
+            value = max(value, abs(high[i] - prev_close), abs(low[i] - prev_close))
+        tr[i] = value
+        tr_sum += value
+        if i >= period:
+            tr_sum -= tr[i - period]
+        if i >= period - 1:
+            out[i] = tr_sum / period
+    return out
+
+
+@njit(
+    'UniTuple(float64[:], 8)(float64[:], float64[:], float64[:], float64[:], '
+    'float64, float64, int64, int64, int64, int64, float64)',
+    cache=True, nogil=True
+)
+def all_indicators(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    fast_alpha: float,
+    slow_alpha: float,
+    atr_period: int,
+    volume_period: int,
+    rsi_period: int,
+    bb_period: int,
+    bb_std: float
+):
+    """
+    Every indicator used by MarketData.add_all_indicators() in one pass.
+
+    Same formulas as the individual kernels and calculate_* methods, with
+    running sums for the rolling means and a ddof=1 standard deviation
+    for the Bollinger Bands.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Close prices
+        volume: Volumes
+        fast_alpha: Fast EMA smoothing factor (2 / (span + 1))
+        slow_alpha: Slow EMA smoothing factor
+        atr_period: ATR window
+        volume_period: Volume average window
+        rsi_period: RSI window
+        bb_period: Bollinger Bands window
+        bb_std: Number of standard deviations for the bands
+
+    Returns:
+        (ema_fast, ema_slow, atr, volume_avg, rsi, bb_upper, bb_middle, bb_lower)
+    """
+    n = close.shape[0]
+    ema_fast = np.empty(n, dtype=np.float64)
+    ema_slow = np.empty(n, dtype=np.float64)
+    atr_out = np.full(n, np.nan)
+    volume_avg = np.full(n, np.nan)
+    rsi_out = np.full(n, np.nan)
+    bb_upper = np.full(n, np.nan)
+    bb_middle = np.full(n, np.nan)
+    bb_lower = np.full(n, np.nan)
+
+    tr = np.empty(n, dtype=np.float64)
+    gains = np.zeros(n, dtype=np.float64)
+    losses = np.zeros(n, dtype=np.float64)
+    tr_sum = 0.0
+    volume_sum = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    close_sum = 0.0
+
+    for i in range(n):
+        price = close[i]
+        if i == 0:
+            ema_fast[0] = price
+            ema_slow[0] = price
+            tr[0] = high[0] - low[0]
+        else:
+            ema_fast[i] = fast_alpha * price + (1.0 - fast_alpha) * ema_fast[i - 1]
+            ema_slow[i] = slow_alpha * price + (1.0 - slow_alpha) * ema_slow[i - 1]
+            prev_close = close[i - 1]
+            tr[i] = max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close))
+            delta = price - prev_close
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+
+        # ATR
+        tr_sum += tr[i]
+        if i >= atr_period:
+            tr_sum -= tr[i - atr_period]
+        if i >= atr_period - 1:
+            atr_out[i] = tr_sum / atr_period
+
+        # Volume average
+        volume_sum += volume[i]
+        if i >= volume_period:
+            volume_sum -= volume[i - volume_period]
+        if i >= volume_period - 1:
+            volume_avg[i] = volume_sum / volume_period
+
+        # RSI
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        if i >= rsi_period:
+            gain_sum -= gains[i - rsi_period]
+            loss_sum -= losses[i - rsi_period]
+        if i >= rsi_period - 1:
+            avg_gain = gain_sum / rsi_period
+            avg_loss = loss_sum / rsi_period
+            if avg_loss > 0:
+                rsi_out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                rsi_out[i] = 100.0
+
+        # Bollinger Bands; deviations summed over the window for accuracy
+        close_sum += price
+        if i >= bb_period:
+            close_sum -= close[i - bb_period]
+        if i >= bb_period - 1:
+            mean = close_sum / bb_period
+            squares = 0.0
+            for j in range(i - bb_period + 1, i + 1):
+                d = close[j] - mean
+                squares += d * d
+            std = math.sqrt(squares / (bb_period - 1))
+            bb_middle[i] = mean
+            bb_upper[i] = mean + std * bb_std
+            bb_lower[i] = mean - std * bb_std
+
+    return ema_fast, ema_slow, atr_out, volume_avg, rsi_out, bb_upper, bb_middle, bb_lower
@@ -5,11 +5,39 @@ Converts raw exchange data into pandas DataFrames with technical indicators.
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Dict, Optional, Tuple
 
 from config.settings import Settings
 from src.utils.logger import get_logger
 from src.core.exchange import BinanceConnector
+from src.data import indicators_numba
+from src.utils.jit import NUMBA_ENABLED
+
+# Columns added by MarketData.add_all_indicators()
+INDICATOR_COLUMNS = (
+    'ema_fast', 'ema_slow', 'atr', 'volume_avg', 'rsi',
+    'bb_upper', 'bb_middle', 'bb_lower'
+)
+
+
+def _rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Rolling mean over period values, NaN until the window is full (like rolling().mean())"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1:] = sliding_window_view(values, period).mean(axis=1)
+    return out
+
+
+def _rolling_mean_std(values: np.ndarray, period: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and ddof=1 standard deviation from one set of window views"""
+    mean = np.full(len(values), np.nan)
+    std = np.full(len(values), np.nan)
+    if len(values) >= period:
+        windows = sliding_window_view(values, period)
+        mean[period - 1:] = windows.mean(axis=1)
+        std[period - 1:] = windows.std(axis=1, ddof=1)
+    return mean, std
 
 
 class MarketData:
@@ -26,7 +54,14 @@ class MarketData:
             exchange: BinanceConnector instance
         """
         self.exchange = exchange
-        self.logger = get_logger(__name__, Settings.LOGS_DIR)
+        self.logger = get_logger(__name__, Settings.LOGS_DIR_STR)
+
+        # Rolling kline arrays per (symbol, interval) for incremental updates
+        self._klines_cache: Dict[Tuple[str, str], np.ndarray] = {}
+
+        # OHLCV and indicator columns from the last add_all_indicators() call,
+        # so a tick that only moved the forming candle recomputes one row
+        self._indicators_cache: Optional[Tuple[np.ndarray, Dict[str, np.ndarray]]] = None
 
     def get_klines_dataframe(
         self,
@@ -47,36 +82,154 @@ class MarketData:
         """
         try:
             klines = self.exchange.get_historical_klines(symbol, interval, limit)
+            df = self._klines_to_dataframe(klines)
 
-            # Convert to DataFrame
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+            self.logger.debug("Retrieved %s candles for %s (%s)", len(df), symbol, interval)
 
-            # Convert columns to appropriate types
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df['open'] = df['open'].astype(float)
-            df['high'] = df['high'].astype(float)
-            df['low'] = df['low'].astype(float)
-            df['close'] = df['close'].astype(float)
-            df['volume'] = df['volume'].astype(float)
+            return df
 
-            # Set timestamp as index
-            df.set_index('timestamp', inplace=True)
+        except Exception as e:
+            self.logger.error(f"Failed to get klines dataframe: {e}", exc_info=True)
+            raise
 
-            # Keep only OHLCV columns
-            df = df[['open', 'high', 'low', 'close', 'volume']]
+    async def a_get_klines_dataframe(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500
+    ) -> pd.DataFrame:
+        """Async variant of get_klines_dataframe()"""
+        try:
+            klines = await self.exchange.a_get_historical_klines(symbol, interval, limit)
+            return self._klines_to_dataframe(klines)
 
-            self.logger.debug(f"Retrieved {len(df)} candles for {symbol} ({interval})")
+        except Exception as e:
+            self.logger.error(f"Failed to get klines dataframe: {e}", exc_info=True)
+            raise
 
-            return df
+    def get_klines_incremental(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500
+    ) -> pd.DataFrame:
+        """
+        Get the latest `limit` klines, downloading only what changed.
+
+        The first call fetches the full window. Later calls request candles
+        from the last cached open time onward (the still-forming candle plus
+        any new ones) and splice them onto the cached window.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval (e.g., '1h', '4h')
+            limit: Number of candles to keep
+
+        Returns:
+            DataFrame with OHLCV data
+        """
+        try:
+            start_time = self._klines_start_time(symbol, interval)
+            klines = self.exchange.get_historical_klines(symbol, interval, limit, start_time)
+            if self._needs_full_refetch(start_time, klines, limit):
+                klines = self.exchange.get_historical_klines(symbol, interval, limit)
+            return self._klines_to_dataframe(self._merge_klines(symbol, interval, klines, limit))
 
         except Exception as e:
             self.logger.error(f"Failed to get klines dataframe: {e}", exc_info=True)
             raise
 
+    async def a_get_klines_incremental(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500
+    ) -> pd.DataFrame:
+        """Async variant of get_klines_incremental()"""
+        try:
+            start_time = self._klines_start_time(symbol, interval)
+            klines = await self.exchange.a_get_historical_klines(symbol, interval, limit, start_time)
+            if self._needs_full_refetch(start_time, klines, limit):
+                klines = await self.exchange.a_get_historical_klines(symbol, interval, limit)
+            return self._klines_to_dataframe(self._merge_klines(symbol, interval, klines, limit))
+
+        except Exception as e:
+            self.logger.error(f"Failed to get klines dataframe: {e}", exc_info=True)
+            raise
+
+    @staticmethod
+    def _needs_full_refetch(start_time: Optional[int], klines: np.ndarray, limit: int) -> bool:
+        """
+        Whether an incremental fetch must be replaced by a full window.
+
+        A fetch from start_time that comes back with a full window (or
+        more) means the cache fell a full window behind; splicing it on
+        could leave a gap, so the latest `limit` candles are fetched instead.
+        """
+        return start_time is not None and len(klines) >= limit
+
+    def _klines_start_time(self, symbol: str, interval: str) -> Optional[int]:
+        """Open time (ms) of the last cached candle, or None if nothing is cached"""
+        cached = self._klines_cache.get((symbol, interval))
+        if cached is None or not len(cached):
+            return None
+        return int(cached[-1, 0])
+
+    def _merge_klines(
+        self,
+        symbol: str,
+        interval: str,
+        klines: np.ndarray,
+        limit: int
+    ) -> np.ndarray:
+        """
+        Splice freshly fetched klines onto the cached window.
+
+        Args:
+            symbol: Trading pair symbol
+            interval: Kline interval
+            klines: Newly fetched klines (KLINE_COLUMNS layout)
+            limit: Number of candles to keep
+
+        Returns:
+            Updated kline window
+        """
+        key = (symbol, interval)
+        cached = self._klines_cache.get(key)
+        if cached is not None and len(cached) and len(klines):
+            # Fetched candles replace any cached candle with the same or later open time
+            keep = cached[cached[:, 0] < klines[0, 0]]
+            klines = np.concatenate((keep, klines))
+        elif cached is not None and not len(klines):
+            klines = cached
+        merged = klines[-limit:]
+        self._klines_cache[key] = merged
+
+        self.logger.debug("Klines window for %s (%s): %s candles", symbol, interval, len(merged))
+        return merged
+
+    @staticmethod
+    def _klines_to_dataframe(klines: np.ndarray) -> pd.DataFrame:
+        """
+        Build the OHLCV DataFrame from the connector's kline array.
+
+        Args:
+            klines: float64 array laid out as KLINE_COLUMNS
+
+        Returns:
+            DataFrame with OHLCV data indexed by candle open time
+        """
+        # Open times are epoch milliseconds: scale them to nanoseconds and
+        # reinterpret as datetime64[ns] instead of going through to_datetime's
+        # unit parsing. ns matches what to_datetime gives on pandas 2
+        open_ns = klines[:, 0].astype(np.int64) * 1_000_000
+        index = pd.DatetimeIndex(open_ns.view('datetime64[ns]'), name='timestamp')
+        return pd.DataFrame(
+            klines[:, 1:6],
+            columns=['open', 'high', 'low', 'close', 'volume'],
+            index=index
+        )
+
     def calculate_ema(self, df: pd.DataFrame, period: int) -> pd.Series:
         """
         Calculate Exponential Moving Average.
@@ -88,14 +241,18 @@ class MarketData:
         Returns:
             Series with EMA values
         """
-        try:
+        if NUMBA_ENABLED:
+            close = df['close'].to_numpy(dtype=np.float64)
+            ema = pd.Series(
+                indicators_numba.ema(close, 2.0 / (period + 1)),
+                index=df.index,
+                name='close'
+            )
+        else:
+            # The interpreted kernel loop is slower than pandas' own recurrence
             ema = df['close'].ewm(span=period, adjust=False).mean()
-            self.logger.debug(f"Calculated EMA({period})")
-            return ema
-
-        except Exception as e:
-            self.logger.error(f"Failed to calculate EMA: {e}", exc_info=True)
-            raise
+        self.logger.debug("Calculated EMA(%s)", period)
+        return ema
 
     def calculate_sma(self, df: pd.DataFrame, period: int) -> pd.Series:
         """
@@ -108,14 +265,13 @@ class MarketData:
         Returns:
             Series with SMA values
         """
-        try:
-            sma = df['close'].rolling(window=period).mean()
-            self.logger.debug(f"Calculated SMA({period})")
-            return sma
-
-        except Exception as e:
-            self.logger.error(f"Failed to calculate SMA: {e}", exc_info=True)
-            raise
+        sma = pd.Series(
+            _rolling_mean(df['close'].to_numpy(dtype=np.float64), period),
+            index=df.index,
+            name='close'
+        )
+        self.logger.debug("Calculated SMA(%s)", period)
+        return sma
 
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
         """
@@ -128,28 +284,30 @@ class MarketData:
         Returns:
             Series with ATR values
         """
-        try:
-            high = df['high']
-            low = df['low']
-            close = df['close']
-
-            # Calculate True Range
-            tr1 = high - low
-            tr2 = abs(high - close.shift())
-            tr3 = abs(low - close.shift())
-
-            tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-            # Calculate ATR as moving average of TR
-            atr = tr.rolling(window=period).mean()
-
-            self.logger.debug(f"Calculated ATR({period})")
-
-            return atr
-
-        except Exception as e:
-            self.logger.error(f"Failed to calculate ATR: {e}", exc_info=True)
-            raise
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+
+        if NUMBA_ENABLED:
+            # True range and its rolling mean in one compiled pass
+            values = indicators_numba.atr(high, low, close, period)
+        else:
+            # Interpreted kernel loops are slow; stay in vectorized numpy,
+            # folding both close gaps into tr through one scratch buffer.
+            # The first candle has no previous close, so its TR is high - low
+            tr = high - low
+            gap = np.empty_like(tr)
+            for price in (high, low):
+                np.subtract(price[1:], close[:-1], out=gap[1:])
+                np.abs(gap[1:], out=gap[1:])
+                np.fmax(tr[1:], gap[1:], out=tr[1:])
+            values = _rolling_mean(tr, period)
+
+        atr = pd.Series(values, index=df.index)
+
+        self.logger.debug("Calculated ATR(%s)", period)
+
+        return atr
 
     def calculate_rsi(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
         """
@@ -162,29 +320,22 @@ class MarketData:
         Returns:
             Series with RSI values
         """
-        try:
-            # Calculate price changes
-            delta = df['close'].diff()
-
-            # Separate gains and losses
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
-
-            # Calculate average gains and losses
-            avg_gain = gain.rolling(window=period).mean()
-            avg_loss = loss.rolling(window=period).mean()
-
-            # Calculate RS and RSI
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-
-            self.logger.debug(f"Calculated RSI({period})")
-
-            return rsi
-
-        except Exception as e:
-            self.logger.error(f"Failed to calculate RSI: {e}", exc_info=True)
-            raise
+        close = df['close'].to_numpy(dtype=np.float64)
+        if NUMBA_ENABLED:
+            # Simple rolling averages of gains and losses in one compiled pass
+            values = indicators_numba.rsi(close, period)
+        else:
+            # Same formula in vectorized numpy; the first candle has no change
+            delta = np.diff(close, prepend=close[:1])
+            avg_gain = _rolling_mean(np.where(delta > 0, delta, 0.0), period)
+            avg_loss = _rolling_mean(np.where(delta < 0, -delta, 0.0), period)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        rsi = pd.Series(values, index=df.index, name='close')
+
+        self.logger.debug("Calculated RSI(%s)", period)
+
+        return rsi
 
     def calculate_bollinger_bands(
         self,
@@ -203,28 +354,21 @@ class MarketData:
         Returns:
             Dictionary with upper, middle, and lower bands
         """
-        try:
-            # Calculate middle band (SMA)
-            middle = df['close'].rolling(window=period).mean()
-
-            # Calculate standard deviation
-            std = df['close'].rolling(window=period).std()
+        # Middle band (SMA) and standard deviation from the same windows
+        middle, std = _rolling_mean_std(df['close'].to_numpy(dtype=np.float64), period)
 
-            # Calculate upper and lower bands
-            upper = middle + (std * std_dev)
-            lower = middle - (std * std_dev)
+        # Calculate upper and lower bands
+        upper = pd.Series(middle + std * std_dev, index=df.index, name='close')
+        lower = pd.Series(middle - std * std_dev, index=df.index, name='close')
+        middle = pd.Series(middle, index=df.index, name='close')
 
-            self.logger.debug(f"Calculated Bollinger Bands({period}, {std_dev})")
+        self.logger.debug("Calculated Bollinger Bands(%s, %s)", period, std_dev)
 
-            return {
-                'upper': upper,
-                'middle': middle,
-                'lower': lower
-            }
-
-        except Exception as e:
-            self.logger.error(f"Failed to calculate Bollinger Bands: {e}", exc_info=True)
-            raise
+        return {
+            'upper': upper,
+            'middle': middle,
+            'lower': lower
+        }
 
     def calculate_volume_average(self, df: pd.DataFrame, period: int) -> pd.Series:
         """
@@ -237,44 +381,78 @@ class MarketData:
         Returns:
             Series with volume average
         """
-        try:
-            vol_avg = df['volume'].rolling(window=period).mean()
-            self.logger.debug(f"Calculated Volume Average({period})")
-            return vol_avg
-
-        except Exception as e:
-            self.logger.error(f"Failed to calculate volume average: {e}", exc_info=True)
-            raise
+        vol_avg = pd.Series(
+            _rolling_mean(df['volume'].to_numpy(dtype=np.float64), period),
+            index=df.index,
+            name='volume'
+        )
+        self.logger.debug("Calculated Volume Average(%s)", period)
+        return vol_avg
 
     def add_all_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Add all technical indicators to the DataFrame.
 
+        When only the last (forming) candle differs from the previous call,
+        just that row is recomputed.
+
         Args:
             df: DataFrame with OHLCV data
 
         Returns:
-            DataFrame with added indicators
+            New DataFrame with the OHLCV columns plus the indicators
         """
         try:
-            # EMAs for strategy
-            df['ema_fast'] = self.calculate_ema(df, Settings.EMA_FAST_PERIOD)
-            df['ema_slow'] = self.calculate_ema(df, Settings.EMA_SLOW_PERIOD)
-
-            # ATR for stop loss
-            df['atr'] = self.calculate_atr(df, 14)
-
-            # Volume average
-            df['volume_avg'] = self.calculate_volume_average(df, Settings.VOLUME_PERIOD)
-
-            # RSI for additional confirmation
-            df['rsi'] = self.calculate_rsi(df, 14)
-
-            # Bollinger Bands
-            bb = self.calculate_bollinger_bands(df, 20, 2.0)
-            df['bb_upper'] = bb['upper']
-            df['bb_middle'] = bb['middle']
-            df['bb_lower'] = bb['lower']
+            ohlcv = df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+            cached = self._indicators_cache
+            if (
+                cached is not None
+                and len(ohlcv) > 20
+                and cached[0].shape == ohlcv.shape
+                and np.array_equal(cached[0][:-1], ohlcv[:-1])
+            ):
+                # Same window, only the forming candle moved
+                columns = self._update_last_indicators(ohlcv, cached[1])
+            elif NUMBA_ENABLED:
+                # All eight indicators in one compiled pass over the window
+                values = indicators_numba.all_indicators(
+                    ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4],
+                    2.0 / (Settings.EMA_FAST_PERIOD + 1), 2.0 / (Settings.EMA_SLOW_PERIOD + 1),
+                    14, Settings.VOLUME_PERIOD, 14, 20, 2.0
+                )
+                columns = dict(zip(INDICATOR_COLUMNS, values))
+            else:
+                bb = self.calculate_bollinger_bands(df, 20, 2.0)
+                series = {
+                    # EMAs for strategy
+                    'ema_fast': self.calculate_ema(df, Settings.EMA_FAST_PERIOD),
+                    'ema_slow': self.calculate_ema(df, Settings.EMA_SLOW_PERIOD),
+                    # ATR for stop loss
+                    'atr': self.calculate_atr(df, 14),
+                    # Volume average
+                    'volume_avg': self.calculate_volume_average(df, Settings.VOLUME_PERIOD),
+                    # RSI for additional confirmation
+                    'rsi': self.calculate_rsi(df, 14),
+                    # Bollinger Bands
+                    'bb_upper': bb['upper'],
+                    'bb_middle': bb['middle'],
+                    'bb_lower': bb['lower'],
+                }
+                columns = {name: values.to_numpy(dtype=np.float64) for name, values in series.items()}
+
+            # The cache keeps float64 so the one-row updates stay exact
+            self._indicators_cache = (ohlcv, columns)
+            if Settings.INDICATOR_FLOAT32:
+                columns = {name: values.astype(np.float32) for name, values in columns.items()}
+
+            # One concat instead of eight column insertions
+            df = pd.concat(
+                [
+                    df.drop(columns=list(INDICATOR_COLUMNS), errors='ignore'),
+                    pd.DataFrame(columns, index=df.index)
+                ],
+                axis=1
+            )
 
             self.logger.debug("Added all technical indicators to DataFrame")
 
@@ -284,6 +462,78 @@ class MarketData:
             self.logger.error(f"Failed to add indicators: {e}", exc_info=True)
             raise
 
+    def latest_indicators(self) -> Dict[str, float]:
+        """
+        Last-row values from the most recent add_all_indicators() call.
+
+        Read straight from the cached indicator arrays, without going
+        through DataFrame indexing.
+
+        Returns:
+            Dict of indicator name -> value plus 'close' (empty before the first call)
+        """
+        cached = self._indicators_cache
+        if cached is None or not len(cached[0]):
+            return {}
+        ohlcv, columns = cached
+        latest = {name: float(values[-1]) for name, values in columns.items()}
+        latest['close'] = float(ohlcv[-1, 3])
+        return latest
+
+    @staticmethod
+    def _update_last_indicators(
+        ohlcv: np.ndarray,
+        previous: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Recompute only the last row of every indicator.
+
+        Earlier rows depend on closed candles alone and are reused from the
+        previous call. Same formulas as the calculate_* methods: EMA by its
+        recurrence, simple means for ATR/volume/RSI and ddof=1 for the
+        Bollinger standard deviation.
+
+        Args:
+            ohlcv: Current window (open, high, low, close, volume), > 20 rows
+            previous: Indicator columns computed for the previous window
+
+        Returns:
+            Indicator columns for the current window
+        """
+        columns = {name: values.copy() for name, values in previous.items()}
+        high, low, close, volume = ohlcv[:, 1], ohlcv[:, 2], ohlcv[:, 3], ohlcv[:, 4]
+        price = close[-1]
+
+        for name, period in (('ema_fast', Settings.EMA_FAST_PERIOD), ('ema_slow', Settings.EMA_SLOW_PERIOD)):
+            alpha = 2.0 / (period + 1)
+            columns[name][-1] = alpha * price + (1.0 - alpha) * columns[name][-2]
+
+        # ATR(14): mean of the last 14 true ranges
+        prev_close = close[-15:-1]
+        h, l = high[-14:], low[-14:]
+        tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+        columns['atr'][-1] = tr.mean()
+
+        columns['volume_avg'][-1] = volume[-Settings.VOLUME_PERIOD:].mean()
+
+        # RSI(14) from simple means of the last 14 gains/losses
+        delta = np.diff(close[-15:])
+        avg_gain = delta[delta > 0].sum() / 14
+        avg_loss = -delta[delta < 0].sum() / 14
+        if avg_loss > 0:
+            columns['rsi'][-1] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        else:
+            columns['rsi'][-1] = 100.0 if avg_gain > 0 else np.nan
+
+        window = close[-20:]
+        middle = window.mean()
+        std = window.std(ddof=1)
+        columns['bb_middle'][-1] = middle
+        columns['bb_upper'][-1] = middle + std * 2.0
+        columns['bb_lower'][-1] = middle - std * 2.0
+
+        return columns
+
     def get_latest_candle(self, df: pd.DataFrame) -> pd.Series:
         """
         Get the most recent completed candle.
@@ -310,19 +560,18 @@ class MarketData:
             if len(df) < 2:
                 return None
 
-            # Current and previous candles
-            current = df.iloc[-1]
-            previous = df.iloc[-2]
+            # EMA gap (fast - slow) on the previous and current candles,
+            # read from the arrays rather than through two row lookups
+            gap = df['ema_fast'].to_numpy()[-2:] - df['ema_slow'].to_numpy()[-2:]
+            previous, current = float(gap[0]), float(gap[1])
 
             # Bullish crossover (EMA fast crosses above EMA slow)
-            if (previous['ema_fast'] <= previous['ema_slow'] and
-                current['ema_fast'] > current['ema_slow']):
+            if previous <= 0.0 < current:
                 self.logger.info("Detected BULLISH EMA crossover")
                 return 'BULLISH'
 
             # Bearish crossover (EMA fast crosses below EMA slow)
-            if (previous['ema_fast'] >= previous['ema_slow'] and
-                current['ema_fast'] < current['ema_slow']):
+            if previous >= 0.0 > current:
                 self.logger.info("Detected BEARISH EMA crossover")
                 return 'BEARISH'
 
@@ -3,12 +3,39 @@ Position and risk management for the trading bot.
 Handles position sizing, leverage validation, and risk limits.
 """
 
+import math
+import time
 from typing import Dict, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+
+import numpy as np
 
 from config.settings import Settings
 from src.utils.logger import get_logger
-from src.utils.helpers import truncate_float
+
+# Risk parameters read by the sizing/limit math on every trade check.
+# Settings is frozen, so binding them once at import is safe
+_MAX_LEVERAGE = Settings.MAX_LEVERAGE
+_RISK_PER_TRADE = Settings.RISK_PER_TRADE
+_STOP_LOSS_PERCENT = Settings.STOP_LOSS_PERCENT
+_TAKE_PROFIT_PERCENT = Settings.TAKE_PROFIT_PERCENT
+_MAX_DAILY_LOSS = Settings.INITIAL_CAPITAL * Settings.MAX_DAILY_LOSS_PERCENT
+_DAILY_LOSS_FLOOR = -_MAX_DAILY_LOSS  # daily_pnl at or below this halts trading
+_MAX_OPEN_POSITIONS = Settings.MAX_OPEN_POSITIONS
+_MAX_POSITION_PERCENT = getattr(Settings, 'MAX_POSITION_PERCENT', 0.05)
+
+# Truncation scales: 3 decimals for quantities, 2 for prices
+_QTY_SCALE = 1000.0
+_PRICE_SCALE = 100.0
+
+# Direction of a side; anything that is not LONG is treated as SHORT
+_SIDE_SIGN = {'LONG': 1.0, 'SHORT': -1.0}
+
+
+def _fixed_pct_stop(entry_price: float, side: str) -> float:
+    """Stop loss STOP_LOSS_PERCENT away from entry, truncated to 2 decimals"""
+    stop_loss = entry_price - _SIDE_SIGN.get(side, -1.0) * (entry_price * _STOP_LOSS_PERCENT)
+    return math.trunc(stop_loss * _PRICE_SCALE) / _PRICE_SCALE
 
 
 class PositionManager:
@@ -19,19 +46,39 @@ class PositionManager:
 
     def __init__(self):
         """Initialize position manager"""
-        self.logger = get_logger(__name__, Settings.LOGS_DIR)
-        self.daily_trades = []
+        self.logger = get_logger(__name__, Settings.LOGS_DIR_STR)
+        # P/L of today's trades, in a growable array (first n slots used)
+        self._trade_pnls = np.empty(256, dtype=np.float64)
+        self._n_trades = 0
         self.daily_pnl = 0.0
+        self._reset_trade_stats()
         self.last_reset = datetime.now().date()
+        self._next_reset = self._next_midnight()
+
+    def _reset_trade_stats(self):
+        """Zero the running win/loss counts and sums kept for get_daily_stats()"""
+        self._win_n = 0
+        self._loss_n = 0
+        self._win_sum = 0.0
+        self._loss_sum = 0.0
+
+    @staticmethod
+    def _next_midnight() -> float:
+        """Epoch time of the next local midnight"""
+        tomorrow = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+        return tomorrow.timestamp()
 
     def _reset_daily_counters(self):
         """Reset daily counters if it's a new day"""
-        current_date = datetime.now().date()
-        if current_date > self.last_reset:
-            self.logger.info(f"Resetting daily counters. Previous P/L: {self.daily_pnl:.2f}")
-            self.daily_trades = []
-            self.daily_pnl = 0.0
-            self.last_reset = current_date
+        # Called from every public method; one float compare on the usual path
+        if time.time() < self._next_reset:
+            return
+        self.logger.info("Resetting daily counters. Previous P/L: %.2f", self.daily_pnl)
+        self._n_trades = 0
+        self.daily_pnl = 0.0
+        self._reset_trade_stats()
+        self.last_reset = datetime.now().date()
+        self._next_reset = self._next_midnight()
 
     def calculate_position_size(
         self,
@@ -67,48 +114,91 @@ class PositionManager:
             self.logger.error("Prices must be greater than 0")
             return 0.0
 
-        if leverage < 1 or leverage > Settings.MAX_LEVERAGE:
-            self.logger.error(f"Leverage must be between 1 and {Settings.MAX_LEVERAGE}")
+        if leverage < 1 or leverage > _MAX_LEVERAGE:
+            self.logger.error("Leverage must be between 1 and %s", _MAX_LEVERAGE)
             return 0.0
 
-        # Calculate risk amount
-        risk_amount = capital * Settings.RISK_PER_TRADE
-
-        # Calculate price difference (risk per unit)
-        price_diff = abs(entry_price - stop_loss_price)
-
-        if price_diff == 0:
+        if entry_price == stop_loss_price:
             self.logger.error("Stop loss price must be different from entry price")
             return 0.0
 
-        # Calculate base position size based on risk
-        position_size_by_risk = risk_amount / price_diff
-
-        # Calculate maximum position size based on position limit (5% of capital)
-        # This ensures we don't use too much capital per position
-        max_position_percent = getattr(Settings, 'MAX_POSITION_PERCENT', 0.05)
-        max_notional = capital * max_position_percent * leverage
-        max_position_size = max_notional / entry_price
-
-        # Use the smaller of risk-based or position-limit-based size
-        position_size = min(position_size_by_risk, max_position_size)
-
-        # Truncate to reasonable precision (3 decimals for BTC)
-        position_size_final = truncate_float(position_size, 3)
+        # Risk-based size capped by the per-position limit (5% of capital),
+        # truncated to 3 decimals; same math as calculate_position_sizes()
+        sizes, _ = self._truncated_sizes(
+            np.array([capital], dtype=np.float64),
+            np.array([entry_price], dtype=np.float64),
+            np.array([stop_loss_price], dtype=np.float64),
+            np.array([leverage], dtype=np.float64)
+        )
+        position_size_final = float(sizes[0])
+        max_notional = capital * _MAX_POSITION_PERCENT * leverage
 
         # Ensure minimum position size
         if position_size_final < 0.001:
-            self.logger.warning(f"Position size too small: {position_size_final}, using minimum 0.001")
+            self.logger.warning("Position size too small: %s, using minimum 0.001", position_size_final)
             position_size_final = 0.001
 
         self.logger.info(
-            f"Position size calculated: {position_size_final} "
-            f"(Capital: ${capital:.2f}, Max {max_position_percent*100:.0f}% = ${max_notional:.2f}, "
-            f"Leverage: {leverage}x)"
+            "Position size calculated: %s (Capital: $%.2f, Max %.0f%% = $%.2f, Leverage: %sx)",
+            position_size_final, capital, _MAX_POSITION_PERCENT * 100, max_notional, leverage
         )
 
         return position_size_final
 
+    def calculate_position_sizes(
+        self,
+        capital: np.ndarray,
+        entry_price: np.ndarray,
+        stop_loss_price: np.ndarray,
+        leverage: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_position_size() for many candidate setups.
+
+        Same sizing rules, evaluated element-wise (inputs broadcast);
+        candidates calculate_position_size() would reject get 0 instead of
+        a logged error.
+
+        Args:
+            capital: Available trading capital
+            entry_price: Entry prices
+            stop_loss_price: Stop loss prices
+            leverage: Leverage per candidate
+
+        Returns:
+            Position sizes in base currency
+        """
+        self._reset_daily_counters()
+        sizes, valid = self._truncated_sizes(capital, entry_price, stop_loss_price, leverage)
+        # Same 0.001 floor as the scalar path, for valid candidates only
+        return np.where(valid, np.maximum(sizes, 0.001), 0.0)
+
+    @staticmethod
+    def _truncated_sizes(capital, entry_price, stop_loss_price, leverage):
+        """
+        Fixed-fractional sizes before the 0.001 minimum is applied.
+
+        Returns:
+            (sizes truncated to 3 decimals, mask of valid candidates)
+        """
+        capital, entry_price, stop_loss_price, leverage = np.broadcast_arrays(
+            np.asarray(capital, dtype=np.float64),
+            np.asarray(entry_price, dtype=np.float64),
+            np.asarray(stop_loss_price, dtype=np.float64),
+            np.asarray(leverage, dtype=np.float64)
+        )
+        price_diff = np.abs(entry_price - stop_loss_price)
+        valid = (
+            (capital > 0) & (entry_price > 0) & (stop_loss_price > 0)
+            & (leverage >= 1) & (leverage <= _MAX_LEVERAGE) & (price_diff > 0)
+        )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            size_by_risk = capital * _RISK_PER_TRADE / price_diff
+            max_size = capital * _MAX_POSITION_PERCENT * leverage / entry_price
+            sizes = np.trunc(np.minimum(size_by_risk, max_size) * _QTY_SCALE) / _QTY_SCALE
+        return sizes, valid
+
     def validate_leverage(self, leverage: int) -> bool:
         """
         Validate that leverage is within acceptable limits.
@@ -123,9 +213,9 @@ class PositionManager:
             self.logger.error("Leverage cannot be less than 1")
             return False
 
-        if leverage > Settings.MAX_LEVERAGE:
+        if leverage > _MAX_LEVERAGE:
             self.logger.error(
-                f"Leverage {leverage}x exceeds maximum allowed {Settings.MAX_LEVERAGE}x"
+                "Leverage %sx exceeds maximum allowed %sx", leverage, _MAX_LEVERAGE
             )
             return False
 
@@ -150,33 +240,20 @@ class PositionManager:
         Returns:
             Stop loss price
         """
+        if not use_fixed_percent and (atr is None or atr <= 0):
+            self.logger.warning("Invalid ATR, falling back to fixed percentage")
+            use_fixed_percent = True
+
         if use_fixed_percent:
             # Use fixed percentage stop loss
-            stop_distance = entry_price * Settings.STOP_LOSS_PERCENT
-
-            if side == 'LONG':
-                stop_loss = entry_price - stop_distance
-            else:  # SHORT
-                stop_loss = entry_price + stop_distance
-
+            stop_loss = _fixed_pct_stop(entry_price, side)
         else:
-            # Use ATR-based stop loss
-            if atr is None or atr <= 0:
-                self.logger.warning("Invalid ATR, falling back to fixed percentage")
-                return self.calculate_stop_loss(entry_price, side, use_fixed_percent=True)
-
-            # Stop loss at 2 * ATR
-            stop_distance = atr * 2
-
-            if side == 'LONG':
-                stop_loss = entry_price - stop_distance
-            else:  # SHORT
-                stop_loss = entry_price + stop_distance
-
-        stop_loss = truncate_float(stop_loss, 2)
+            # Stop loss at 2 * ATR, below entry for LONG, above for SHORT
+            stop_loss = entry_price - _SIDE_SIGN.get(side, -1.0) * (atr * 2)
+            stop_loss = math.trunc(stop_loss * _PRICE_SCALE) / _PRICE_SCALE
 
         self.logger.debug(
-            f"Stop loss calculated: ${stop_loss:.2f} for {side} at ${entry_price:.2f}"
+            "Stop loss calculated: $%.2f for %s at $%.2f", stop_loss, side, entry_price
         )
 
         return stop_loss
@@ -192,17 +269,14 @@ class PositionManager:
         Returns:
             Take profit price
         """
-        profit_distance = entry_price * Settings.TAKE_PROFIT_PERCENT
-
-        if side == 'LONG':
-            take_profit = entry_price + profit_distance
-        else:  # SHORT
-            take_profit = entry_price - profit_distance
+        profit_distance = entry_price * _TAKE_PROFIT_PERCENT
 
-        take_profit = truncate_float(take_profit, 2)
+        # Above entry for LONG, below for SHORT
+        take_profit = entry_price + _SIDE_SIGN.get(side, -1.0) * profit_distance
+        take_profit = math.trunc(take_profit * _PRICE_SCALE) / _PRICE_SCALE
 
         self.logger.debug(
-            f"Take profit calculated: ${take_profit:.2f} for {side} at ${entry_price:.2f}"
+            "Take profit calculated: $%.2f for %s at $%.2f", take_profit, side, entry_price
         )
 
         return take_profit
@@ -216,12 +290,10 @@ class PositionManager:
         """
         self._reset_daily_counters()
 
-        max_daily_loss = Settings.INITIAL_CAPITAL * Settings.MAX_DAILY_LOSS_PERCENT
-
-        if self.daily_pnl <= -max_daily_loss:
+        if self.daily_pnl <= _DAILY_LOSS_FLOOR:
             self.logger.warning(
-                f"Daily loss limit reached: ${self.daily_pnl:.2f} / "
-                f"-${max_daily_loss:.2f}. Trading halted for today."
+                "Daily loss limit reached: $%.2f / -$%.2f. Trading halted for today.",
+                self.daily_pnl, _MAX_DAILY_LOSS
             )
             return False
 
@@ -236,16 +308,22 @@ class PositionManager:
         """
         self._reset_daily_counters()
 
-        self.daily_trades.append({
-            'timestamp': datetime.now(),
-            'pnl': pnl
-        })
+        n = self._n_trades
+        if n == self._trade_pnls.shape[0]:
+            self._trade_pnls = np.resize(self._trade_pnls, 2 * n)
+        self._trade_pnls[n] = pnl
+        self._n_trades = n + 1
         self.daily_pnl += pnl
+        if pnl > 0:
+            self._win_n += 1
+            self._win_sum += pnl
+        elif pnl < 0:
+            self._loss_n += 1
+            self._loss_sum += pnl
 
         self.logger.info(
-            f"Trade recorded. P/L: ${pnl:.2f} | "
-            f"Daily P/L: ${self.daily_pnl:.2f} | "
-            f"Daily trades: {len(self.daily_trades)}"
+            "Trade recorded. P/L: $%.2f | Daily P/L: $%.2f | Daily trades: %s",
+            pnl, self.daily_pnl, self._n_trades
         )
 
     def get_daily_stats(self) -> Dict[str, float]:
@@ -257,20 +335,18 @@ class PositionManager:
         """
         self._reset_daily_counters()
 
-        winning_trades = [t for t in self.daily_trades if t['pnl'] > 0]
-        losing_trades = [t for t in self.daily_trades if t['pnl'] < 0]
-
-        total_trades = len(self.daily_trades)
-        win_rate = (len(winning_trades) / total_trades * 100) if total_trades > 0 else 0
+        # O(1) from the running counts kept by record_trade()
+        total_trades = self._n_trades
+        win_rate = (self._win_n / total_trades * 100) if total_trades > 0 else 0
 
-        avg_win = sum(t['pnl'] for t in winning_trades) / len(winning_trades) if winning_trades else 0
-        avg_loss = sum(t['pnl'] for t in losing_trades) / len(losing_trades) if losing_trades else 0
+        avg_win = self._win_sum / self._win_n if self._win_n else 0
+        avg_loss = self._loss_sum / self._loss_n if self._loss_n else 0
 
         return {
             'daily_pnl': self.daily_pnl,
             'total_trades': total_trades,
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
+            'winning_trades': self._win_n,
+            'losing_trades': self._loss_n,
             'win_rate': win_rate,
             'avg_win': avg_win,
             'avg_loss': avg_loss
@@ -286,9 +362,9 @@ class PositionManager:
         Returns:
             True if new position can be opened
         """
-        if current_positions >= Settings.MAX_OPEN_POSITIONS:
+        if current_positions >= _MAX_OPEN_POSITIONS:
             self.logger.warning(
-                f"Maximum positions ({Settings.MAX_OPEN_POSITIONS}) already open"
+                "Maximum positions (%s) already open", _MAX_OPEN_POSITIONS
             )
             return False
 
@@ -322,6 +398,6 @@ class PositionManager:
 
         ratio = reward / risk
 
-        self.logger.debug(f"Risk-reward ratio: 1:{ratio:.2f}")
+        self.logger.debug("Risk-reward ratio: 1:%.2f", ratio)
 
         return ratio
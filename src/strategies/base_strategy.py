@@ -4,6 +4,7 @@ Provides abstract interface that all strategies must implement.
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, Any
 
@@ -17,6 +18,11 @@ class BaseStrategy(ABC):
     All trading strategies must inherit from this class.
     """
 
+    # True if should_exit() always exits, with no other side effects, once
+    # price reaches the position's stop loss or take profit. The trader then
+    # checks those levels itself and only calls should_exit() for the rest.
+    exits_at_price_levels = False
+
     def __init__(self, name: str):
         """
         Initialize base strategy.
@@ -25,7 +31,7 @@ class BaseStrategy(ABC):
             name: Strategy name
         """
         self.name = name
-        self.logger = get_logger(f"Strategy.{name}", Settings.LOGS_DIR)
+        self.logger = get_logger(f"Strategy.{name}", Settings.LOGS_DIR_STR)
         self.position = None  # Current position info
 
     @abstractmethod
@@ -114,8 +120,9 @@ class BaseStrategy(ABC):
             self.logger.warning("Insufficient data for signal generation")
             return False
 
-        # Check for NaN values in critical columns
-        if df[['close', 'volume']].isnull().any().any():
+        # Check for NaN values in critical columns, per column array
+        # (selecting df[[...]] would copy both columns first)
+        if np.isnan(df['close'].to_numpy()).any() or np.isnan(df['volume'].to_numpy()).any():
             self.logger.warning("DataFrame contains NaN values")
             return False
 
@@ -3,6 +3,8 @@ EMA Crossover trading strategy.
 Conservative strategy using EMA 9/21 crossover with volume confirmation.
 """
 
+import math
+
 import pandas as pd
 from typing import Optional, Dict, Any
 
@@ -30,6 +32,8 @@ class EMACrossoverStrategy(BaseStrategy):
     - Aggressive position sizing with 5x leverage
     """
 
+    exits_at_price_levels = True
+
     def __init__(self):
         """Initialize EMA Crossover strategy"""
         super().__init__("EMA_Crossover")
@@ -63,20 +67,26 @@ class EMACrossoverStrategy(BaseStrategy):
         if len(df) < 3:
             return None
 
-        # Get current and previous candles
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
-        prev_prev = df.iloc[-3]
-
         # Check for required indicators
         required_cols = ['ema_fast', 'ema_slow', 'volume', 'volume_avg']
         if not all(col in df.columns for col in required_cols):
             self.logger.warning("Missing required indicators")
             return None
 
+        # Current and previous candles, read straight from the column
+        # arrays instead of building a row Series per candle
+        fast_prev, fast_cur = (float(v) for v in df['ema_fast'].to_numpy()[-2:])
+        slow_prev, slow_cur = (float(v) for v in df['ema_slow'].to_numpy()[-2:])
+        current = {
+            'ema_fast': fast_cur,
+            'ema_slow': slow_cur,
+            'volume': float(df['volume'].to_numpy()[-1]),
+            'volume_avg': float(df['volume_avg'].to_numpy()[-1]),
+        }
+        previous = {'ema_fast': fast_prev, 'ema_slow': slow_prev}
+
         # Check for NaN values
-        if pd.isna([current['ema_fast'], current['ema_slow'],
-                   current['volume'], current['volume_avg']]).any():
+        if any(math.isnan(value) for value in current.values()):
             return None
 
         # AGGRESSIVE: Reduced volume confirmation (80% of average is enough)
@@ -196,30 +206,19 @@ class EMACrossoverStrategy(BaseStrategy):
             self.log_signal("EXIT SIGNAL", f"Take profit hit at ${current_price:.2f}")
             return True
 
-        # Check for opposite crossover (optional early exit)
+        # Check for opposite crossover (optional early exit); sign of the
+        # fast - slow gap on the last two candles
         if len(df) >= 2:
-            current = df.iloc[-1]
-            previous = df.iloc[-2]
-
-            # Exit long on bearish crossover
-            if side == 'LONG':
-                bearish_cross = (
-                    previous['ema_fast'] >= previous['ema_slow'] and
-                    current['ema_fast'] < current['ema_slow']
-                )
-                if bearish_cross:
-                    self.log_signal("EXIT SIGNAL", "Opposite EMA crossover detected")
-                    return True
-
-            # Exit short on bullish crossover
-            if side == 'SHORT':
-                bullish_cross = (
-                    previous['ema_fast'] <= previous['ema_slow'] and
-                    current['ema_fast'] > current['ema_slow']
-                )
-                if bullish_cross:
-                    self.log_signal("EXIT SIGNAL", "Opposite EMA crossover detected")
-                    return True
+            gap = df['ema_fast'].to_numpy()[-2:] - df['ema_slow'].to_numpy()[-2:]
+            previous, current = float(gap[0]), float(gap[1])
+
+            # Exit long on bearish crossover, short on bullish crossover
+            if (
+                (side == 'LONG' and previous >= 0.0 > current)
+                or (side == 'SHORT' and previous <= 0.0 < current)
+            ):
+                self.log_signal("EXIT SIGNAL", "Opposite EMA crossover detected")
+                return True
 
         return False
 
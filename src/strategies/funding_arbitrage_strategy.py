@@ -32,9 +32,9 @@ Recommended Pairs:
 import pandas as pd
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
-import requests
 
 from config.settings import Settings
+from src.utils.helpers import get_http_session
 from src.strategies.base_strategy import BaseStrategy
 
 
@@ -85,7 +85,7 @@ class FundingArbitrageStrategy(BaseStrategy):
         try:
             url = "https://fapi.binance.com/fapi/v1/premiumIndex"
             params = {'symbol': symbol}
-            response = requests.get(url, params=params, timeout=5)
+            response = get_http_session().get(url, params=params, timeout=5)
             data = response.json()
             
             funding_rate = float(data.get('lastFundingRate', 0))
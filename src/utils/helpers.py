@@ -2,46 +2,222 @@
 Helper functions for the crypto trading bot.
 """
 
+import asyncio
+import logging
+import random
 import time
 from typing import Callable, Any, Optional
 from functools import wraps
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive session for non-exchange HTTP calls (Telegram, public
+# Binance endpoints), created on first use
+_http_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+
+    Reusing one session keeps TCP+TLS connections alive between calls
+    instead of handshaking again for every request.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=16))
+        _http_session = session
+    return _http_session
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """
+    Read a server-supplied Retry-After delay from an API exception.
+
+    Args:
+        exc: Exception raised by the wrapped call
+
+    Returns:
+        Delay in seconds, or None if the response carries no usable header
+    """
+    response = getattr(exc, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    value = headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _next_retry_delay(
+    exc: Exception,
+    base: float,
+    previous: float,
+    backoff: float,
+    max_delay: float
+) -> Optional[float]:
+    """
+    Decorrelated-jitter wait, overridden by a server Retry-After header.
+
+    Returns:
+        Seconds to wait, or None if the server asks for longer than
+        max_delay (e.g. a 418 IP ban), in which case retrying is pointless
+    """
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        return retry_after if retry_after <= max_delay else None
+    return min(max_delay, random.uniform(base, previous * backoff))
+
+
+def _retry_wait(
+    logger: logging.Logger,
+    func_name: str,
+    exc: Exception,
+    attempt: int,
+    max_attempts: int,
+    unrecoverable_codes: tuple,
+    base: float,
+    previous: float,
+    backoff: float,
+    max_delay: float
+) -> Optional[float]:
+    """
+    Decide what the retry decorators do after a caught exception, and log it.
+
+    Returns:
+        Seconds to wait before the next attempt, or None if the caller
+        should re-raise (last attempt, unrecoverable code, or a Retry-After
+        beyond max_delay)
+    """
+    if getattr(exc, 'code', None) in unrecoverable_codes or attempt >= max_attempts - 1:
+        logger.error(
+            "%s failed: %s", func_name, exc,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        return None
+
+    wait = _next_retry_delay(exc, base, previous, backoff, max_delay)
+    if wait is None:
+        logger.error(
+            "%s failed: %s (server asked to wait beyond %.0fs, giving up)",
+            func_name, exc, max_delay
+        )
+        return None
+
+    logger.warning("%s failed (%s), retrying in %.2fs", func_name, exc, wait)
+    return wait
+
 
 def retry_on_exception(
     max_attempts: int = 3,
     delay: float = 1.0,
-    backoff: float = 2.0,
-    exceptions: tuple = (Exception,)
+    backoff: float = 3.0,
+    exceptions: tuple = (Exception,),
+    max_delay: float = 30.0,
+    unrecoverable_codes: tuple = ()
 ) -> Callable:
     """
-    Decorator to retry a function on exception with exponential backoff.
+    Decorator to retry a function on exception with decorrelated jitter.
+
+    Each wait is drawn from uniform(delay, previous_wait * backoff), capped
+    at max_delay, so concurrent callers do not retry in lockstep. A
+    Retry-After header on the exception's response overrides the drawn wait;
+    one longer than max_delay re-raises at once instead of blocking.
+
+    Failures are logged here, on the wrapped function's module logger:
+    a warning per retry and a single error when giving up (with a
+    traceback only when DEBUG is enabled).
 
     Args:
         max_attempts: Maximum number of retry attempts
-        delay: Initial delay between retries in seconds
-        backoff: Multiplier for delay after each attempt
+        delay: Base delay between retries in seconds
+        backoff: Upper-bound multiplier applied to the previous delay
         exceptions: Tuple of exceptions to catch
+        max_delay: Cap for any single wait in seconds
+        unrecoverable_codes: API error codes (exception ``code`` attribute)
+            that are re-raised immediately without retrying
 
     Returns:
         Decorated function
     """
     def decorator(func: Callable) -> Callable:
+        logger = logging.getLogger(func.__module__)
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             current_delay = delay
-            last_exception = None
 
             for attempt in range(max_attempts):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        raise last_exception
+                    wait = _retry_wait(
+                        logger, func.__name__, e, attempt, max_attempts,
+                        unrecoverable_codes, delay, current_delay, backoff, max_delay
+                    )
+                    if wait is None:
+                        raise
+                    current_delay = wait
+                    time.sleep(current_delay)
+
+        return wrapper
+    return decorator
+
+
+def async_retry_on_exception(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 3.0,
+    exceptions: tuple = (Exception,),
+    max_delay: float = 30.0,
+    unrecoverable_codes: tuple = ()
+) -> Callable:
+    """
+    Coroutine counterpart of retry_on_exception.
+
+    Same backoff, Retry-After and logging rules, but waits with
+    asyncio.sleep so other tasks keep running during the backoff.
+
+    Args:
+        max_attempts: Maximum number of retry attempts
+        delay: Base delay between retries in seconds
+        backoff: Upper-bound multiplier applied to the previous delay
+        exceptions: Tuple of exceptions to catch
+        max_delay: Cap for any single wait in seconds
+        unrecoverable_codes: API error codes that are re-raised immediately
+
+    Returns:
+        Decorated coroutine function
+    """
+    def decorator(func: Callable) -> Callable:
+        logger = logging.getLogger(func.__module__)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            current_delay = delay
+
+            for attempt in range(max_attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as e:
+                    wait = _retry_wait(
+                        logger, func.__name__, e, attempt, max_attempts,
+                        unrecoverable_codes, delay, current_delay, backoff, max_delay
+                    )
+                    if wait is None:
+                        raise
+                    current_delay = wait
+                    await asyncio.sleep(current_delay)
 
         return wrapper
     return decorator
@@ -0,0 +1,22 @@
+"""
+Optional Numba JIT support.
+
+Exposes ``njit`` from numba when it is installed. Without numba it leaves
+functions as plain Python, so kernels written against this module run
+either way.
+"""
+
+try:
+    from numba import njit
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports @njit and @njit(...))"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
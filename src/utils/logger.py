@@ -3,18 +3,94 @@ Logging system for the crypto trading bot.
 Provides colored console output and rotating file handlers.
 """
 
+import atexit
 import logging
+import os
+import queue
+import threading
 import colorlog
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
+# One queue and writer thread per logs directory. Loggers only enqueue
+# records; console and file I/O happen on the listener thread so the
+# trading loop never waits on a disk flush
+_queue_handlers: Dict[str, QueueHandler] = {}
+_queue_lock = threading.Lock()
+
+
+def _console_handler() -> logging.Handler:
+    """Colored console handler (INFO and above)"""
+    console_handler = colorlog.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+
+    # Colored formatter for console
+    console_formatter = colorlog.ColoredFormatter(
+        '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s',
+        datefmt='%Y-%m-%d %H:%M:%S',
+        log_colors={
+            'DEBUG': 'cyan',
+            'INFO': 'green',
+            'WARNING': 'yellow',
+            'ERROR': 'red',
+            'CRITICAL': 'red,bg_white',
+        }
+    )
+    console_handler.setFormatter(console_formatter)
+    return console_handler
+
+
+def _file_handlers(logs_dir: str) -> List[logging.Handler]:
+    """Rotating file handlers for the trading, error and debug logs"""
+    trading_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    handlers = []
+    for filename, level in (
+        ('trading.log', logging.INFO),   # General trading log (INFO and above)
+        ('errors.log', logging.ERROR),   # Error log (ERROR and above)
+        ('debug.log', logging.DEBUG),    # Debug log (all levels)
+    ):
+        handler = RotatingFileHandler(
+            os.path.join(logs_dir, filename),
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5
+        )
+        handler.setLevel(level)
+        handler.setFormatter(trading_formatter)
+        handlers.append(handler)
+    return handlers
+
+
+def _queue_handler(logs_dir: str) -> QueueHandler:
+    """
+    Handler feeding the background writer for logs_dir, started on first use.
+
+    The listener is stopped at interpreter exit, which drains the queue.
+    """
+    with _queue_lock:
+        handler = _queue_handlers.get(logs_dir)
+        if handler is None:
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(
+                log_queue,
+                _console_handler(),
+                *_file_handlers(logs_dir),
+                respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(listener.stop)
+            handler = _queue_handlers[logs_dir] = QueueHandler(log_queue)
+        return handler
+
 
 class TradingLogger:
     """Custom logger with file rotation and colored console output"""
 
-    def __init__(self, name: str, logs_dir: Path):
+    def __init__(self, name: str, logs_dir: Union[str, Path]):
         """
         Initialize the trading logger.
 
@@ -24,93 +100,43 @@ class TradingLogger:
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
-        self.logs_dir = logs_dir
+
+        # Plain string paths: handlers and open() never need pathlib
+        self.logs_dir = os.fspath(logs_dir)
+        self._trades_log_path = os.path.join(self.logs_dir, 'trades.log')
 
         # Ensure logs directory exists
-        self.logs_dir.mkdir(exist_ok=True)
+        os.makedirs(self.logs_dir, exist_ok=True)
 
         # Remove existing handlers to avoid duplicates
         self.logger.handlers.clear()
 
-        # Setup handlers
-        self._setup_console_handler()
-        self._setup_file_handlers()
-
-    def _setup_console_handler(self):
-        """Setup colored console handler"""
-        console_handler = colorlog.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-
-        # Colored formatter for console
-        console_formatter = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s%(reset)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
-        )
-        console_handler.setFormatter(console_formatter)
-        self.logger.addHandler(console_handler)
-
-    def _setup_file_handlers(self):
-        """Setup rotating file handlers for different log levels"""
-        # General trading log (INFO and above)
-        trading_handler = RotatingFileHandler(
-            self.logs_dir / 'trading.log',
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
-        trading_handler.setLevel(logging.INFO)
-        trading_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        trading_handler.setFormatter(trading_formatter)
-        self.logger.addHandler(trading_handler)
-
-        # Error log (ERROR and above)
-        error_handler = RotatingFileHandler(
-            self.logs_dir / 'errors.log',
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
-        error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(trading_formatter)
-        self.logger.addHandler(error_handler)
+        # Records go through the shared queue to the console and log files
+        self.logger.addHandler(_queue_handler(self.logs_dir))
 
-        # Debug log (all levels)
-        debug_handler = RotatingFileHandler(
-            self.logs_dir / 'debug.log',
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5
-        )
-        debug_handler.setLevel(logging.DEBUG)
-        debug_handler.setFormatter(trading_formatter)
-        self.logger.addHandler(debug_handler)
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether a message at level would be emitted (mirrors logging.Logger)"""
+        return self.logger.isEnabledFor(level)
 
-    def debug(self, message: str):
-        """Log debug message"""
-        self.logger.debug(message)
+    def debug(self, message: str, *args):
+        """Log debug message (``args`` are %-formatted only if emitted)"""
+        self.logger.debug(message, *args)
 
-    def info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+    def info(self, message: str, *args):
+        """Log info message (``args`` are %-formatted only if emitted)"""
+        self.logger.info(message, *args)
 
-    def warning(self, message: str):
-        """Log warning message"""
-        self.logger.warning(message)
+    def warning(self, message: str, *args):
+        """Log warning message (``args`` are %-formatted only if emitted)"""
+        self.logger.warning(message, *args)
 
-    def error(self, message: str, exc_info: bool = False):
-        """Log error message"""
-        self.logger.error(message, exc_info=exc_info)
+    def error(self, message: str, *args, exc_info: bool = False):
+        """Log error message (``args`` are %-formatted only if emitted)"""
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def critical(self, message: str, exc_info: bool = False):
-        """Log critical message"""
-        self.logger.critical(message, exc_info=exc_info)
+    def critical(self, message: str, *args, exc_info: bool = False):
+        """Log critical message (``args`` are %-formatted only if emitted)"""
+        self.logger.critical(message, *args, exc_info=exc_info)
 
     def log_trade(
         self,
@@ -149,8 +175,7 @@ class TradingLogger:
         self.info(message)
 
         # Also write to a separate trades log
-        trades_log = self.logs_dir / 'trades.log'
-        with open(trades_log, 'a') as f:
+        with open(self._trades_log_path, 'a') as f:
             f.write(f"{timestamp} - {message}\n")
 
     def log_balance(self, balance: float, available: float):
@@ -161,8 +186,7 @@ class TradingLogger:
             balance: Total balance
             available: Available balance
         """
-        message = f"[BALANCE] Total: ${balance:.2f} | Available: ${available:.2f}"
-        self.info(message)
+        self.info("[BALANCE] Total: $%.2f | Available: $%.2f", balance, available)
 
     def log_position(
         self,
@@ -184,6 +208,9 @@ class TradingLogger:
             current_price: Current market price
             unrealized_pnl: Unrealized profit/loss
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         pnl_str = f"+${unrealized_pnl:.2f}" if unrealized_pnl > 0 else f"-${abs(unrealized_pnl):.2f}"
         pnl_percent = ((current_price - entry_price) / entry_price * 100)
 
@@ -209,7 +236,7 @@ class TradingLogger:
         self.info(message)
 
 
-def get_logger(name: str, logs_dir: Optional[Path] = None) -> TradingLogger:
+def get_logger(name: str, logs_dir: Optional[Union[str, Path]] = None) -> TradingLogger:
     """
     Get or create a logger instance.
 
@@ -221,6 +248,6 @@ def get_logger(name: str, logs_dir: Optional[Path] = None) -> TradingLogger:
         TradingLogger instance
     """
     if logs_dir is None:
-        logs_dir = Path(__file__).parent.parent.parent / 'logs'
+        logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'logs')
 
     return TradingLogger(name, logs_dir)
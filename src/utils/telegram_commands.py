@@ -5,12 +5,12 @@ Allows users to control and monitor the trading bot via Telegram commands.
 
 import threading
 import time
-import requests
 from typing import Optional, Callable, Dict, Any
 from config.settings import Settings
 from src.utils.logger import get_logger
+from src.utils.helpers import get_http_session
 
-logger = get_logger(__name__, Settings.LOGS_DIR)
+logger = get_logger(__name__, Settings.LOGS_DIR_STR)
 
 
 class TelegramCommandHandler:
@@ -71,7 +71,7 @@ class TelegramCommandHandler:
             payload["reply_markup"] = reply_markup
 
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = get_http_session().post(url, json=payload, timeout=10)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Error sending message: {e}")
@@ -90,7 +90,7 @@ class TelegramCommandHandler:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=35)
+            response = get_http_session().get(url, params=params, timeout=35)
             if response.status_code == 200:
                 data = response.json()
                 if data.get("ok"):
@@ -229,7 +229,7 @@ Restart bot with: <code>python main.py [strategy]</code>
 
             for symbol in symbols:
                 url = "https://fapi.binance.com/fapi/v1/premiumIndex"
-                response = requests.get(url, params={'symbol': symbol}, timeout=5)
+                response = get_http_session().get(url, params={'symbol': symbol}, timeout=5)
                 if response.status_code == 200:
                     data = response.json()
                     rate = float(data.get('lastFundingRate', 0)) * 100
@@ -398,7 +398,7 @@ Negative rate = Shorts pay Longs
         ]
 
         try:
-            response = requests.post(url, json={"commands": commands}, timeout=10)
+            response = get_http_session().post(url, json={"commands": commands}, timeout=10)
             if response.status_code == 200:
                 logger.info("Telegram commands menu set up successfully")
                 return True
@@ -3,13 +3,25 @@ Telegram notification system for the trading bot.
 Sends real-time alerts about trading activity, errors, and status updates.
 """
 
-import requests
 import time
+from functools import wraps
 from typing import Optional
 from config.settings import Settings
 from src.utils.logger import get_logger
+from src.utils.helpers import get_http_session
 
-logger = get_logger(__name__, Settings.LOGS_DIR)
+logger = get_logger(__name__, Settings.LOGS_DIR_STR)
+
+
+def _never_raises(method):
+    """Log and swallow errors from a notify_* method; alerts must not break trading"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            method(self, *args, **kwargs)
+        except Exception as e:
+            logger.error(f"Failed to build {method.__name__} notification: {e}")
+    return wrapper
 
 
 class TelegramNotifier:
@@ -52,7 +64,7 @@ class TelegramNotifier:
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                response = requests.post(url, json=payload, timeout=10)
+                response = get_http_session().post(url, json=payload, timeout=10)
 
                 if response.status_code == 200:
                     logger.debug(f"Telegram message sent successfully")
@@ -68,6 +80,7 @@ class TelegramNotifier:
 
         return False
 
+    @_never_raises
     def notify_bot_start(self):
         """Notify that the bot has started"""
         message = f"""
@@ -85,6 +98,7 @@ class TelegramNotifier:
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_bot_stop(self, reason: str = "User requested"):
         """Notify that the bot has stopped"""
         message = f"""
@@ -96,6 +110,7 @@ The bot has been shut down gracefully.
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_trade_entry(self, side: str, price: float, quantity: float,
                           stop_loss: float, take_profit: float):
         """
@@ -128,6 +143,7 @@ The bot has been shut down gracefully.
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_trade_exit(self, side: str, entry_price: float, exit_price: float,
                          quantity: float, pnl: float, pnl_percent: float, reason: str):
         """
@@ -162,6 +178,7 @@ The bot has been shut down gracefully.
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_balance_update(self, balance: float, unrealized_pnl: float = 0):
         """
         Notify about balance update.
@@ -181,6 +198,7 @@ The bot has been shut down gracefully.
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_error(self, error_type: str, error_message: str):
         """
         Notify about an error.
@@ -201,6 +219,7 @@ Please check the logs for more details.
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_daily_summary(self, trades_today: int, wins: int, losses: int,
                             total_pnl: float, win_rate: float):
         """
@@ -228,6 +247,7 @@ Please check the logs for more details.
         """
         self.send_message(message.strip())
 
+    @_never_raises
     def notify_daily_loss_limit(self, loss_amount: float, limit_percent: float):
         """
         Notify that daily loss limit has been reached.
@@ -5,7 +5,7 @@ Thread-safe state sharing between trading bot and web server.
 
 from datetime import datetime
 from threading import Lock
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field
 
 
@@ -148,6 +148,19 @@ class BotStateManager:
             if len(self._state.recent_logs) > 100:
                 self._state.recent_logs = self._state.recent_logs[-100:]
 
+    def add_logs(self, entries: List[Tuple[str, str, str]]) -> None:
+        """Add several (timestamp, level, message) log entries under one lock."""
+        if not entries:
+            return
+        with self._state_lock:
+            self._state.recent_logs.extend(
+                {"timestamp": timestamp, "level": level, "message": message}
+                for timestamp, level, message in entries
+            )
+            # Keep only last 100 logs
+            if len(self._state.recent_logs) > 100:
+                self._state.recent_logs = self._state.recent_logs[-100:]
+
     def set_error(self, error: str) -> None:
         """Set last error."""
         with self._state_lock:
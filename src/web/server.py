@@ -3,6 +3,8 @@ FastAPI web server for the trading bot dashboard.
 """
 
 import os
+import threading
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
@@ -12,11 +14,24 @@ from datetime import datetime
 
 from src.web.bot_state import bot_state
 
+# Set once the server has finished starting up
+dashboard_ready = threading.Event()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Signal readiness to the launching thread once startup completes."""
+    dashboard_ready.set()
+    yield
+    dashboard_ready.clear()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Crypto Trading Bot Dashboard",
     description="Real-time monitoring dashboard for the Binance Futures trading bot",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -28,7 +28,7 @@ def test_connection():
     print_section("Testing Binance Connection")
 
     try:
-        logger = get_logger("test_connection", Settings.LOGS_DIR)
+        logger = get_logger("test_connection", Settings.LOGS_DIR_STR)
         logger.info("Starting connection test")
 
         # Initialize exchange
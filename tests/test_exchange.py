@@ -0,0 +1,296 @@
+"""
+Offline tests for the Binance connector.
+The client is mocked, so no API keys or network access are needed.
+"""
+
+import asyncio
+import json
+import threading
+from decimal import Decimal
+import logging
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from binance.exceptions import BinanceAPIException
+from binance.streams import BinanceSocketManager, ReconnectingWebsocket
+from requests.exceptions import ReadTimeout
+from config.settings import Settings
+from src.core.exchange import (
+    BinanceConnector,
+    _OrjsonSocketManager,
+    _SigningClient,
+    _fmt_price,
+    _fmt_qty,
+)
+
+
+def make_connector():
+    """Connector with a mocked client, skipping the network setup in __init__"""
+    connector = BinanceConnector.__new__(BinanceConnector)
+    connector.logger = logging.getLogger('test_exchange')
+    connector.client = MagicMock()
+    connector.symbol_info_cache = {
+        'BTCUSDT': BinanceConnector._add_quantizers({
+            'quantity_precision': 3,
+            'price_precision': 2,
+            'min_qty': 0.001,
+            'step_size': 0.001
+        })
+    }
+    return connector
+
+
+def api_error(code: int, msg: str) -> BinanceAPIException:
+    """BinanceAPIException as python-binance builds it from an error body"""
+    response = MagicMock(headers={})
+    return BinanceAPIException(response, 400, json.dumps({'code': code, 'msg': msg}))
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Skip retry backoff waits"""
+    monkeypatch.setattr('src.utils.helpers.time.sleep', lambda seconds: None)
+
+
+def test_cancel_many_sends_batches_of_ten():
+    connector = make_connector()
+    connector.client.futures_cancel_orders.side_effect = lambda symbol, orderIdList: [
+        {'orderId': order_id, 'status': 'CANCELED'} for order_id in json.loads(orderIdList)
+    ]
+
+    results = connector.cancel_many('BTCUSDT', range(1, 24))
+
+    batches = [
+        json.loads(call.kwargs['orderIdList'])
+        for call in connector.client.futures_cancel_orders.call_args_list
+    ]
+    assert batches == [list(range(1, 11)), list(range(11, 21)), [21, 22, 23]]
+    assert [r['orderId'] for r in results] == list(range(1, 24))
+
+
+def test_cancel_many_with_no_ids_sends_nothing():
+    connector = make_connector()
+
+    assert connector.cancel_many('BTCUSDT', []) == []
+    connector.client.futures_cancel_orders.assert_not_called()
+
+
+def test_cancel_many_returns_per_order_errors_in_place():
+    # batchOrders answers 200 with an error entry for each order it could not cancel
+    connector = make_connector()
+    connector.client.futures_cancel_orders.return_value = [
+        {'orderId': 1, 'status': 'CANCELED'},
+        {'code': -2011, 'msg': 'Unknown order sent.'},
+    ]
+
+    results = connector.cancel_many('BTCUSDT', [1, 2])
+
+    assert results[0]['status'] == 'CANCELED'
+    assert results[1]['code'] == -2011
+
+
+def test_cancel_many_failed_batch_raises_after_retries(no_sleep):
+    connector = make_connector()
+    first_batch = [{'orderId': i, 'status': 'CANCELED'} for i in range(10)]
+    error = api_error(-1001, 'Internal error; unable to process your request.')
+    connector.client.futures_cancel_orders.side_effect = [first_batch] + [error] * Settings.RETRY_ATTEMPTS
+
+    with pytest.raises(BinanceAPIException):
+        connector.cancel_many('BTCUSDT', list(range(15)))
+
+    # First batch once, then every attempt of the second; nothing after it
+    assert connector.client.futures_cancel_orders.call_count == 1 + Settings.RETRY_ATTEMPTS
+
+
+def test_cancel_many_unrecoverable_error_is_not_retried():
+    connector = make_connector()
+    connector.client.futures_cancel_orders.side_effect = api_error(-1111, 'Precision is over the maximum')
+
+    with pytest.raises(BinanceAPIException):
+        connector.cancel_many('BTCUSDT', [1, 2, 3])
+
+    assert connector.client.futures_cancel_orders.call_count == 1
+
+
+def test_cancel_all_uses_one_request():
+    connector = make_connector()
+    connector.client.futures_cancel_all_open_orders.return_value = {'code': 200}
+
+    assert connector.cancel_all('BTCUSDT') == {'code': 200}
+    connector.client.futures_cancel_all_open_orders.assert_called_once_with(symbol='BTCUSDT')
+
+
+def test_create_order_timeout_retry_returns_the_placed_order(no_sleep):
+    # The first request reached Binance but its response timed out; the
+    # retry reuses the client order ID, is rejected as a duplicate, and the
+    # original order is fetched instead of a second one being opened
+    connector = make_connector()
+    placed = {'orderId': 42, 'clientOrderId': 'bot-abc', 'status': 'FILLED'}
+    connector.client.futures_create_order.side_effect = [
+        ReadTimeout('read timed out'),
+        api_error(-4116, 'ClientOrderId is duplicated.'),
+    ]
+    connector.client.futures_get_order.return_value = placed
+
+    order = connector._create_order('bot-abc', symbol='BTCUSDT', side='BUY', type='MARKET', quantity=0.001)
+
+    assert order == placed
+    assert connector.client.futures_create_order.call_count == 2
+    for call in connector.client.futures_create_order.call_args_list:
+        assert call.kwargs['newClientOrderId'] == 'bot-abc'
+    connector.client.futures_get_order.assert_called_once_with(symbol='BTCUSDT', origClientOrderId='bot-abc')
+
+
+@pytest.mark.parametrize('quantity, expected', [
+    (0.003, 0.003),               # exactly on a step
+    (0.0039999, 0.003),           # just below the next step rounds down
+    (0.30000000000000004, 0.3),   # float noise above a step
+    (0.0009, 0.0),                # below one step
+])
+def test_fmt_qty_rounds_down_to_step(quantity, expected):
+    assert _fmt_qty(Decimal('0.001'), Decimal('0.001'), quantity) == expected
+
+
+def test_fmt_qty_coarser_step_than_precision():
+    # stepSize 0.005 with 3 decimals: snap to the step, not just the decimals
+    assert _fmt_qty(Decimal('0.005'), Decimal('0.001'), 0.0149) == 0.01
+    assert _fmt_qty(Decimal('0.005'), Decimal('0.001'), 0.015) == 0.015
+
+
+def test_fmt_qty_without_step_uses_precision():
+    assert _fmt_qty(None, Decimal('0.001'), 1.23456) == 1.234
+
+
+@pytest.mark.parametrize('price, expected', [
+    (100.12, 100.12),
+    (100.125, 100.12),   # half to even
+    (100.135, 100.14),
+    (0.1 + 0.2, 0.3),
+])
+def test_fmt_price_rounds_half_even(price, expected):
+    assert _fmt_price(Decimal('0.01'), price) == expected
+
+
+def test_format_quantity_unknown_symbol_raises():
+    connector = make_connector()
+
+    with pytest.raises(KeyError):
+        connector.format_quantity('NOPEUSDT', 1.0)
+
+
+def test_check_symbol_rejects_unknown_pair():
+    connector = make_connector()
+
+    connector._check_symbol('BTCUSDT')
+    with pytest.raises(ValueError):
+        connector._check_symbol('NOPEUSDT')
+
+
+class StubResponse:
+    """Just enough of requests.Response for Client._handle_response"""
+
+    def __init__(self, payload):
+        self.status_code = 200
+        self.headers = {}
+        self.payload = payload
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self.payload
+
+
+class StubSession:
+    """Answers each futures endpoint with its own payload"""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    def get(self, uri, **kwargs):
+        return StubResponse(self.payloads[uri.rsplit('/', 1)[-1]])
+
+    def close(self):
+        pass
+
+
+class InterleavingClient(_SigningClient):
+    """
+    Holds every worker right after it stores client.response until all of
+    them have, which is the interleaving that lets the stock Client._request
+    parse another call's response.
+    """
+
+    barrier = None
+
+    @property
+    def response(self):
+        return self._last_response
+
+    @response.setter
+    def response(self, value):
+        self._last_response = value
+        if self.barrier is not None:
+            self.barrier.wait(timeout=5)
+
+
+def test_concurrent_calls_each_parse_their_own_response(monkeypatch):
+    monkeypatch.setattr(_SigningClient, 'ping', lambda self: {})
+    client = InterleavingClient('key', 'secret')
+    client.session = StubSession({
+        'balance': [{'asset': 'USDT', 'balance': '100', 'availableBalance': '90'}],
+        'klines': [[1700000000000, '1', '2', '0.5', '1.5', '10', 0, '0', 0, '0', '0', '0']],
+        'price': {'symbol': 'BTCUSDT', 'price': '50000'},
+        'positionRisk': [{'symbol': 'BTCUSDT', 'positionSide': 'BOTH', 'positionAmt': '0.01',
+                          'entryPrice': '49000', 'leverage': '5', 'marginType': 'isolated'}],
+    })
+    client.barrier = threading.Barrier(4)
+
+    connector = make_connector()
+    connector.client = client
+    connector._prices = {}
+    connector._balances_by_asset = {}
+    connector._balances_fetched_at = 0.0
+    connector._balances_live = False
+    connector._positions = {}
+    connector._positions_live = False
+    connector._positions_fetched_at = 0.0
+    connector._user_stream_ok = False
+    connector._cache_lock = threading.Lock()
+    connector._leverage_state = {}
+    connector._margin_state = {}
+
+    async def cycle():
+        return await asyncio.gather(
+            connector.a_get_balance(),
+            connector.a_get_historical_klines('BTCUSDT', '5m', limit=1),
+            connector.a_get_ticker_price('BTCUSDT'),
+            connector.a_get_open_positions('BTCUSDT'),
+        )
+
+    balance, klines, price, positions = asyncio.run(cycle())
+
+    assert balance == {'total': 100.0, 'available': 90.0}
+    assert klines.shape == (1, 6) and klines[0, 4] == 1.5
+    assert price == 50000.0
+    assert positions['BTCUSDT']['positionAmt'] == 0.01
+
+
+def test_orjson_decoder_is_scoped_to_the_connector_sockets():
+    pytest.importorskip('orjson')
+    client = MagicMock(tld='com', testnet=True)
+    frame = '{"e":"markPriceUpdate","s":"BTCUSDT","p":"50000.1"}'
+
+    ours = _OrjsonSocketManager(client)._get_socket('btcusdt@markPrice')
+    stock = BinanceSocketManager(client)._get_socket('btcusdt@markPrice')
+
+    assert ours._handle_message(frame) == {'e': 'markPriceUpdate', 's': 'BTCUSDT', 'p': '50000.1'}
+    assert ours._handle_message('not json') is None  # falls back to the stock parser
+    assert ours._handle_message.__func__ is not ReconnectingWebsocket._handle_message
+    # Sockets from any other manager are left alone
+    assert stock._handle_message.__func__ is ReconnectingWebsocket._handle_message
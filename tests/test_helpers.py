@@ -0,0 +1,110 @@
+"""
+Tests for the retry helpers.
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils import helpers
+from src.utils.helpers import (
+    _next_retry_delay,
+    async_retry_on_exception,
+    retry_on_exception,
+)
+
+
+class RateLimited(Exception):
+    """API error carrying a response with headers, like BinanceAPIException"""
+
+    def __init__(self, retry_after=None):
+        super().__init__('rate limited')
+        headers = {} if retry_after is None else {'Retry-After': str(retry_after)}
+        self.response = SimpleNamespace(headers=headers)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry waits instead of sleeping"""
+    waits = []
+    monkeypatch.setattr(helpers.time, 'sleep', waits.append)
+    return waits
+
+
+def test_jitter_stays_within_bounds():
+    random.seed(0)
+    previous = 1.0
+    for _ in range(1000):
+        wait = _next_retry_delay(RateLimited(), 1.0, previous, 3.0, 30.0)
+        assert 1.0 <= wait <= min(30.0, previous * 3.0)
+        previous = wait
+
+
+def test_retry_after_overrides_jitter():
+    assert _next_retry_delay(RateLimited(retry_after=7), 1.0, 1.0, 3.0, 30.0) == 7.0
+
+
+def test_retry_after_beyond_max_delay_is_not_waited_for():
+    assert _next_retry_delay(RateLimited(retry_after=7200), 1.0, 1.0, 3.0, 30.0) is None
+
+
+def test_unparseable_retry_after_falls_back_to_jitter():
+    exc = RateLimited()
+    exc.response.headers['Retry-After'] = 'soon'
+    assert 1.0 <= _next_retry_delay(exc, 1.0, 1.0, 3.0, 30.0) <= 3.0
+
+
+def test_retry_waits_for_retry_after(sleeps):
+    calls = []
+
+    @retry_on_exception(max_attempts=3, exceptions=(RateLimited,), max_delay=30.0)
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RateLimited(retry_after=2)
+        return 'ok'
+
+    assert flaky() == 'ok'
+    assert sleeps == [2.0, 2.0]
+
+
+def test_retry_gives_up_on_long_retry_after(sleeps):
+    calls = []
+
+    @retry_on_exception(max_attempts=5, exceptions=(RateLimited,), max_delay=30.0)
+    def banned():
+        calls.append(1)
+        raise RateLimited(retry_after=7200)
+
+    with pytest.raises(RateLimited):
+        banned()
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_async_retry_gives_up_on_long_retry_after(monkeypatch):
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(helpers.asyncio, 'sleep', fake_sleep)
+    calls = []
+
+    @async_retry_on_exception(max_attempts=5, exceptions=(RateLimited,), max_delay=30.0)
+    async def banned():
+        calls.append(1)
+        raise RateLimited(retry_after=7200)
+
+    with pytest.raises(RateLimited):
+        asyncio.run(banned())
+    assert len(calls) == 1
+    assert waits == []
@@ -0,0 +1,76 @@
+"""
+Tests for the P/L kernels (run as plain Python when numba is missing).
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.pnl_kernels import batch_pnl, price_level_hits
+
+
+def arrays(*values):
+    return [np.array(v, dtype=np.float64) for v in values]
+
+
+def test_batch_pnl_long_and_short():
+    entries, qtys, directions = arrays([100.0, 100.0], [2.0, 1.0], [1.0, -1.0])
+
+    pnl = batch_pnl(entries, qtys, directions, 110.0)
+
+    assert list(pnl) == [20.0, -10.0]
+
+
+def test_price_level_hits_matches_should_exit_levels():
+    # LONG stop, LONG target, SHORT stop, SHORT target, LONG between levels
+    entries, directions, stops, targets = arrays(
+        [100.0, 100.0, 100.0, 100.0, 100.0],
+        [1.0, 1.0, -1.0, -1.0, 1.0],
+        [99.0, 90.0, 101.0, 110.0, 95.0],
+        [110.0, 100.0, 90.0, 100.0, 105.0],
+    )
+
+    hits = price_level_hits(entries, directions, stops, targets, 99.0)
+    assert list(hits) == [True, False, False, True, False]
+
+    hits = price_level_hits(entries, directions, stops, targets, 101.0)
+    assert list(hits) == [False, True, True, False, False]
+
+
+def test_price_level_hits_skips_incomplete_positions():
+    # Only the first position has all of entry, stop and target set
+    entries, directions, stops, targets = arrays(
+        [100.0, 100.0, 100.0, 0.0],
+        [1.0, 1.0, 1.0, 1.0],
+        [99.0, 99.0, 0.0, 99.0],
+        [101.0, 0.0, 101.0, 101.0],
+    )
+
+    hits = price_level_hits(entries, directions, stops, targets, 50.0)
+
+    assert list(hits) == [True, False, False, False]
+
+
+def test_kernels_compile_with_numba():
+    # The eager signatures are only checked when numba compiles them; the
+    # tests above run the plain Python fallback where numba is missing
+    pytest.importorskip('numba')
+    from src.core import pnl_kernels
+
+    assert pnl_kernels.batch_pnl.nopython_signatures
+    assert pnl_kernels.price_level_hits.nopython_signatures
+
+    entries, qtys, directions, stops, targets = arrays(
+        [100.0, 100.0, 0.0], [2.0, 1.0, 1.0], [1.0, -1.0, 1.0], [99.0, 101.0, 99.0], [110.0, 90.0, 0.0]
+    )
+    pnl = pnl_kernels.batch_pnl(entries, qtys, directions, 110.0)
+    hits = pnl_kernels.price_level_hits(entries, directions, stops, targets, 110.0)
+
+    assert pnl.dtype == np.float64 and list(pnl) == [20.0, -10.0, 110.0]
+    assert hits.dtype == np.bool_ and list(hits) == [True, True, False]
@@ -0,0 +1,100 @@
+"""
+Tests for the column-wise position book.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.position import Position, PositionBook
+
+
+def make_position(side: str, entry_price: float, quantity: float = 0.01) -> Position:
+    direction = 1.0 if side == 'LONG' else -1.0
+    return Position(side, direction, entry_price, quantity,
+                    stop_loss=entry_price * 0.99, take_profit=entry_price * 1.01)
+
+
+def test_position_close_side():
+    assert make_position('LONG', 100.0).close_side == 'SELL'
+    assert make_position('SHORT', 100.0).close_side == 'BUY'
+
+
+def test_add_grows_arrays_and_keeps_slots():
+    book = PositionBook(capacity=1)
+    positions = [make_position('LONG', 100.0 + i, quantity=i + 1) for i in range(5)]
+    for position in positions:
+        book.add(position)
+
+    assert len(book) == 5
+    assert book.entry_price.shape[0] >= 5
+    assert list(book) == positions
+    assert book[2] is positions[2]
+    assert list(book.entry_price[:5]) == [100.0, 101.0, 102.0, 103.0, 104.0]
+    assert list(book.quantity[:5]) == [1, 2, 3, 4, 5]
+    assert list(book.take_profit[:5]) == [p.take_profit for p in positions]
+
+
+def test_remove_moves_last_into_freed_slot():
+    book = PositionBook()
+    a, b, c = make_position('LONG', 100.0), make_position('SHORT', 200.0), make_position('LONG', 300.0)
+    for position in (a, b, c):
+        book.add(position)
+    version = book.version
+
+    assert book.remove(a)
+
+    assert len(book) == 2
+    assert list(book) == [c, b]
+    assert list(book.entry_price[:2]) == [300.0, 200.0]
+    assert list(book.direction[:2]) == [1.0, -1.0]
+    assert list(book.stop_loss[:2]) == [c.stop_loss, b.stop_loss]
+    assert book.version > version
+    assert book.find('LONG', 100.0) is None
+
+
+def test_remove_untracked_position_is_noop():
+    book = PositionBook()
+    book.add(make_position('LONG', 100.0))
+
+    # Same side and price, but a different record
+    assert not book.remove(make_position('LONG', 100.0))
+    assert not book.remove(make_position('SHORT', 100.0))
+    assert len(book) == 1
+
+
+def test_find_tolerates_float_noise():
+    book = PositionBook()
+    position = make_position('LONG', 0.1 + 0.2)
+    book.add(position)
+
+    assert book.find('LONG', 0.3) is position
+    assert book.find('SHORT', 0.3) is None
+    assert book.find('LONG', 0.31) is None
+
+
+def test_find_after_removing_one_of_two_at_same_price():
+    book = PositionBook()
+    first, second = make_position('LONG', 100.0), make_position('LONG', 100.0)
+    book.add(first)
+    book.add(second)
+
+    book.remove(second)
+
+    assert book.find('LONG', 100.0) is first
+    book.remove(first)
+    assert book.find('LONG', 100.0) is None
+
+
+def test_clear():
+    book = PositionBook()
+    book.add(make_position('LONG', 100.0))
+
+    book.clear()
+
+    assert len(book) == 0
+    assert list(book) == []
+    assert book.find('LONG', 100.0) is None
@@ -0,0 +1,53 @@
+"""
+Tests for position sizing.
+"""
+
+import itertools
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.settings import Settings
+from src.risk.position_manager import PositionManager
+
+
+def make_manager() -> PositionManager:
+    """PositionManager with logging stubbed out (the grid logs hundreds of lines)"""
+    manager = PositionManager()
+    manager.logger = MagicMock()
+    return manager
+
+
+def test_vectorized_sizes_match_scalar():
+    manager = make_manager()
+    # Includes invalid candidates (zero capital/price, stop at entry,
+    # leverage out of range) and ones below the 0.001 minimum
+    capitals = [0.0, 50.0, 100.0, 12345.67]
+    entries = [0.0, 0.5, 1850.25, 50000.0]
+    stops = [0.0, 0.49, 1840.0, 49750.0, 50000.0, 50250.0]
+    leverages = [0, 1, Settings.MAX_LEVERAGE, Settings.MAX_LEVERAGE + 1]
+    grid = list(itertools.product(capitals, entries, stops, leverages))
+
+    expected = [manager.calculate_position_size(*args) for args in grid]
+    capital, entry, stop, leverage = (np.array(column, dtype=np.float64) for column in zip(*grid))
+    sizes = manager.calculate_position_sizes(capital, entry, stop, leverage)
+
+    assert sizes.tolist() == expected
+
+
+def test_vectorized_sizes_broadcast_scalars():
+    manager = make_manager()
+    stops = np.array([49750.0, 49000.0, 50500.0])
+
+    sizes = manager.calculate_position_sizes(1000.0, 50000.0, stops, Settings.MAX_LEVERAGE)
+
+    assert sizes.tolist() == [
+        manager.calculate_position_size(1000.0, 50000.0, stop, Settings.MAX_LEVERAGE)
+        for stop in stops
+    ]